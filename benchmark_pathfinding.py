@@ -0,0 +1,504 @@
+"""
+Benchmark de pathfinding sobre todos os mapas de assets/maps.
+
+Para cada mapa sorteia pares início/objetivo entre células livres (semente
+fixa) e mede cada backend de pathfinding com cada heurística: consultas por
+segundo, latência média e p99, nós expandidos e otimalidade do caminho
+(comparado com a distância exata da tabela de caminhos).
+
+O replanejamento é medido à parte, no padrão em que o jogo o usa: um alvo
+anda célula a célula (passeio aleatório) e um fantasma o persegue, avançando
+uma célula por replanejamento. Cada replanejamento é feito pelo
+IncrementalAStar do fantasma ("replan-incremental") e por uma busca nova do
+GridAStar ("replan-scratch"), sobre a mesma trajetória.
+
+Também confere o GridAStar contra o AStar.find_path com o início fora do
+centro da célula, como os fantasmas ficam entre ticks: em múltiplos de meio
+pixel (passos de 1.5 px) e em frações quaisquer. Os caminhos devem ter sempre
+o mesmo comprimento; só o desempate entre caminhos de mesmo custo pode mudar.
+
+Uso:
+    python benchmark_pathfinding.py [--pairs N] [--chases N] [--chase-length N]
+                                    [--fractional-starts N] [--seed S]
+                                    [--output arquivo.json]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from src.map import Map
+from src.pathfinding import IncrementalAStar
+from src.utils import AStar, Direction, Vector2D
+
+HEURISTICS = ("manhattan", "euclidean", "diagonal")
+DEFAULT_OUTPUT = os.path.join("cache", "benchmarks", "pathfinding.json")
+
+
+class _AStarBackend:
+    """AStar.find_path original (posições em pixels e Map.is_valid_position)"""
+    name = "astar"
+    heuristics = HEURISTICS
+
+    def __init__(self, game_map):
+        self._map = game_map
+
+    def find_path(self, start_cell, goal_cell, heuristic):
+        path = AStar.find_path(self._map.get_cell_center(*start_cell),
+                               self._map.get_cell_center(*goal_cell), self._map, heuristic)
+        return len(path) - 1 if path else None
+
+    def count_expanded(self, start_cell, goal_cell, heuristic):
+        """
+        O AStar não conta expansões: conta as chamadas a get_neighbors, feitas
+        uma vez por nó expandido, numa execução separada da medição de tempo.
+        """
+        original = AStar.get_neighbors
+        calls = [0]
+
+        def counting_neighbors(position, cell_size=16):
+            calls[0] += 1
+            return original(position, cell_size)
+
+        AStar.get_neighbors = staticmethod(counting_neighbors)
+        try:
+            self.find_path(start_cell, goal_cell, heuristic)
+        finally:
+            AStar.get_neighbors = staticmethod(original)
+        return calls[0]
+
+
+class _GridBackend:
+    """GridAStar: A* célula a célula com máscaras de colisão"""
+    name = "grid"
+    heuristics = HEURISTICS
+
+    def __init__(self, game_map):
+        self._map = game_map
+        self._engine = game_map.pathfinder
+
+    def find_path(self, start_cell, goal_cell, heuristic):
+        path = self._engine.find_path(self._map.get_cell_center(*start_cell),
+                                      self._map.get_cell_center(*goal_cell), heuristic)
+        return len(path) - 1 if path else None
+
+    def count_expanded(self, start_cell, goal_cell, heuristic):
+        return self._engine.nodes_expanded
+
+
+class _GraphBackend:
+    """JunctionGraph: A* sobre cruzamentos e corredores"""
+    name = "graph"
+    heuristics = HEURISTICS
+
+    def __init__(self, game_map):
+        self._engine = game_map.junction_graph
+
+    def find_path(self, start_cell, goal_cell, heuristic):
+        path = self._engine.find_path(start_cell, goal_cell, heuristic)
+        return len(path) - 1 if path else None
+
+    def count_expanded(self, start_cell, goal_cell, heuristic):
+        return self._engine.nodes_expanded
+
+
+class _TableBackend:
+    """PathTable: caminho reconstruído passo a passo pela tabela, sem busca"""
+    name = "table"
+    heuristics = (None,)
+
+    def __init__(self, game_map):
+        self._table = game_map.path_table
+
+    def find_path(self, start_cell, goal_cell, heuristic):
+        if self._table.distance(start_cell, goal_cell) is None:
+            return None
+        steps = 0
+        col, row = start_cell
+        while (col, row) != goal_cell:
+            direction = self._table.next_direction((col, row), goal_cell)
+            if direction == Direction.NONE:
+                return None
+            col += direction.value[0]
+            row += direction.value[1]
+            steps += 1
+        return steps
+
+    def count_expanded(self, start_cell, goal_cell, heuristic):
+        return 0
+
+
+BACKENDS = (_AStarBackend, _GridBackend, _GraphBackend, _TableBackend)
+
+
+def sample_pairs(game_map, count, rng):
+    """Sorteia pares (início, objetivo) de células livres"""
+    width = game_map.width
+    walkable = game_map.walkable
+    cells = [(index % width, index // width) for index in range(len(walkable)) if walkable[index]]
+    return [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+
+
+def sample_fractional_starts(game_map, count, rng, step=None):
+    """
+    Sorteia pares (início em pixels, objetivo no centro de uma célula) com o
+    início deslocado até 4 px do centro, numa posição válida para um fantasma.
+
+    Args:
+        step: Deslocamentos múltiplos de step (ex.: 0.5); None sorteia frações quaisquer
+    """
+    width = game_map.width
+    walkable = game_map.walkable
+    cells = [(index % width, index // width) for index in range(len(walkable)) if walkable[index]]
+
+    def offset():
+        if step is None:
+            return rng.uniform(-4, 4)
+        return rng.randint(-int(4 / step), int(4 / step)) * step
+
+    samples = []
+    for _ in range(count * 20):
+        if len(samples) == count:
+            break
+        start_col, start_row = rng.choice(cells)
+        center = game_map.get_cell_center(start_col, start_row)
+        start = center + Vector2D(offset(), offset())
+        if game_map.is_valid_position(start, 16, "ghost"):
+            samples.append((start, game_map.get_cell_center(*rng.choice(cells))))
+    return samples
+
+
+def compare_with_astar(game_map, samples):
+    """
+    Compara os caminhos de células do GridAStar com os do AStar.find_path.
+
+    Returns:
+        dict: identical (mesmas células), same_length (mesmo comprimento,
+        outro desempate), length_mismatch e found_mismatch
+    """
+    counts = {"queries": len(samples), "identical": 0, "same_length": 0,
+              "length_mismatch": 0, "found_mismatch": 0}
+    for start, goal in samples:
+        expected = [game_map.get_cell(position) for position in AStar.find_path(start, goal, game_map)]
+        path = game_map.pathfinder.find_path(start, goal)
+        if path == expected:
+            counts["identical"] += 1
+        elif bool(path) != bool(expected):
+            counts["found_mismatch"] += 1
+        elif len(path) == len(expected):
+            counts["same_length"] += 1
+        else:
+            counts["length_mismatch"] += 1
+    return counts
+
+
+def sample_chases(game_map, count, length, rng):
+    """
+    Sorteia perseguições: célula inicial do fantasma e trajetória do alvo,
+    um passeio aleatório que anda (ou para) uma célula por passo.
+    """
+    width = game_map.width
+    walkable = game_map.walkable
+    cells = [(index % width, index // width) for index in range(len(walkable)) if walkable[index]]
+    chases = []
+    for _ in range(count):
+        ghost = rng.choice(cells)
+        target = rng.choice(cells)
+        trajectory = [target]
+        for _ in range(length - 1):
+            col, row = target
+            moves = [target] + [(col + dc, row + dr) for dc, dr in ((0, -1), (0, 1), (-1, 0), (1, 0))
+                                if 0 <= col + dc < width and 0 <= row + dr < game_map.height
+                                and walkable[(row + dr) * width + col + dc]]
+            target = rng.choice(moves)
+            trajectory.append(target)
+        chases.append((ghost, trajectory))
+    return chases
+
+
+def run_replanning(kind, game_map, chases):
+    """
+    Mede os replanejamentos de uma perseguição com alvo em movimento.
+
+    O fantasma avança pela rota da tabela de caminhos (igual para os dois
+    modos), então "incremental" e "scratch" resolvem as mesmas consultas.
+
+    Args:
+        kind: "incremental" (um IncrementalAStar por fantasma) ou "scratch"
+            (GridAStar sem cache a cada replanejamento)
+
+    Returns:
+        dict: Métricas no formato de run_backend
+    """
+    table = game_map.path_table
+    grid = game_map.pathfinder
+    latencies = []
+    expanded = []
+    found = 0
+    optimal = 0
+    missed = 0
+    extra_steps = 0
+
+    for ghost, trajectory in chases:
+        engine = IncrementalAStar(game_map) if kind == "incremental" else None
+        for target in trajectory:
+            start_time = time.perf_counter()
+            if engine is not None:
+                path = engine.find_path(ghost, target)
+            else:
+                path = grid.find_path(game_map.get_cell_center(*ghost), game_map.get_cell_center(*target))
+            latencies.append(time.perf_counter() - start_time)
+            expanded.append(engine.nodes_expanded if engine is not None else grid.nodes_expanded)
+
+            shortest = table.distance(ghost, target)
+            if not path:
+                if shortest is not None:
+                    missed += 1
+            else:
+                found += 1
+                if len(path) - 1 == shortest:
+                    optimal += 1
+                elif shortest is not None:
+                    extra_steps += len(path) - 1 - shortest
+
+            direction = table.next_direction(ghost, target)
+            if direction != Direction.NONE:
+                ghost = (ghost[0] + direction.value[0], ghost[1] + direction.value[1])
+
+    total_time = sum(latencies)
+    latencies.sort()
+    queries = len(latencies)
+    return {
+        "backend": f"replan-{kind}",
+        "heuristic": "manhattan",
+        "queries": queries,
+        "queries_per_sec": queries / total_time if total_time else 0.0,
+        "mean_ms": total_time / queries * 1000 if queries else 0.0,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "nodes_expanded_mean": sum(expanded) / len(expanded) if expanded else 0.0,
+        "found": found,
+        "missed": missed,
+        "optimal": optimal,
+        "optimal_rate": optimal / found if found else 1.0,
+        "extra_steps": extra_steps
+    }
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def run_backend(backend, game_map, pairs, heuristic):
+    """
+    Executa todas as consultas de um backend com uma heurística.
+
+    Returns:
+        dict: Métricas agregadas do backend no mapa
+    """
+    table = game_map.path_table
+    latencies = []
+    expanded = []
+    found = 0
+    optimal = 0
+    missed = 0
+    extra_steps = 0
+
+    for start_cell, goal_cell in pairs:
+        start_time = time.perf_counter()
+        length = backend.find_path(start_cell, goal_cell, heuristic)
+        latencies.append(time.perf_counter() - start_time)
+        expanded.append(backend.count_expanded(start_cell, goal_cell, heuristic))
+
+        shortest = table.distance(start_cell, goal_cell)
+        if length is None:
+            if shortest is not None:
+                missed += 1
+            continue
+        found += 1
+        if length == shortest:
+            optimal += 1
+        elif shortest is not None:
+            extra_steps += length - shortest
+
+    total_time = sum(latencies)
+    latencies.sort()
+    return {
+        "backend": backend.name,
+        "heuristic": heuristic,
+        "queries": len(pairs),
+        "queries_per_sec": len(pairs) / total_time if total_time else 0.0,
+        "mean_ms": total_time / len(pairs) * 1000 if pairs else 0.0,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "nodes_expanded_mean": sum(expanded) / len(expanded) if expanded else 0.0,
+        "found": found,
+        "missed": missed,
+        "optimal": optimal,
+        "optimal_rate": optimal / found if found else 1.0,
+        "extra_steps": extra_steps
+    }
+
+
+def benchmark_map(map_info, pair_count, seed, chase_count=20, chase_length=50, fractional_count=120):
+    """Roda todos os backends e heurísticas num mapa, os replanejamentos e a conferência com o AStar"""
+    game_map = Map(map_file_path=map_info["file_path"])
+    rng = random.Random(seed)
+    pairs = sample_pairs(game_map, pair_count, rng)
+    chases = sample_chases(game_map, chase_count, chase_length, rng)
+    half_pixel_starts = sample_fractional_starts(game_map, fractional_count, rng, step=0.5)
+    arbitrary_starts = sample_fractional_starts(game_map, fractional_count, rng)
+    reachable = sum(1 for start, goal in pairs if game_map.path_table.distance(start, goal) is not None)
+
+    results = []
+    for backend_class in BACKENDS:
+        # Inclui no setup estruturas criadas sob demanda na primeira consulta
+        setup_start = time.perf_counter()
+        backend = backend_class(game_map)
+        if pairs:
+            backend.find_path(pairs[0][0], pairs[0][1], backend.heuristics[0])
+        setup_ms = (time.perf_counter() - setup_start) * 1000
+        for heuristic in backend.heuristics:
+            result = run_backend(backend, game_map, pairs, heuristic)
+            result["setup_ms"] = setup_ms
+            results.append(result)
+
+    for kind in ("incremental", "scratch"):
+        result = run_replanning(kind, game_map, chases)
+        result["setup_ms"] = 0.0
+        results.append(result)
+
+    return {
+        "map": map_info["name"],
+        "file": map_info["file_path"],
+        "difficulty": map_info["difficulty"],
+        "walkable_cells": sum(game_map.walkable),
+        "pairs": len(pairs),
+        "reachable_pairs": reachable,
+        "chases": len(chases),
+        "chase_length": chase_length,
+        "results": results,
+        "grid_vs_astar": {
+            "half_pixel": compare_with_astar(game_map, half_pixel_starts),
+            "arbitrary": compare_with_astar(game_map, arbitrary_starts)
+        }
+    }
+
+
+def summarize(map_reports):
+    """Agrega os resultados de todos os mapas por backend e heurística"""
+    groups = {}
+    for report in map_reports:
+        for result in report["results"]:
+            groups.setdefault((result["backend"], result["heuristic"]), []).append(result)
+
+    summary = []
+    for (backend, heuristic), results in groups.items():
+        queries = sum(r["queries"] for r in results)
+        total_ms = sum(r["mean_ms"] * r["queries"] for r in results)
+        found = sum(r["found"] for r in results)
+        summary.append({
+            "backend": backend,
+            "heuristic": heuristic,
+            "queries": queries,
+            "queries_per_sec": queries / (total_ms / 1000) if total_ms else 0.0,
+            "mean_ms": total_ms / queries if queries else 0.0,
+            "p99_ms_max": max(r["p99_ms"] for r in results),
+            "nodes_expanded_mean": sum(r["nodes_expanded_mean"] * r["queries"] for r in results) / queries,
+            "found": found,
+            "missed": sum(r["missed"] for r in results),
+            "optimal_rate": sum(r["optimal"] for r in results) / found if found else 1.0
+        })
+    return summary
+
+
+def summarize_equivalence(map_reports):
+    """Soma as conferências GridAStar x AStar de todos os mapas"""
+    totals = {}
+    for report in map_reports:
+        for kind, counts in report["grid_vs_astar"].items():
+            total = totals.setdefault(kind, dict.fromkeys(counts, 0))
+            for key, value in counts.items():
+                total[key] += value
+    return totals
+
+
+def print_summary(summary):
+    print()
+    print(f"{'backend':<20} {'heurística':<10} {'consultas/s':>12} {'média ms':>9} {'p99 ms':>8} "
+          f"{'nós':>8} {'ótimos':>7}")
+    for row in summary:
+        print(f"{row['backend']:<20} {row['heuristic'] or '-':<10} {row['queries_per_sec']:>12.0f} "
+              f"{row['mean_ms']:>9.3f} {row['p99_ms_max']:>8.3f} {row['nodes_expanded_mean']:>8.1f} "
+              f"{row['optimal_rate']:>7.1%}")
+
+
+def print_equivalence(totals):
+    print()
+    print("GridAStar x AStar com início fora do centro da célula:")
+    for kind, counts in totals.items():
+        print(f"  {kind:<11} {counts['queries']} consultas: {counts['identical']} idênticas, "
+              f"{counts['same_length']} de mesmo comprimento (outro desempate), "
+              f"{counts['length_mismatch']} de comprimento diferente, "
+              f"{counts['found_mismatch']} encontradas só por um")
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark de pathfinding nos mapas de assets/maps")
+    parser.add_argument("--pairs", type=int, default=200, help="pares início/objetivo por mapa")
+    parser.add_argument("--chases", type=int, default=20, help="perseguições (replanejamento) por mapa")
+    parser.add_argument("--chase-length", type=int, default=50, help="replanejamentos por perseguição")
+    parser.add_argument("--fractional-starts", type=int, default=120,
+                        help="inícios fora do centro por mapa e tipo, conferidos contra o AStar")
+    parser.add_argument("--seed", type=int, default=0, help="semente do sorteio dos pares")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="arquivo JSON de saída")
+    args = parser.parse_args()
+
+    maps = Map.get_available_maps()
+    if not maps:
+        print("Erro: nenhum mapa encontrado em assets/maps")
+        return 1
+
+    map_reports = []
+    for map_info in maps:
+        print(f"Medindo {map_info['name']} ({map_info['file_path']})...")
+        map_reports.append(benchmark_map(map_info, args.pairs, args.seed, args.chases, args.chase_length,
+                                         args.fractional_starts))
+
+    summary = summarize(map_reports)
+    print_summary(summary)
+    equivalence = summarize_equivalence(map_reports)
+    print_equivalence(equivalence)
+
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "pairs_per_map": args.pairs,
+        "chases_per_map": args.chases,
+        "chase_length": args.chase_length,
+        "fractional_starts_per_map": args.fractional_starts,
+        "maps": map_reports,
+        "summary": summary,
+        "grid_vs_astar": equivalence
+    }
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nResultados salvos em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Compila os mapas JSON para o formato binário lido pelo jogo.
+
+O JSON continua sendo o formato de origem; o jogo usa o arquivo compilado
+(em cache/maps) sempre que ele estiver atualizado em relação ao JSON.
+
+Uso:
+    python compile_maps.py [mapa.json ...] [--force]
+"""
+import argparse
+import glob
+import os
+import sys
+
+from src.map_format import CompiledMap
+
+DEFAULT_PATTERN = os.path.join("assets", "maps", "*.json")
+
+
+def compile_map(source_path, force):
+    """
+    Compila um mapa, a não ser que a versão compilada já esteja atualizada.
+
+    Returns:
+        str: "compilado", "atualizado" ou "erro"
+    """
+    if not force and CompiledMap.load_for(source_path) is not None:
+        print(f"  {source_path}: atualizado")
+        return "atualizado"
+    try:
+        output_path = CompiledMap.compile(source_path)
+    except (OSError, ValueError) as e:
+        # json.JSONDecodeError é subclasse de ValueError
+        print(f"  {source_path}: erro - {e}")
+        return "erro"
+    print(f"  {source_path}: {os.path.getsize(source_path)} -> {os.path.getsize(output_path)} bytes "
+          f"({output_path})")
+    return "compilado"
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Compila mapas JSON para o formato binário")
+    parser.add_argument("maps", nargs="*", help=f"arquivos JSON (padrão: {DEFAULT_PATTERN})")
+    parser.add_argument("--force", action="store_true", help="recompila mesmo os mapas atualizados")
+    args = parser.parse_args()
+
+    sources = args.maps or sorted(glob.glob(DEFAULT_PATTERN))
+    if not sources:
+        print("Erro: nenhum mapa encontrado")
+        return 1
+
+    print(f"Compilando {len(sources)} mapa(s)...")
+    results = [compile_map(source, args.force) for source in sources]
+    print(f"{results.count('compilado')} compilado(s), {results.count('atualizado')} atualizado(s), "
+          f"{results.count('erro')} com erro")
+    return 1 if "erro" in results else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
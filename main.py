@@ -1,11 +1,20 @@
 import pygame
 import sys
 import json
+import math
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from src.game_objects import Player, Ghost, Pellet
 from src.map import Map
+from src.map_catalog import MapCatalog
+from src.pellet_layer import PelletLayer
+from src.text_cache import TextCache
+from src.surface_counter import SurfaceAllocationCounter
+from src.pathfinding import FlowField, PathfindingScheduler
 from src.utils import Vector2D, Direction, GameState
-from src.sprite_manager import sprite_manager
+from src.sprite_manager import sprite_manager, ANIMATION_FPS
 from src.sound_manager import sound_manager, SoundType
 
 class HighScoreManager:
@@ -32,9 +41,26 @@ class HighScoreManager:
         self.save_highscores()
 
 class Game:
-    def __init__(self, width=560, height=400):
+    # Escalas com fontes guardadas (redimensionar a janela e voltar não recria as fontes)
+    FONT_CACHE_SIZE = 4
+    # Limites do laço de passo fixo: ticks por quadro e tempo de quadro
+    # considerado (acima disso a simulação desacelera em vez de acumular atraso)
+    MAX_TICKS_PER_FRAME = 5
+    MAX_FRAME_TIME = 0.25
+
+    def __init__(self, width=560, height=400, ai_budget_ms=1.0, dirty_rendering=False,
+                 scale_step=0.25, resize_debounce_ms=200, debug_surfaces=False,
+                 native_rendering=False, present_filter="nearest", tick_rate=60, max_fps=60,
+                 ghost_planner="table", ghost_replanning="incremental"):
         pygame.init()
         
+        # Contagem de superfícies criadas por quadro (depuração): em PLAYING
+        # nenhum quadro deve alocar, exceto após mudança de nível ou escala
+        self._surface_counter = None
+        if debug_surfaces:
+            self._surface_counter = SurfaceAllocationCounter()
+            self._surface_counter.install()
+        
         try:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
             print("Mixer do Pygame inicializado no Game")
@@ -52,16 +78,47 @@ class Game:
         self._map_height = 336
         self._hud_y_start = self._map_height + 5
         
-        # Fator de escala global
+        # Fator de escala global, arredondado para baixo em múltiplos de
+        # scale_step (None desativa), e redimensionamento aplicado só depois
+        # de resize_debounce_ms sem novos eventos
         self._scale_factor = 1.0
+        self._scale_step = scale_step
+        self._resize_debounce_ms = resize_debounce_ms
+        self._pending_resize = None
         
-        # Configuração da janela
-        self._screen = pygame.display.set_mode((self._width, self._height), pygame.RESIZABLE)
+        # Configuração da janela. Com native_rendering o jogo desenha sempre em
+        # width x height numa superfície fora da tela (escala 1.0) e cada
+        # quadro é apresentado na janela com uma única ampliação:
+        # present_filter "nearest" usa o maior fator inteiro que cabe e
+        # "smooth" usa smoothscale até preencher a janela. Só a escala fica
+        # fixa: o desenho continua passando por _get_scaled_pos/scale_factor
+        # (multiplicando por 1.0) e pelos caches por escala de atlas, fontes e
+        # camadas, que ficam com uma única entrada
+        self._present_filter = present_filter
+        self._window = None
+        self._present_rect = None
+        self._present_target = None
+        self._present_factor = None
+        if native_rendering:
+            self._window = pygame.display.set_mode((self._width, self._height), pygame.RESIZABLE)
+            self._screen = pygame.Surface((self._width, self._height)).convert()
+            self._update_presentation(self._width, self._height)
+        else:
+            self._screen = pygame.display.set_mode((self._width, self._height), pygame.RESIZABLE)
         pygame.display.set_caption("Pac-Man OO - Projeto Orientado a Objetos")
         self._clock = pygame.time.Clock()
         self._state = GameState.MENU
         
-        # Fonts com escala
+        # Simulação em passo fixo (tick_rate ticks por segundo), independente
+        # da taxa de quadros (max_fps, 0 sem limite); o desenho interpola as
+        # posições entre os dois últimos ticks
+        self._tick_delta = 1.0 / tick_rate
+        self._max_fps = max_fps
+        self._accumulator = 0.0
+        
+        # Fonts com escala (textos renderizados ficam em cache por fonte)
+        self._text_cache = TextCache()
+        self._fonts = OrderedDict()
         self._update_fonts()
         
         self._initialize_sound_system()
@@ -89,33 +146,157 @@ class Game:
         self._intermission_timer = 0
         self._intermission_duration = 3000
         self._next_map_info = None
+        self._skip_intermission = False
+        
+        # Próximo mapa preparado numa thread durante a intermissão
+        self._level_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-loader")
+        self._prefetch = None
+        
+        # Orçamento por frame para o replanejamento dos fantasmas
+        self._ai_scheduler = PathfindingScheduler(budget_ms=ai_budget_ms)
+        
+        # Motor de pathfinding dos fantasmas (Ghost.PLANNERS e Ghost.REPLANNING_MODES)
+        if ghost_planner not in Ghost.PLANNERS:
+            raise ValueError(f"Planejador inválido: {ghost_planner}")
+        if ghost_replanning not in Ghost.REPLANNING_MODES:
+            raise ValueError(f"Modo de replanejamento inválido: {ghost_replanning}")
+        self._ghost_planner = ghost_planner
+        self._ghost_replanning = ghost_replanning
+        
+        # Renderização por retângulos sujos no estado PLAYING (opcional)
+        self._dirty_rendering = dirty_rendering
+        self._background = None
+        self._needs_full_redraw = True
+        self._last_render_state = None
+        self._actor_rects = []
+        self._hud_signature = None
+        self._pause_overlay = None
         
         self._initialize_campaign()
         self._initialize_game()
 
     def _update_fonts(self):
-        """Atualiza os tamanhos das fontes baseado na escala"""
-        base_large = 48
-        base_medium = 32
-        base_small = 24
-        base_tiny = 22
+        """Atualiza os tamanhos das fontes baseado na escala (cache LRU por escala)"""
+        fonts = self._fonts.get(self._scale_factor)
+        if fonts is None:
+            base_large = 48
+            base_medium = 32
+            base_small = 24
+            base_tiny = 22
+            
+            fonts = (
+                pygame.font.Font(None, max(12, int(base_large * self._scale_factor))),
+                pygame.font.Font(None, max(10, int(base_medium * self._scale_factor))),
+                pygame.font.Font(None, max(8, int(base_small * self._scale_factor))),
+                pygame.font.Font(None, max(6, int(base_tiny * self._scale_factor)))
+            )
+            self._fonts[self._scale_factor] = fonts
+            if len(self._fonts) > self.FONT_CACHE_SIZE:
+                # Os textos das fontes descartadas as manteriam vivas pelas chaves
+                _, evicted = self._fonts.popitem(last=False)
+                self._text_cache.discard_fonts(evicted)
+        else:
+            self._fonts.move_to_end(self._scale_factor)
         
-        self._font_large = pygame.font.Font(None, max(12, int(base_large * self._scale_factor)))
-        self._font_medium = pygame.font.Font(None, max(10, int(base_medium * self._scale_factor)))
-        self._font_small = pygame.font.Font(None, max(8, int(base_small * self._scale_factor)))
-        self._font_tiny = pygame.font.Font(None, max(6, int(base_tiny * self._scale_factor)))
+        # O cache de textos é indexado pela fonte: textos de fontes de outras
+        # escalas guardadas continuam válidos para quando a escala voltar
+        self._font_large, self._font_medium, self._font_small, self._font_tiny = fonts
 
     def _calculate_scale_factor(self, new_width, new_height):
         """Calcula o fator de escala baseado nas novas dimensões"""
         # Calcula escala baseada na menor dimensão para manter proporções
         scale_x = new_width / self._original_width
         scale_y = new_height / self._original_height
-        return min(scale_x, scale_y)
+        scale = min(scale_x, scale_y)
+        
+        # Quantiza para que tamanhos de janela próximos reusem sprites, fontes e camadas
+        if self._scale_step:
+            scale = max(self._scale_step, math.floor(scale / self._scale_step) * self._scale_step)
+        return scale
+
+    def _apply_pending_resize(self):
+        """Aplica o último VIDEORESIZE depois que a janela para de mudar de tamanho"""
+        if self._pending_resize is None:
+            return
+        width, height, event_time = self._pending_resize
+        if pygame.time.get_ticks() - event_time < self._resize_debounce_ms:
+            return
+        self._pending_resize = None
+        if self._window is not None:
+            # Resolução nativa: só a apresentação muda
+            self._window = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+            self._update_presentation(width, height)
+            self._needs_full_redraw = True
+            print(f"Janela redimensionada: {width}x{height}, apresentação: {self._present_rect.width}x"
+                  f"{self._present_rect.height}")
+            return
+        self._update_scale(width, height)
+        self._screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+
+    def _update_presentation(self, window_width, window_height):
+        """Calcula a área da janela onde o quadro nativo é apresentado"""
+        native_width, native_height = self._screen.get_size()
+        if (self._present_filter == "nearest" and window_width >= native_width
+                and window_height >= native_height):
+            factor = min(window_width // native_width, window_height // native_height)
+            size = (native_width * factor, native_height * factor)
+            self._present_factor = factor
+        else:
+            # Janela menor que a resolução nativa ou filtro suave: escala fracionária
+            scale = min(window_width / native_width, window_height / native_height)
+            size = (max(1, int(native_width * scale)), max(1, int(native_height * scale)))
+            self._present_factor = None
+        
+        self._present_rect = pygame.Rect(((window_width - size[0]) // 2, (window_height - size[1]) // 2), size)
+        self._window.fill((0, 0, 0))
+        self._present_target = self._window.subsurface(self._present_rect)
+
+    def _present(self, rects=None):
+        """
+        Mostra o quadro desenhado em self._screen.
+        
+        Args:
+            rects: Áreas alteradas (em coordenadas de self._screen); None
+                apresenta o quadro inteiro
+        """
+        if self._window is None:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            return
+        
+        if rects is not None and self._present_factor is not None:
+            # Fator inteiro: cada área alterada é ampliada sozinha, sem emendas
+            factor = self._present_factor
+            window_rects = []
+            for rect in rects:
+                if rect.width <= 0 or rect.height <= 0:
+                    continue
+                target = pygame.Rect(self._present_rect.x + rect.x * factor, self._present_rect.y + rect.y * factor,
+                                     rect.width * factor, rect.height * factor)
+                if factor == 1:
+                    self._window.blit(self._screen, target, rect)
+                else:
+                    pygame.transform.scale(self._screen.subsurface(rect), target.size,
+                                           self._window.subsurface(target))
+                window_rects.append(target)
+            pygame.display.update(window_rects)
+            return
+        
+        if self._present_rect.size == self._screen.get_size():
+            self._window.blit(self._screen, self._present_rect)
+        elif self._present_filter == "smooth":
+            pygame.transform.smoothscale(self._screen, self._present_rect.size, self._present_target)
+        else:
+            pygame.transform.scale(self._screen, self._present_rect.size, self._present_target)
+        pygame.display.flip()
 
     def _update_scale(self, new_width, new_height):
         """Atualiza a escala do jogo baseado nas novas dimensões"""
         self._width = new_width
         self._height = new_height
+        self._needs_full_redraw = True
         
         # Calcula nova escala
         new_scale = self._calculate_scale_factor(new_width, new_height)
@@ -166,11 +347,14 @@ class Game:
         sound_manager.play_sound("music_menu")
 
     def _initialize_campaign(self):
-        from src.map import Map
-        self._available_maps = Map.get_available_maps()
+        catalog = MapCatalog("assets/maps")
+        self._available_maps = catalog.refresh()
         self._current_map_index = 0
         self._campaign_total_score = 0
         
+        catalog_stats = catalog.get_stats()
+        print(f"Descoberta de mapas: {catalog_stats['scanned']} arquivos, {catalog_stats['reread']} relidos "
+              f"em {catalog_stats['scan_time_ms']:.1f} ms")
         print(f"Campanha inicializada com {len(self._available_maps)} mapas:")
         for i, map_info in enumerate(self._available_maps):
             difficulty_label = self._get_difficulty_label(map_info['difficulty'])
@@ -212,29 +396,85 @@ class Game:
         else:
             return (100, 255, 100)
 
-    def _initialize_game(self):
+    def _initialize_game(self, level=None):
+        """
+        Inicia o mapa atual da campanha.
+        
+        Args:
+            level: Nível já preparado por _prepare_level (ex.: em segundo
+                plano durante a intermissão); None prepara agora
+        """
         current_map_path = None
         if self._available_maps and self._current_map_index < len(self._available_maps):
             current_map_path = self._available_maps[self._current_map_index]['file_path']
         
-        if hasattr(self, '_map') and self._map is not None and current_map_path:
-            self._map = Map(map_file_path=current_map_path)
-        elif current_map_path:
-            self._map = Map(map_file_path=current_map_path)
-        else:
-            self._map = Map()
+        # Invalida o cache de caminhos do mapa anterior
+        if hasattr(self, '_map') and self._map is not None:
+            cache_stats = self._map.path_cache.get_stats()
+            print(f"Cache de caminhos: {cache_stats['hits']} acertos, {cache_stats['misses']} falhas "
+                  f"({cache_stats['hit_rate']:.0%})")
+            self._map.path_cache.clear()
+            
+            ai_stats = self._ai_scheduler.get_stats()
+            print(f"Escalonador de IA: {ai_stats['total_executed']} replanejamentos, "
+                  f"{ai_stats['total_deferred']} adiados (máx. {ai_stats['max_deferred']} por frame)")
+        self._ai_scheduler.clear()
+        self._ai_scheduler.reset_stats()
         
-        player_pos = self._map.get_spawn_position("player")
-        self._player = Player(
+        if level is None or level['map_path'] != current_map_path:
+            if hasattr(self, '_map') and self._map is not None and current_map_path == self._map_path:
+                # Mesmo mapa (reinício): restaura o estado inicial da memória
+                self._map.reset_map()
+                level = self._prepare_level(current_map_path, self._map)
+            else:
+                level = self._prepare_level(current_map_path)
+        
+        self._map = level['map']
+        self._map_path = level['map_path']
+        self._flow_field = level['flow_field']
+        self._player = level['player']
+        self._ghosts = level['ghosts']
+        self._pellets = level['pellets']
+        self._pellet_layer = level['pellet_layer']
+        self._total_pellets = len(self._pellets)
+        self._game_start_time = pygame.time.get_ticks()
+        self._needs_full_redraw = True
+        
+        self._map_difficulty = level['difficulty']
+        map_difficulty = self._map_difficulty
+        print(f"Mapa carregado: {self._map.metadata.get('name', 'Sem nome')}")
+        print(f"Dificuldade do mapa: {map_difficulty}/200 ({map_difficulty//2}%)")
+        print(f"Pellets no mapa: {len(self._pellets)}")
+
+    def _prepare_level(self, map_path, game_map=None):
+        """
+        Carrega o mapa e cria jogador, fantasmas e pellets sem alterar o
+        estado do jogo, para poder rodar fora da thread principal.
+        
+        Args:
+            map_path: Caminho do JSON do mapa (None usa o mapa padrão)
+            game_map: Mapa já carregado a reutilizar (opcional)
+            
+        Returns:
+            dict: Objetos do nível prontos para _initialize_game
+        """
+        if game_map is None:
+            game_map = Map(map_file_path=map_path) if map_path else Map()
+        
+        # Campo de fluxo até o jogador, compartilhado pelos fantasmas
+        flow_field = FlowField(game_map)
+        
+        player_pos = game_map.get_spawn_position("player")
+        player = Player(
             x=player_pos.x, 
             y=player_pos.y, 
             color=(255, 255, 0), 
             size=sprite_manager.base_sprite_size,
-            speed=1.7,  
+            speed=102,  # px/s
             lives=3
         )
         
-        self._ghosts = []
+        ghosts = []
         ghost_configs = [
             {"type": "red", "color": (255, 0, 0)},
             {"type": "pink", "color": (255, 182, 193)},
@@ -243,20 +483,21 @@ class Game:
         ]
         
         for config in ghost_configs:
-            ghost_pos = self._map.get_spawn_position(f"ghost_{config['type']}")
+            ghost_pos = game_map.get_spawn_position(f"ghost_{config['type']}")
             ghost = Ghost(
                 x=ghost_pos.x,
                 y=ghost_pos.y,
                 color=config["color"],
                 size=sprite_manager.base_sprite_size,
-                speed=1.5,  
+                speed=90,  # px/s
                 initial_position=ghost_pos,
                 ghost_type=config["type"]
             )
-            self._ghosts.append(ghost)
+            ghosts.append(ghost)
         
-        self._pellets = []
-        pellet_data = self._map.get_pellets()
+        # Pellets indexados pela célula do mapa: a colisão só consulta as células sob o jogador
+        pellets = {}
+        pellet_data = game_map.get_pellets()
         for pellet_info in pellet_data:
             pellet = Pellet(
                 x=pellet_info["position"].x,
@@ -266,12 +507,9 @@ class Game:
                 pellet_type=pellet_info["type"],
                 value=pellet_info["value"]
             )
-            self._pellets.append(pellet)
-        
-        self._total_pellets = len(self._pellets)
-        self._game_start_time = pygame.time.get_ticks()
+            pellets[game_map.get_cell(pellet.position)] = pellet
         
-        map_difficulty = self._map.difficulty
+        map_difficulty = game_map.difficulty
         if isinstance(map_difficulty, str):
             try:
                 map_difficulty = int(map_difficulty)
@@ -280,12 +518,80 @@ class Game:
         elif not isinstance(map_difficulty, int):
             map_difficulty = 0
             
-        for ghost in self._ghosts:
+        for ghost in ghosts:
             ghost.set_difficulty(map_difficulty)
+            ghost.set_planner(self._ghost_planner, self._ghost_replanning)
         
-        print(f"Mapa carregado: {self._map.metadata.get('name', 'Sem nome')}")
-        print(f"Dificuldade do mapa: {map_difficulty}/200 ({map_difficulty//2}%)")
-        print(f"Pellets no mapa: {len(self._pellets)}")
+        return {
+            'map_path': map_path,
+            'map': game_map,
+            'flow_field': flow_field,
+            'player': player,
+            'ghosts': ghosts,
+            'pellets': pellets,
+            'pellet_layer': PelletLayer(game_map, pellets),
+            'difficulty': map_difficulty
+        }
+
+    def _prepare_level_timed(self, map_path, scale_factor):
+        """
+        _prepare_level com o tempo gasto (executado pela thread de carga).
+        
+        Também carrega a tabela de caminhos do mapa e monta a camada estática
+        do labirinto e a de pellets na escala de desenho, que de outra forma
+        seriam feitas no primeiro tick/quadro do nível. Se a escala mudar
+        antes da troca de nível, as camadas da escala nova são montadas no
+        primeiro quadro, como antes.
+        
+        Args:
+            map_path: Caminho do JSON do mapa
+            scale_factor: Escala de desenho quando a carga começou
+        """
+        start_time = time.perf_counter()
+        level = self._prepare_level(map_path)
+        if self._ghost_planner == "table":
+            level['map'].path_table
+        level['map'].get_static_layer(scale_factor)
+        level['pellet_layer'].prepare(scale_factor)
+        level['prepare_ms'] = (time.perf_counter() - start_time) * 1000
+        return level
+
+    def _start_prefetch(self):
+        """Começa a preparar o mapa atual da campanha em segundo plano"""
+        map_path = self._available_maps[self._current_map_index]['file_path']
+        self._prefetch = self._level_loader.submit(self._prepare_level_timed, map_path, self._scale_factor)
+
+    def _cancel_prefetch(self):
+        """
+        Descarta a preparação em segundo plano ao sair do nível: cancela se
+        ainda não começou; se já está rodando, o resultado é ignorado.
+        """
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+
+    def _finish_intermission(self):
+        """
+        Troca para o próximo mapa se ele já foi preparado em segundo plano.
+        
+        Returns:
+            bool: True se o jogo voltou para PLAYING, False se a preparação
+                ainda não terminou (a intermissão continua, sem bloquear)
+        """
+        level = None
+        if self._prefetch is not None:
+            if not self._prefetch.done():
+                return False
+            try:
+                level = self._prefetch.result()
+                print(f"Próximo mapa preparado em segundo plano em {level['prepare_ms']:.1f} ms")
+            except Exception as e:
+                print(f"Erro ao preparar o próximo mapa em segundo plano: {e}")
+            self._prefetch = None
+        
+        self._initialize_game(level)
+        self._state = GameState.PLAYING
+        return True
 
     def _reset_game(self):
         sound_manager.stop_all_sounds()
@@ -297,6 +603,7 @@ class Game:
         
         self._current_map_index = 0
         self._campaign_total_score = 0
+        self._cancel_prefetch()
         
         self._initialize_game()
         self._state = GameState.PLAYING
@@ -308,6 +615,7 @@ class Game:
         
         for ghost in self._ghosts:
             ghost.reset_position()
+        self._ai_scheduler.clear()
 
     @property
     def state(self):
@@ -329,9 +637,8 @@ class Game:
                 return False
                 
             elif event.type == pygame.VIDEORESIZE:
-                # Trata o redimensionamento da janela
-                self._update_scale(event.w, event.h)
-                self._screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                # Trata o redimensionamento da janela quando o arraste termina
+                self._pending_resize = (event.w, event.h, pygame.time.get_ticks())
                 
             elif event.type == pygame.KEYDOWN:
                 if self._state == GameState.MENU:
@@ -476,11 +783,10 @@ class Game:
                         return True
                 elif self._state == GameState.INTERMISSION:
                     if event.key == pygame.K_RETURN:
-                        self._initialize_game()
-                        self._state = GameState.PLAYING
-                        sound_manager.stop_all_sounds()
-                        sound_manager.play_sound("music_menu")
+                        # Troca assim que o próximo mapa estiver pronto (ver update)
+                        self._skip_intermission = True
                     elif event.key == pygame.K_ESCAPE:
+                        self._cancel_prefetch()
                         self._state = GameState.MENU
                         sound_manager.stop_all_sounds()
                         sound_manager.play_sound("music_menu")
@@ -488,6 +794,8 @@ class Game:
         return True
 
     def update(self, delta_time):
+        self._apply_pending_resize()
+        
         if self._show_save_confirmation:
             if pygame.time.get_ticks() - self._save_confirmation_timer > 1000:
                 self._show_save_confirmation = False
@@ -498,11 +806,12 @@ class Game:
 
         if self._state == GameState.INTERMISSION:
             current_time = pygame.time.get_ticks()
-            if current_time - self._intermission_timer >= self._intermission_duration:
-                self._initialize_game()
-                self._state = GameState.PLAYING
-                sound_manager.play_sound("music_menu")
-                return
+            if current_time - self._intermission_timer >= self._intermission_duration or self._skip_intermission:
+                if self._finish_intermission():
+                    if self._skip_intermission:
+                        sound_manager.stop_all_sounds()
+                    sound_manager.play_sound("music_menu")
+                    return
 
         if (self._state == GameState.VICTORY or self._state == GameState.GAME_OVER) and not self._input_active and not self._show_save_confirmation:
             self._input_active = True
@@ -513,15 +822,28 @@ class Game:
         
         if self._state == GameState.PLAYING:
             self._player.update(delta_time, self._map)
+            # O campo compartilhado é recalculado dentro do orçamento de IA;
+            # até lá os fantasmas seguem o campo anterior
+            player_cell = self._map.get_cell(self._player.position)
+            if self._flow_field.source != player_cell:
+                flow_field = self._flow_field
+                self._ai_scheduler.submit(flow_field, PathfindingScheduler.URGENCY_TARGET_MOVED,
+                                          lambda: flow_field.update(player_cell))
             
             for ghost in self._ghosts:
-                ghost.update(delta_time, self._player.position, self._player.direction, self._map, self._ghosts)
+                ghost.update(delta_time, self._player.position, self._player.direction, self._map, self._ghosts,
+                             self._flow_field, self._ai_scheduler)
+            self._ai_scheduler.run_frame()
             
-            pellets_to_remove = []
-            for pellet in self._pellets:
+            collision_radius = sprite_manager.base_sprite_size // 2
+            for cell in self._map.get_cells_in_radius(self._player.position, collision_radius):
+                pellet = self._pellets.get(cell)
+                if pellet is None:
+                    continue
                 distance = self._player.position.distance_to(pellet.position)
-                collision_radius = sprite_manager.base_sprite_size // 2
                 if distance < collision_radius:
+                    del self._pellets[cell]
+                    self._pellet_layer.remove(pellet)
                     points = pellet.be_eaten()
                     self._player.eat_pellet(points)
                     self._map.remove_pellet_at(pellet.position)
@@ -533,11 +855,6 @@ class Game:
                         sound_manager.play_sound("ghost-turn-to-blue")
                     else:
                         sound_manager.play_sound("eating")
-                    
-                    pellets_to_remove.append(pellet)
-            
-            for pellet in pellets_to_remove:
-                self._pellets.remove(pellet)
             
             if len(self._pellets) == 0:
                 self._campaign_total_score += self._player.score
@@ -547,6 +864,8 @@ class Game:
                     self._next_map_info = self._available_maps[self._current_map_index]
                     self._state = GameState.INTERMISSION
                     self._intermission_timer = pygame.time.get_ticks()
+                    self._skip_intermission = False
+                    self._start_prefetch()
                     
                     sound_manager.stop_all_sounds()
                     sound_manager.play_sound("extend")
@@ -581,7 +900,7 @@ class Game:
                             pygame.time.wait(1000)
 
     def _draw_text_centered(self, text, font, color, y_offset=0):
-        text_surface = font.render(text, True, color)
+        text_surface = self._text_cache.render(font, text, color)
         scaled_width = int(self._original_width * self._scale_factor)
         scaled_height = int(self._original_height * self._scale_factor)
         
@@ -607,15 +926,15 @@ class Game:
         hud_start_y = offset_y + self._hud_y_start
         hud_width = scaled_width - int(20 * self._scale_factor)
         
-        score_text = self._font_small.render(f"Pontuação: {self._player.score}", True, (255, 255, 255))
+        score_text = self._text_cache.render(self._font_small, f"Pontuação: {self._player.score}", (255, 255, 255))
         self._screen.blit(score_text, (hud_start_x, hud_start_y))
         
-        lives_text = self._font_small.render(f"Vidas: {self._player.lives}", True, (255, 255, 255))
+        lives_text = self._text_cache.render(self._font_small, f"Vidas: {self._player.lives}", (255, 255, 255))
         lives_rect = lives_text.get_rect(topright=(hud_start_x + hud_width, hud_start_y))
         self._screen.blit(lives_text, lives_rect)
         
         pellets_remaining = len(self._pellets)
-        pellets_text = self._font_small.render(f"Pellets: {pellets_remaining}", True, (255, 255, 255))
+        pellets_text = self._text_cache.render(self._font_small, f"Pellets: {pellets_remaining}", (255, 255, 255))
         center_x = offset_x + scaled_width // 2
         pellets_rect = pellets_text.get_rect(center=(center_x, hud_start_y + int(25 * self._scale_factor)))
         self._screen.blit(pellets_text, pellets_rect)
@@ -623,50 +942,16 @@ class Game:
         pellets_start_x = pellets_rect.left
         
         if hasattr(self, '_map') and self._map is not None:
-            map_difficulty = self._map.difficulty
-            if isinstance(map_difficulty, str):
-                try:
-                    map_difficulty = int(map_difficulty)
-                except (ValueError, TypeError):
-                    map_difficulty = 0
-            elif not isinstance(map_difficulty, int):
-                map_difficulty = 0
-                
-            difficulty_color = (255, 255, 255)
-            difficulty_label = "FÁCIL"
-            
-            if map_difficulty >= 175:
-                difficulty_color = (150, 0, 0)
-                difficulty_label = "EXTREMO"
-            elif map_difficulty >= 150:
-                difficulty_color = (200, 0, 0)
-                difficulty_label = "MUITO DIFÍCIL" 
-            elif map_difficulty >= 125:
-                difficulty_color = (255, 50, 50)
-                difficulty_label = "DIFÍCIL+"
-            elif map_difficulty >= 100:
-                difficulty_color = (255, 100, 0)
-                difficulty_label = "DIFÍCIL"
-            elif map_difficulty >= 75:
-                difficulty_color = (255, 150, 50)
-                difficulty_label = "MÉDIO+"
-            elif map_difficulty >= 50:
-                difficulty_color = (255, 255, 50)
-                difficulty_label = "MÉDIO"
-            elif map_difficulty >= 25:
-                difficulty_color = (150, 255, 150)
-                difficulty_label = "FÁCIL+"
-            else:
-                difficulty_color = (100, 255, 100)
-                difficulty_label = "MUITO FÁCIL"
+            difficulty_label = self._get_difficulty_label(self._map_difficulty)
+            difficulty_color = self._get_difficulty_color(self._map_difficulty)
             
-            difficulty_text = self._font_small.render(f"Dificuldade:{difficulty_label}", True, difficulty_color)
+            difficulty_text = self._text_cache.render(self._font_small, f"Dificuldade:{difficulty_label}", difficulty_color)
             self._screen.blit(difficulty_text, (hud_start_x, hud_start_y + int(25 * self._scale_factor)))
         
         if hasattr(self, '_available_maps') and self._available_maps:
             current_map = self._current_map_index + 1
             total_maps = len(self._available_maps)
-            campaign_text = self._font_small.render(f"Mapa: {current_map}/{total_maps}", True, (200, 200, 255))
+            campaign_text = self._text_cache.render(self._font_small, f"Mapa: {current_map}/{total_maps}", (200, 200, 255))
             campaign_rect = campaign_text.get_rect(topright=(hud_start_x + hud_width, hud_start_y + int(25 * self._scale_factor)))
             self._screen.blit(campaign_text, campaign_rect)
             
@@ -674,12 +959,12 @@ class Game:
                 map_name = self._available_maps[self._current_map_index]['name']
                 if len(map_name) > 20:
                     map_name = map_name[:17] + "..."
-                map_name_text = self._font_small.render(map_name, True, (150, 150, 255))
+                map_name_text = self._text_cache.render(self._font_small, map_name, (150, 150, 255))
                 map_name_rect = map_name_text.get_rect(center=(center_x, hud_start_y - int(40 * self._scale_factor)))
                 self._screen.blit(map_name_text, map_name_rect)
         
         if self._player.power_up_active:
-            power_text = self._font_small.render("POWER-UP ATIVO!", True, (255, 255, 0))
+            power_text = self._text_cache.render(self._font_small, "POWER-UP ATIVO!", (255, 255, 0))
             power_rect = power_text.get_rect(center=(center_x, hud_start_y - int(20 * self._scale_factor)))
             self._screen.blit(power_text, power_rect)
         
@@ -691,24 +976,29 @@ class Game:
                 delay_info.append(f"{ghost._ghost_type.capitalize()}:{remaining:.1f}s")
             
             delay_text = "Fantasmas em delay: " + ", ".join(delay_info)
-            delay_surface = self._font_small.render(delay_text, True, (220, 0, 0))
+            delay_surface = self._text_cache.render(self._font_small, delay_text, (220, 0, 0))
             self._screen.blit(delay_surface, (pellets_start_x, hud_start_y + int(45 * self._scale_factor)))
 
     def render(self):
-        self._screen.fill((0, 0, 0))
-        
         # Calcula offset para centralizar o jogo
         scaled_width = int(self._original_width * self._scale_factor)
         scaled_height = int(self._original_height * self._scale_factor)
         offset_x = (self._width - scaled_width) // 2
         offset_y = (self._height - scaled_height) // 2
         
+        if (self._dirty_rendering and self._state == GameState.PLAYING and not self._needs_full_redraw
+                and self._last_render_state == GameState.PLAYING):
+            self._render_dirty(offset_x, offset_y)
+            return
+        
+        self._screen.fill((0, 0, 0))
+        
         if self._state == GameState.MENU:
-            self._menu_animation_frame += 1
+            self._menu_animation_frame = pygame.time.get_ticks() * ANIMATION_FPS // 1000
             self._draw_text_centered("PAC-MAN", self._font_large, (255, 255, 0), -120)
             for i, option in enumerate(self._menu_options):
                 color = (255, 255, 0) if i == self._selected_option else (255, 255, 255)
-                text_surface = self._font_medium.render(option, True, color)
+                text_surface = self._text_cache.render(self._font_medium, option, color)
                 
                 center_x = offset_x + scaled_width // 2
                 center_y = offset_y + scaled_height // 2 - int(20 * self._scale_factor) + int(i * 45 * self._scale_factor)
@@ -723,7 +1013,7 @@ class Game:
             self._draw_text_centered("Use as setas para navegar e ENTER para selecionar", self._font_small, (200, 200, 200), 120)
 
         elif self._state == GameState.OPTIONS:
-            self._menu_animation_frame += 1
+            self._menu_animation_frame = pygame.time.get_ticks() * ANIMATION_FPS // 1000
             self._draw_text_centered("OPÇÕES", self._font_large, (255, 255, 0), -140)
             for i, option in enumerate(self._options_menu):
                 color = (255, 255, 0) if i == self._selected_option_options else (255, 255, 255)
@@ -732,9 +1022,9 @@ class Game:
                     volume_types = [None, SoundType.MUSIC, SoundType.EFFECT, SoundType.UI, SoundType.GHOST]
                     current_volume = sound_manager.get_volume(volume_types[i])
                     volume_text = f"{option}: {int(current_volume * 100)}%"
-                    text_surface = self._font_small.render(volume_text, True, color)
+                    text_surface = self._text_cache.render(self._font_small, volume_text, color)
                 else:
-                    text_surface = self._font_small.render(option, True, color)
+                    text_surface = self._text_cache.render(self._font_small, option, color)
                 
                 center_x = offset_x + scaled_width // 2
                 center_y = offset_y + scaled_height // 2 - int(90 * self._scale_factor) + int(i * 25 * self._scale_factor)
@@ -753,7 +1043,7 @@ class Game:
                 self._draw_text_centered("ESQ/DIR para ajustar volume", self._font_small, (255, 255, 0), 150)
 
         elif self._state == GameState.HISTORY:
-            self._menu_animation_frame += 1
+            self._menu_animation_frame = pygame.time.get_ticks() * ANIMATION_FPS // 1000
             self._draw_text_centered("HISTÓRICO DE PONTUAÇÕES", self._font_medium, (255, 255, 0), -140)
             
             scores = self._highscore_manager.highscores
@@ -782,10 +1072,13 @@ class Game:
             self._draw_text_centered("ESQ ou ESC para voltar", self._font_small, (200, 200, 200), 130)
 
         elif self._state == GameState.PLAYING:
-            self._map.draw(self._screen, self._scale_factor, offset_x, offset_y)
-            
-            for pellet in self._pellets:
-                pellet.draw(self._screen, self._scale_factor, offset_x, offset_y)
+            if self._dirty_rendering:
+                self._build_background(offset_x, offset_y)
+                self._screen.blit(self._background, (0, 0))
+                self._pellet_layer.draw_power_ups(self._screen, self._scale_factor, offset_x, offset_y)
+            else:
+                self._map.draw(self._screen, self._scale_factor, offset_x, offset_y)
+                self._pellet_layer.draw(self._screen, self._scale_factor, offset_x, offset_y)
             
             self._player.draw(self._screen, self._scale_factor, offset_x, offset_y)
             for ghost in self._ghosts:
@@ -795,16 +1088,12 @@ class Game:
             
         elif self._state == GameState.PAUSED:
             self._map.draw(self._screen, self._scale_factor, offset_x, offset_y)
-            for pellet in self._pellets:
-                pellet.draw(self._screen, self._scale_factor, offset_x, offset_y)
+            self._pellet_layer.draw(self._screen, self._scale_factor, offset_x, offset_y)
             self._player.draw(self._screen, self._scale_factor, offset_x, offset_y)
             for ghost in self._ghosts:
                 ghost.draw(self._screen, self._scale_factor, offset_x, offset_y)
             
-            pause_surface = pygame.Surface((self._width, self._height))
-            pause_surface.set_alpha(128)
-            pause_surface.fill((0, 0, 0))
-            self._screen.blit(pause_surface, (0, 0))
+            self._screen.blit(self._get_pause_overlay(), (0, 0))
             
             self._draw_text_centered("PAUSADO", self._font_large, (255, 255, 255), -40)
             self._draw_text_centered("ESC - Continuar", self._font_small, (255, 255, 255), 0)
@@ -817,7 +1106,7 @@ class Game:
                                    self._font_small, (255, 255, 255), -10)
             if self._input_active:
                 self._draw_text_centered("Digite seu nome e pressione ENTER:", self._font_small, (255, 255, 0), 45)
-                name_surface = self._font_medium.render(self._player_name + "|", True, (255, 255, 255))
+                name_surface = self._text_cache.render(self._font_medium, self._player_name + "|", (255, 255, 255))
                
                 center_x = offset_x + scaled_width // 2
                 center_y = offset_y + scaled_height // 2 + int(85 * self._scale_factor)
@@ -848,7 +1137,7 @@ class Game:
             
             if self._input_active:
                 self._draw_text_centered("Digite seu nome e pressione ENTER:", self._font_small, (255, 255, 0), 75)
-                name_surface = self._font_medium.render(self._player_name + "|", True, (255, 255, 255))
+                name_surface = self._text_cache.render(self._font_medium, self._player_name + "|", (255, 255, 255))
                
                 center_x = offset_x + scaled_width // 2
                 center_y = offset_y + scaled_height // 2 + int(115 * self._scale_factor)
@@ -915,23 +1204,191 @@ class Game:
             self._draw_text_centered("ENTER - Pular | ESC - Menu", 
                                    self._font_small, (150, 150, 150), 170)
         
-        pygame.display.flip()
+        self._present()
+        
+        self._last_render_state = self._state
+        self._needs_full_redraw = False
+        if self._dirty_rendering and self._state == GameState.PLAYING:
+            self._actor_rects = self._get_actor_rects(offset_x, offset_y)
+            self._hud_signature = self._get_hud_signature()
+
+    def _get_pause_overlay(self):
+        """Véu semitransparente da pausa, recriado só quando a janela muda de tamanho"""
+        if self._pause_overlay is None or self._pause_overlay.get_size() != (self._width, self._height):
+            self._pause_overlay = pygame.Surface((self._width, self._height))
+            self._pause_overlay.set_alpha(128)
+            self._pause_overlay.fill((0, 0, 0))
+        return self._pause_overlay
+
+    def _build_background(self, offset_x, offset_y):
+        """Desenha o fundo estático (labirinto e pellets normais) numa superfície do tamanho da tela"""
+        if self._background is None or self._background.get_size() != (self._width, self._height):
+            self._background = pygame.Surface((self._width, self._height)).convert()
+        self._background.fill((0, 0, 0))
+        self._map.draw(self._background, self._scale_factor, offset_x, offset_y)
+        self._background.blit(self._pellet_layer.get_surface(self._scale_factor), (offset_x, offset_y))
+
+    def _erase_from_background(self, layer_rect, offset_x, offset_y):
+        """
+        Refaz no fundo a área de um pellet comido a partir das camadas do
+        labirinto e dos pellets.
+        
+        Returns:
+            pygame.Rect: Área da tela alterada
+        """
+        rect = layer_rect.move(offset_x, offset_y)
+        self._background.fill((0, 0, 0), rect)
+        self._background.blit(self._map.get_static_layer(self._scale_factor), rect, layer_rect)
+        self._background.blit(self._pellet_layer.get_surface(self._scale_factor), rect, layer_rect)
+        return rect
+
+    def _get_actor_rects(self, offset_x, offset_y):
+        """Áreas da tela cobertas pelo jogador e pelos fantasmas"""
+        actors = [self._player] + self._ghosts
+        return [actor.get_draw_rect(self._scale_factor, offset_x, offset_y) for actor in actors]
+
+    def _get_hud_rect(self):
+        """Faixa da tela ocupada pelo HUD (inclui os textos desenhados acima dele)"""
+        scaled_height = int(self._original_height * self._scale_factor)
+        offset_y = (self._height - scaled_height) // 2
+        top = offset_y + self._hud_y_start - int(40 * self._scale_factor) - self._font_small.get_height()
+        return pygame.Rect(0, top, self._width, self._height - top)
+
+    def _get_hud_signature(self):
+        """Valores exibidos no HUD; o HUD só é redesenhado quando algum muda"""
+        delays = tuple(f"{ghost.spawn_delay_remaining:.1f}" for ghost in self._ghosts if ghost.is_in_spawn_delay)
+        return (self._player.score, self._player.lives, len(self._pellets), self._player.power_up_active,
+                self._current_map_index, delays)
+
+    def _render_dirty(self, offset_x, offset_y):
+        """
+        Renderiza o estado PLAYING atualizando só as áreas que mudaram:
+        posições anterior e atual dos personagens, power-ups, pellets
+        comidos e o HUD quando algum valor exibido muda.
+        """
+        dirty_rects = list(self._actor_rects)
+        for layer_rect in self._pellet_layer.flush(self._scale_factor):
+            dirty_rects.append(self._erase_from_background(layer_rect, offset_x, offset_y))
+        dirty_rects.extend(self._pellet_layer.pop_changed_power_up_rects(self._scale_factor, offset_x, offset_y))
+        
+        self._actor_rects = self._get_actor_rects(offset_x, offset_y)
+        dirty_rects.extend(self._actor_rects)
+        
+        hud_rect = self._get_hud_rect()
+        hud_signature = self._get_hud_signature()
+        hud_dirty = hud_signature != self._hud_signature
+        if hud_dirty:
+            dirty_rects.append(hud_rect)
+            self._hud_signature = hud_signature
+        
+        # Power-ups tocados por uma área restaurada são redesenhados inteiros,
+        # e o HUD quando alguma área o toca (repete até estabilizar)
+        power_ups = []
+        remaining = list(self._pellet_layer.power_ups)
+        changed = True
+        while changed:
+            changed = False
+            if not hud_dirty and hud_rect.collidelist(dirty_rects) != -1:
+                hud_dirty = True
+                dirty_rects.append(hud_rect)
+                changed = True
+            for pellet in list(remaining):
+                rect = pellet.get_draw_rect(self._scale_factor, offset_x, offset_y)
+                if rect.collidelist(dirty_rects) != -1:
+                    remaining.remove(pellet)
+                    power_ups.append(pellet)
+                    dirty_rects.append(rect)
+                    changed = True
+        
+        for rect in dirty_rects:
+            self._screen.blit(self._background, rect, rect)
+        
+        self._pellet_layer.draw_power_ups(self._screen, self._scale_factor, offset_x, offset_y, power_ups)
+        self._player.draw(self._screen, self._scale_factor, offset_x, offset_y)
+        for ghost in self._ghosts:
+            ghost.draw(self._screen, self._scale_factor, offset_x, offset_y)
+        
+        if hud_dirty:
+            self._draw_hud()
+        
+        screen_rect = self._screen.get_rect()
+        self._present([rect.clip(screen_rect) for rect in dirty_rects])
+
+    def _advance_simulation(self, frame_time):
+        """
+        Executa os ticks de passo fixo que cabem no tempo acumulado e define
+        a fração do próximo tick usada para interpolar o desenho.
+        """
+        self._accumulator += frame_time
+        # Todos os ticks deste quadro dividem o orçamento de IA
+        self._ai_scheduler.begin_frame()
+        ticks = 0
+        while self._accumulator >= self._tick_delta and ticks < self.MAX_TICKS_PER_FRAME:
+            if self._state == GameState.PLAYING:
+                self._player.save_previous_position()
+                for ghost in self._ghosts:
+                    ghost.save_previous_position()
+            self.update(self._tick_delta)
+            self._accumulator -= self._tick_delta
+            ticks += 1
+        
+        # Atraso maior que MAX_TICKS_PER_FRAME ticks é descartado
+        if self._accumulator >= self._tick_delta:
+            self._accumulator %= self._tick_delta
+        
+        # Fora de PLAYING (ex.: pausa) mantém a última interpolação
+        if self._state == GameState.PLAYING:
+            alpha = self._accumulator / self._tick_delta
+            self._player.set_render_alpha(alpha)
+            for ghost in self._ghosts:
+                ghost.set_render_alpha(alpha)
 
     def run(self):
         running = True
         while running:
-            delta_time = self._clock.tick(60) / 1000.0
+            frame_time = min(self._clock.tick(self._max_fps) / 1000.0, self.MAX_FRAME_TIME)
+            
+            if self._surface_counter is not None:
+                self._surface_counter.begin_frame()
+                frame_state = self._state
             
             running = self.process_events()
-            self.update(delta_time)
-            self.render()
+            self._advance_simulation(frame_time)
+            
+            if self._surface_counter is not None:
+                # Quadros de troca de nível ou de escala podem alocar
+                check = frame_state == self._state == GameState.PLAYING and not self._needs_full_redraw
+                self.render()
+                self._surface_counter.end_frame(check)
+            else:
+                self.render()
         
+        if self._surface_counter is not None:
+            stats = self._surface_counter.get_stats()
+            print(f"Superfícies criadas: {stats['total']} no total; {stats['allocating_frames']} de "
+                  f"{stats['checked_frames']} quadros em PLAYING alocaram (máx. {stats['max_per_frame']})")
+            self._surface_counter.uninstall()
+        self._level_loader.shutdown(wait=False, cancel_futures=True)
         pygame.quit()
         sys.exit()
 
+def _get_option(name, default):
+    """Valor de uma opção --nome=valor da linha de comando"""
+    prefix = f"{name}="
+    for argument in sys.argv[1:]:
+        if argument.startswith(prefix):
+            return argument[len(prefix):]
+    return default
+
 def main():
     try:
-        game = Game(width=560, height=400)
+        game = Game(width=560, height=400, dirty_rendering="--dirty-rects" in sys.argv,
+                    tick_rate=int(_get_option("--tick-rate", 60)), max_fps=int(_get_option("--fps", 60)),
+                    ghost_planner=_get_option("--planner", "table"),
+                    ghost_replanning=_get_option("--replanning", "incremental"),
+                    debug_surfaces="--debug-surfaces" in sys.argv,
+                    native_rendering="--native-render" in sys.argv,
+                    present_filter="smooth" if "--smooth" in sys.argv else "nearest")
         game.run()
     except Exception as e:
         print(f"Erro ao executar o jogo: {e}")
@@ -2,8 +2,9 @@ from abc import ABC, abstractmethod
 import pygame
 import math
 import random
-from .utils import Vector2D, Direction, AStar
-from .sprite_manager import sprite_manager
+from .utils import Vector2D, Direction
+from .sprite_manager import sprite_manager, ANIMATION_FPS
+from .pathfinding import IncrementalAStar, PathfindingScheduler
 
 class GameObject(ABC):
     def __init__(self, x, y, color, size):
@@ -11,6 +12,11 @@ class GameObject(ABC):
         self._color = color
         self._size = size
         self._animation_frame = 0
+        self._animation_time = 0.0  # segundos de animação decorridos
+        # Posição no início do tick e fração do tick já decorrida, usadas só
+        # para desenhar entre dois ticks da simulação
+        self._previous_position = None
+        self._render_alpha = 1.0
 
     @property
     def position(self):
@@ -24,6 +30,26 @@ class GameObject(ABC):
             self._position = new_position
         else:
             raise TypeError("A posição deve ser uma tupla ou um Vector2D")
+        # Teleporte: não interpola a partir da posição antiga
+        self._previous_position = None
+
+    def save_previous_position(self):
+        """Guarda a posição do início do tick (chamado antes de cada update)"""
+        self._previous_position = self._position.copy()
+
+    def set_render_alpha(self, alpha):
+        """Define a fração (0 a 1) do próximo tick já decorrida, para o desenho"""
+        self._render_alpha = alpha
+
+    @property
+    def render_position(self):
+        """Posição de desenho, interpolada entre o tick anterior e o atual"""
+        previous = self._previous_position
+        if previous is None or self._render_alpha >= 1.0:
+            return self._position
+        alpha = self._render_alpha
+        return Vector2D(previous.x + (self._position.x - previous.x) * alpha,
+                        previous.y + (self._position.y - previous.y) * alpha)
 
     @property
     def color(self):
@@ -33,6 +59,17 @@ class GameObject(ABC):
     def size(self):
         return self._size
 
+    @property
+    def animation_frame(self):
+        """Quadro de animação (ANIMATION_FPS por segundo, independente da taxa de ticks)"""
+        return self._animation_frame
+
+    def _advance_animation(self, delta_time):
+        """Avança a animação pelo tempo do tick"""
+        self._animation_time += delta_time
+        # A margem evita perder um quadro por arredondamento da soma dos ticks
+        self._animation_frame = int(self._animation_time * ANIMATION_FPS + 1e-6)
+
     @abstractmethod
     def draw(self, screen):
         pass
@@ -41,6 +78,18 @@ class GameObject(ABC):
     def update(self, delta_time):
         pass
 
+    def get_draw_rect(self, scale_factor=1.0, offset_x=0, offset_y=0):
+        """
+        Área da tela coberta pelo desenho do objeto, com margem para o brilho
+        do power-up e overlays (usada na renderização por retângulos sujos).
+        """
+        sprite_size = sprite_manager.sprite_size
+        margin = int(2 * scale_factor) + 1
+        position = self.render_position
+        x = int((position.x - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_x
+        y = int((position.y - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_y
+        return pygame.Rect(x - margin, y - margin, sprite_size + 2 * margin, sprite_size + 2 * margin)
+
     def get_rect(self):
         sprite_size = sprite_manager.base_sprite_size
         return pygame.Rect(
@@ -53,7 +102,9 @@ class GameObject(ABC):
 class MovableObject(GameObject):
     def __init__(self, x, y, color, size, speed, direction=Direction.NONE):
         super().__init__(x, y, color, size)
+        # Velocidade em pixels por segundo; cada update avança speed * delta_time
         self._speed = speed
+        self._tick_delta = 1 / 60
         self._direction = direction
         self._next_direction = direction
 
@@ -86,24 +137,26 @@ class MovableObject(GameObject):
         if direction == Direction.NONE:
             return False
         
-        next_pos = Vector2D(
-            self._position.x + direction.value[0] * self._speed,
-            self._position.y + direction.value[1] * self._speed
-        )
-        
         if entity_type is None:
             entity_type = "default"
         
-        return game_map.is_valid_position(next_pos, sprite_manager.base_sprite_size, entity_type)
+        step = self._speed * self._tick_delta
+        return game_map.is_valid_point(
+            self._position.x + direction.value[0] * step,
+            self._position.y + direction.value[1] * step,
+            sprite_manager.base_sprite_size,
+            entity_type
+        )
 
     def move(self, direction=None):
         if direction is None:
             direction = self._direction
         
         if direction != Direction.NONE:
+            step = self._speed * self._tick_delta
             self._position += Vector2D(
-                direction.value[0] * self._speed,
-                direction.value[1] * self._speed
+                direction.value[0] * step,
+                direction.value[1] * step
             )
 
 class Player(MovableObject):
@@ -151,21 +204,18 @@ class Player(MovableObject):
     def draw(self, screen, scale_factor=1.0, offset_x=0, offset_y=0):
         sprite = sprite_manager.get_pacman_sprite(self._direction, self._animation_frame)
         
-        sprite_size = sprite_manager.sprite_size
-        x = int((self._position.x - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_x
-        y = int((self._position.y - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_y
+        position = self.render_position
+        x = int((position.x - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_x
+        y = int((position.y - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_y
         
         if self._power_up_active:
-            glow_size = sprite_size + int(4 * scale_factor)
-            glow_surface = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-            glow_color = (255, 255, 100, 100) if (self._animation_frame // 5) % 2 else (255, 255, 0, 150)
-            glow_radius = sprite_size//2 + int(2 * scale_factor)
-            pygame.draw.circle(glow_surface, glow_color, (glow_size//2, glow_size//2), glow_radius)
+            glow_surface = sprite_manager.get_pacman_glow(self._animation_frame)
             screen.blit(glow_surface, (x - int(2 * scale_factor), y - int(2 * scale_factor)))
         
         screen.blit(sprite, (x, y))
 
     def update(self, delta_time, game_map):
+        self._tick_delta = delta_time
         if self._power_up_active:
             self._power_up_timer -= delta_time * 1000
             if self._power_up_timer <= 0:
@@ -188,9 +238,16 @@ class Player(MovableObject):
             else:
                 self._direction = Direction.NONE
 
-        self._animation_frame += 1
+        self._advance_animation(delta_time)
 
 class Ghost(MovableObject):
+    # Planejadores: "table" consulta a PathTable do mapa; "astar" segue
+    # caminhos replanejados pelo modo de REPLANNING_MODES escolhido
+    PLANNERS = ("table", "astar")
+    # "incremental": IncrementalAStar por fantasma; "scratch": GridAStar sem
+    # cache; "cached": PathCache do mapa sobre o JunctionGraph
+    REPLANNING_MODES = ("incremental", "scratch", "cached")
+
     def __init__(self, x, y, color, size, speed, initial_position, ghost_type="red"):
         super().__init__(x, y, color, size, speed)
         self._state = "normal"
@@ -214,6 +271,9 @@ class Ghost(MovableObject):
         self._astar_frequency = 2000
         self._last_target = None
         self._smooth_movement = True
+        self._planner = "table"  # Ghost.PLANNERS
+        self._replanning = "incremental"  # Ghost.REPLANNING_MODES
+        self._incremental_planner = None
         
         # Sistema de patrulhamento
         self._patrol_route = self._get_patrol_route()
@@ -340,9 +400,33 @@ class Ghost(MovableObject):
         
         return False
 
-    def configure_astar(self, use_astar=True, frequency=1000):
+    def set_planner(self, planner=None, replanning=None):
+        """
+        Escolhe o motor de pathfinding do fantasma.
+        
+        Args:
+            planner: Um de Ghost.PLANNERS (None mantém o atual)
+            replanning: Um de Ghost.REPLANNING_MODES, usado com planner "astar"
+                (None mantém o atual)
+        """
+        if planner is not None:
+            if planner not in self.PLANNERS:
+                raise ValueError(f"Planejador inválido: {planner}")
+            self._planner = planner
+            self._current_path = []
+            self._path_index = 0
+        if replanning is not None:
+            if replanning not in self.REPLANNING_MODES:
+                raise ValueError(f"Modo de replanejamento inválido: {replanning}")
+            self._replanning = replanning
+            self._incremental_planner = None
+            self._current_path = []
+            self._path_index = 0
+
+    def configure_astar(self, use_astar=True, frequency=1000, planner=None, replanning=None):
         self._use_astar = use_astar
         self._astar_frequency = frequency
+        self.set_planner(planner, replanning)
         if not use_astar:
             self._current_path = []
             self._path_index = 0
@@ -350,6 +434,10 @@ class Ghost(MovableObject):
     def get_astar_status(self):
         return {
             "enabled": self._use_astar,
+            "planner": self._planner,
+            "replanning": self._replanning,
+            "replan_searches": self._incremental_planner.searches if self._incremental_planner else 0,
+            "replan_nodes_expanded": self._incremental_planner.total_expanded if self._incremental_planner else 0,
             "path_length": len(self._current_path),
             "path_index": self._path_index,
             "frequency": self._astar_frequency,
@@ -389,7 +477,7 @@ class Ghost(MovableObject):
         self._state = "vulnerable"
         adjusted_duration = self.get_difficulty_adjusted_vulnerable_duration(duration)
         self._vulnerable_timer = adjusted_duration
-        self._speed = max(1, self._speed - 1)
+        self._speed = max(60, self._speed - 60)
 
     def get_target_position(self, player_position, player_direction=None, other_ghosts=None):
         """Calcula posição alvo baseada no tipo e modo do fantasma"""
@@ -453,9 +541,10 @@ class Ghost(MovableObject):
         
         for direction in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
             if self.can_move(direction, game_map):
+                step = self._speed * self._tick_delta
                 test_pos = Vector2D(
-                    self._position.x + direction.value[0] * self._speed,
-                    self._position.y + direction.value[1] * self._speed
+                    self._position.x + direction.value[0] * step,
+                    self._position.y + direction.value[1] * step
                 )
                 distance = test_pos.distance_to(target_position)
                 possible_directions.append((direction, distance))
@@ -474,9 +563,10 @@ class Ghost(MovableObject):
         
         for direction in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
             if self.can_move(direction, game_map):
+                step = self._speed * self._tick_delta
                 test_pos = Vector2D(
-                    self._position.x + direction.value[0] * self._speed,
-                    self._position.y + direction.value[1] * self._speed
+                    self._position.x + direction.value[0] * step,
+                    self._position.y + direction.value[1] * step
                 )
                 distance = test_pos.manhattan_distance_to(target_position)
                 possible_directions.append((direction, distance))
@@ -549,6 +639,7 @@ class Ghost(MovableObject):
 
     def reset_position(self):
         self._position = self._initial_position.copy()
+        self._previous_position = None
         self._state = "normal"
         self._speed = self._base_speed
         self._vulnerable_timer = 0
@@ -566,6 +657,7 @@ class Ghost(MovableObject):
     def set_eaten_with_delay(self):
         """Coloca fantasma no spawn com delay de 5 segundos"""
         self._position = self._initial_position.copy()
+        self._previous_position = None
         self._state = "normal"
         self._speed = self._base_speed
         self._vulnerable_timer = 0
@@ -627,8 +719,22 @@ class Ghost(MovableObject):
                 base_chance = 0.2
                 return random.random() < min(base_chance + difficulty_bonus, 0.8)
 
-    def astar_pathfinding(self, game_map, target_position):
-        """Usa A* para encontrar caminho até o alvo"""
+    def astar_pathfinding(self, game_map, target_position, scheduler=None, blocked=False):
+        """
+        Usa A* para encontrar caminho até o alvo
+        
+        Com um escalonador, o replanejamento é enviado como solicitação e o
+        fantasma segue na direção atual até ela ser atendida. Parado contra uma
+        parede (blocked), segue o caminho atual se ele ainda tem um passo
+        possível (ex.: recém-atendido); senão o descarta e pede um novo com
+        URGENCY_BLOCKED, usando a lógica orgânica enquanto espera.
+        """
+        if blocked and self._current_path:
+            direction = self._follow_current_path(game_map)
+            if direction is not None and direction != Direction.NONE:
+                return direction
+            self._current_path = []
+        
         should_recalculate = (
             len(self._current_path) == 0 or
             self._path_index >= len(self._current_path) - 1 or
@@ -637,16 +743,29 @@ class Ghost(MovableObject):
         )
         
         if should_recalculate:
-            self._current_path = AStar.find_path(
-                self._position, 
-                target_position, 
-                game_map, 
-                "manhattan"
-            )
-            self._path_index = 0
-            self._recalculate_path_timer = 0
-            self._last_target = target_position.copy()
+            if scheduler is None:
+                self._replan(game_map, target_position)
+            else:
+                urgency = self._replan_urgency(target_position, blocked)
+                target = target_position.copy()
+                scheduler.submit(self, urgency, lambda: self._replan(game_map, target))
+                if blocked:
+                    return self.choose_direction_advanced(game_map, target_position)
+                return self._direction
+        
+        direction = self._follow_current_path(game_map)
+        if direction is not None:
+            return direction
         
+        return self.choose_direction_advanced(game_map, target_position)
+
+    def _follow_current_path(self, game_map):
+        """
+        Direção até o próximo waypoint do caminho atual.
+        
+        Returns:
+            Direction (Direction.NONE no fim do caminho), ou None sem passo possível
+        """
         if self._current_path and self._path_index < len(self._current_path) - 1:
             next_waypoint = self._current_path[self._path_index + 1]
             
@@ -662,7 +781,191 @@ class Ghost(MovableObject):
             if self.can_move(direction, game_map):
                 return direction
         
-        return self.choose_direction_advanced(game_map, target_position)
+        return None
+
+    def _replan(self, game_map, target_position):
+        """Recalcula o caminho até o alvo e reinicia o acompanhamento dos waypoints"""
+        cells = self._plan_path(game_map, target_position)
+        self._current_path = game_map.pathfinder.to_cell_centers(cells)
+        self._path_index = 0
+        self._recalculate_path_timer = 0
+        self._last_target = target_position.copy()
+
+    def _replan_urgency(self, target_position, blocked):
+        """Urgência do replanejamento para o PathfindingScheduler"""
+        if blocked:
+            return PathfindingScheduler.URGENCY_BLOCKED
+        if self._last_target and self._last_target.distance_to(target_position) > 32:
+            return PathfindingScheduler.URGENCY_TARGET_MOVED
+        if not self._current_path or self._path_index >= len(self._current_path) - 1:
+            return PathfindingScheduler.URGENCY_NO_PATH
+        return PathfindingScheduler.URGENCY_REFRESH
+
+    def _plan_path(self, game_map, target_position):
+        """
+        Calcula o caminho de células até o alvo.
+        
+        No modo "incremental" cada fantasma reaproveita a própria busca
+        anterior (IncrementalAStar); no modo "scratch" cada replanejamento é
+        uma busca nova do GridAStar do mapa, sem cache, entre os centros das
+        células (as mesmas consultas do modo incremental); no modo "cached"
+        os caminhos vêm do PathCache do mapa (JunctionGraph nas falhas).
+        """
+        start_cell = game_map.get_cell(self._position)
+        goal_cell = game_map.get_cell(target_position)
+        if self._replanning == "incremental":
+            planner = self._incremental_planner
+            if planner is None or planner.walkable is not game_map.walkable:
+                self._incremental_planner = IncrementalAStar(game_map)
+            return self._incremental_planner.find_path(start_cell, goal_cell)
+        if self._replanning == "cached":
+            return game_map.path_cache.find_path(self._position, target_position, "manhattan")
+        return game_map.pathfinder.find_path(game_map.get_cell_center(*start_cell),
+                                             game_map.get_cell_center(*goal_cell), "manhattan")
+
+    def path_table_pathfinding(self, game_map, target_position):
+        """
+        Usa a tabela de caminhos mínimos do mapa (consulta O(1)) até o alvo.
+        
+        Retorna Direction.NONE quando a tabela não tem rota (alvo em parede,
+        fora do mapa ou já alcançado).
+        """
+        cell = game_map.get_cell(self._position)
+        target_cell = game_map.get_cell(target_position)
+        direction = game_map.path_table.next_direction(cell, target_cell)
+        return self._follow_cell_direction(game_map, cell, direction)
+
+    def flow_field_pathfinding(self, game_map, flow_field):
+        """
+        Segue o campo de fluxo compartilhado (BFS a partir do jogador).
+        
+        Retorna Direction.NONE na célula de origem ou sem caminho.
+        """
+        cell = game_map.get_cell(self._position)
+        return self._follow_cell_direction(game_map, cell, flow_field.next_direction(cell))
+
+    def offset_flow_field_pathfinding(self, game_map, flow_field, target_cell):
+        """
+        Segue o campo compartilhado do jogador puxado para um alvo deslocado.
+        
+        Cada vizinho vale a distância ao jogador no campo mais a distância
+        Manhattan até a célula alvo; o fantasma só vai para um vizinho que
+        vale menos que a célula atual e, num mínimo local, segue o campo até o
+        jogador. Os valores nunca sobem, então não há vaivém entre células, e
+        nenhuma BFS extra é feita por fantasma.
+        """
+        col, row = game_map.get_cell(self._position)
+        target_col, target_row = target_cell
+        
+        def score(cell_col, cell_row):
+            distance = flow_field.distance((cell_col, cell_row))
+            if distance is None:
+                return None
+            return distance + abs(cell_col - target_col) + abs(cell_row - target_row)
+        
+        best_direction = Direction.NONE
+        best_score = score(col, row)
+        if best_score is not None:
+            for direction in (self._direction, Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT):
+                if direction == Direction.NONE:
+                    continue
+                neighbor_score = score(col + direction.value[0], row + direction.value[1])
+                if neighbor_score is not None and neighbor_score < best_score:
+                    best_score = neighbor_score
+                    best_direction = direction
+        if best_direction == Direction.NONE:
+            best_direction = flow_field.next_direction((col, row))
+        return self._follow_cell_direction(game_map, (col, row), best_direction)
+
+    def _follow_cell_direction(self, game_map, cell, direction):
+        """Converte o passo entre células em direção de movimento para o fantasma"""
+        if direction == Direction.NONE:
+            return Direction.NONE
+        
+        col, row = cell
+        next_cell_center = game_map.get_cell_center(col + direction.value[0], row + direction.value[1])
+        direction = self.calculate_direction_to_waypoint(next_cell_center)
+        if self.can_move(direction, game_map):
+            return direction
+        
+        # Fora do eixo do corredor: alinha com o centro da célula atual antes de virar
+        direction = self.calculate_direction_to_waypoint(game_map.get_cell_center(col, row))
+        if self.can_move(direction, game_map):
+            return direction
+        
+        return Direction.NONE
+
+    def flee_pathfinding(self, game_map, player_position, scheduler=None):
+        """
+        Fuga do jogador descendo o campo de fuga do mapa.
+        
+        Diferente do max guloso, o campo evita becos sem saída: o fantasma
+        prefere corredores que continuam abertos, mesmo que passem mais perto.
+        Com um escalonador, o campo da nova célula do jogador é calculado uma
+        vez para todos os fantasmas (o dono da solicitação é o DistanceFields
+        do mapa), um passo de relaxamento por solicitação atendida, e até
+        ficar pronto vale o último campo calculado.
+        Retorna Direction.NONE num mínimo local, fora do campo ou antes do
+        primeiro campo ficar pronto.
+        """
+        player_cell = game_map.get_cell(player_position)
+        if scheduler is None:
+            field = game_map.get_flee_field(player_cell)
+        else:
+            fields = game_map.distance_fields
+            field, current = fields.latest_flee_field(player_cell)
+            if not current:
+                scheduler.submit(fields, PathfindingScheduler.URGENCY_TARGET_MOVED,
+                                 lambda: fields.step_flee_field(player_cell))
+            if field is None:
+                return Direction.NONE
+        col, row = game_map.get_cell(self._position)
+        if not (0 <= col < game_map.width and 0 <= row < game_map.height):
+            return Direction.NONE
+        
+        best_direction = Direction.NONE
+        best_value = field[row, col]
+        for direction in (self._direction, Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT):
+            if direction == Direction.NONE:
+                continue
+            next_col, next_row = col + direction.value[0], row + direction.value[1]
+            if 0 <= next_col < game_map.width and 0 <= next_row < game_map.height:
+                if field[next_row, next_col] < best_value:
+                    best_value = field[next_row, next_col]
+                    best_direction = direction
+        
+        return self._follow_cell_direction(game_map, (col, row), best_direction)
+
+    def _uses_path_table(self, game_map):
+        return self._planner == "table" and game_map.path_table is not None
+
+    def _lookup_direction(self, game_map, target_position, flow_field=None, player_position=None):
+        """
+        Direção por consulta O(1), sem busca.
+        
+        Em modo chase, o alvo na célula do jogador (vermelho) segue o campo de
+        fluxo compartilhado. Alvos deslocados (rosa, ciano, laranja perto do
+        jogador) usam a tabela de caminhos até o próprio alvo (planner
+        "table") ou, sem ela, o campo compartilhado puxado para o alvo; a
+        única BFS por movimento do jogador é a do campo compartilhado. Nos
+        outros modos usa a tabela (planner "table"). Com o recálculo do campo
+        pendente no escalonador, segue o campo anterior; um campo nunca
+        calculado (início do nível) cai na tabela.
+        
+        Returns:
+            Direction, ou None se nenhuma consulta O(1) se aplica
+        """
+        if flow_field is not None and self._current_mode == "chase":
+            target_cell = game_map.get_cell(target_position)
+            player_cell = flow_field.source if player_position is None else game_map.get_cell(player_position)
+            if target_cell == player_cell:
+                if flow_field.source is not None:
+                    return self.flow_field_pathfinding(game_map, flow_field)
+            elif not self._uses_path_table(game_map) and flow_field.source is not None:
+                return self.offset_flow_field_pathfinding(game_map, flow_field, target_cell)
+        if self._uses_path_table(game_map):
+            return self.path_table_pathfinding(game_map, target_position)
+        return None
 
     def draw(self, screen, scale_factor=1.0, offset_x=0, offset_y=0):
         sprite = sprite_manager.get_ghost_sprite(
@@ -672,19 +975,19 @@ class Ghost(MovableObject):
             self._state
         )
         
-        sprite_size = sprite_manager.sprite_size
-        x = int((self._position.x - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_x
-        y = int((self._position.y - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_y
+        position = self.render_position
+        x = int((position.x - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_x
+        y = int((position.y - sprite_manager.base_sprite_size // 2) * scale_factor) + offset_y
         
         screen.blit(sprite, (x, y))
         
         if self._is_in_spawn_delay:
-            overlay = pygame.Surface((sprite_size, sprite_size), pygame.SRCALPHA)
             alpha = 80 + int(40 * abs(math.sin(pygame.time.get_ticks() * 0.01)))
-            overlay.fill((255, 255, 255, alpha))
-            screen.blit(overlay, (x, y))
+            screen.blit(sprite_manager.get_spawn_overlay(alpha), (x, y))
 
-    def update(self, delta_time, player_position=None, player_direction=None, game_map=None, other_ghosts=None):
+    def update(self, delta_time, player_position=None, player_direction=None, game_map=None, other_ghosts=None,
+               flow_field=None, scheduler=None):
+        self._tick_delta = delta_time
         # Sistema de delay no spawn
         if self._is_in_spawn_delay:
             self._spawn_delay_timer -= delta_time * 1000
@@ -693,14 +996,14 @@ class Ghost(MovableObject):
                 self._spawn_delay_timer = 0
                 print(f"Fantasma {self._ghost_type} liberado do spawn!")
             else:
-                self._animation_frame += 1
+                self._advance_animation(delta_time)
                 return
 
         if self._state == "vulnerable":
             self._vulnerable_timer -= delta_time * 1000
             if self._vulnerable_timer <= 0:
                 self._state = "normal"
-                self._speed = 1.5
+                self._speed = 90
 
         self.update_mode(delta_time)
 
@@ -720,16 +1023,33 @@ class Ghost(MovableObject):
             
             new_direction = Direction.NONE
             
-            if use_astar:
-                astar_interval = {
-                    "red": 100,
-                    "pink": 100,
-                    "cyan": 100,
-                    "orange": 100
-                }.get(self._ghost_type, 500)
-                
+            astar_interval = {
+                "red": 100,
+                "pink": 100,
+                "cyan": 100,
+                "orange": 100
+            }.get(self._ghost_type, 500)
+            
+            if self._state == "vulnerable":
+                lookup_direction = self.flee_pathfinding(game_map, player_position, scheduler)
+            elif use_astar:
+                lookup_direction = self._lookup_direction(game_map, target, flow_field, player_position)
+            else:
+                lookup_direction = None
+            
+            if lookup_direction is not None:
+                # Consulta O(1) a cada frame; sem rota, usa a lógica orgânica
+                # no mesmo intervalo do A*
+                new_direction = lookup_direction
+                if new_direction == Direction.NONE and self._recalculate_path_timer > astar_interval:
+                    new_direction = self.choose_direction_advanced(game_map, target)
+                    self._recalculate_path_timer = 0
+                if new_direction != Direction.NONE:
+                    self._direction = new_direction
+                    self._last_direction = new_direction
+            elif use_astar:
                 if self._recalculate_path_timer > astar_interval:
-                    new_direction = self.astar_pathfinding(game_map, target)
+                    new_direction = self.astar_pathfinding(game_map, target, scheduler)
                     if new_direction != Direction.NONE:
                         self._direction = new_direction
                         self._last_direction = new_direction
@@ -752,16 +1072,18 @@ class Ghost(MovableObject):
             if self.can_move(self._direction, game_map):
                 self.move()
             else:
-                if use_astar:
-                    self._current_path = []
-                    self._direction = self.astar_pathfinding(game_map, target)
+                if lookup_direction is not None:
+                    # A consulta deste frame não tinha passo possível
+                    self._direction = self.choose_direction_advanced(game_map, target)
+                elif use_astar:
+                    self._direction = self.astar_pathfinding(game_map, target, scheduler, blocked=True)
                 else:
                     self._direction = self.choose_direction_advanced(game_map, target)
                 
                 if self._direction != Direction.NONE:
                     self._last_direction = self._direction
 
-        self._animation_frame += 1
+        self._advance_animation(delta_time)
 
 class Pellet(GameObject):
     def __init__(self, x, y, color, size, pellet_type="normal", value=10):
@@ -790,4 +1112,4 @@ class Pellet(GameObject):
         screen.blit(sprite, (x, y))
 
     def update(self, delta_time):
-        self._animation_frame += 1
\ No newline at end of file
+        self._advance_animation(delta_time)
\ No newline at end of file
@@ -1,11 +1,52 @@
 import pygame
 import json
 import os
-import glob
+import threading
+import numpy as np
+from collections import OrderedDict
 from .utils import Vector2D
-from .sprite_manager import sprite_manager
+from .sprite_manager import sprite_manager, can_convert_surfaces
+from .map_catalog import MapCatalog
+from .map_format import CompiledMap
+from .pathfinding import DistanceFields, GridAStar, JunctionGraph, PathCache, PathTable
+
+
+class MapSnapshot:
+    """
+    Cópia imutável do estado inicial de um mapa já carregado.
+
+    Guarda o layout em bytes, spawns, metadados e as máscaras de colisão
+    (que dependem só das paredes), para restaurar o mapa sem ler o disco.
+    """
+    __slots__ = ("mtime", "metadata", "cell_size", "width", "height", "cells",
+                 "pellet_count", "power_up_count", "spawn_positions", "collision_masks")
+
+    def __init__(self, game_map, mtime=None):
+        """
+        Args:
+            game_map: Mapa recém-carregado (estado inicial)
+            mtime: Data de modificação do arquivo de origem (None se não houver)
+        """
+        self.mtime = mtime
+        self.metadata = dict(game_map._metadata)
+        self.cell_size = game_map._cell_size
+        self.width = game_map._width
+        self.height = game_map._height
+        self.cells = bytes(game_map._cells)
+        self.pellet_count = game_map._pellet_count
+        self.power_up_count = game_map._power_up_count
+        self.spawn_positions = {entity: (pos.x, pos.y) for entity, pos in game_map._spawn_positions.items()}
+        self.collision_masks = dict(game_map._collision_masks)
+
 
 class Map:
+    # Snapshots dos arquivos já lidos neste processo, por caminho absoluto;
+    # mapas também são carregados pela thread de carga do jogo, daí o lock
+    _snapshots = {}
+    _snapshots_lock = threading.Lock()
+    # Escalas com camada estática guardada (redimensionar a janela e voltar não redesenha)
+    STATIC_LAYER_CACHE_SIZE = 4
+
     def __init__(self, layout_data=None, cell_size=None, map_file_path=None):
         """
         Inicializa o mapa. Por padrão, carrega de arquivo JSON.
@@ -15,19 +56,33 @@ class Map:
             cell_size: Tamanho das células (opcional)
             map_file_path: Caminho para arquivo JSON do mapa (opcional)
         """
-        self._layout = []
+        # Layout em bytes (row * width + col): 1=parede, 0=caminho, 2=pellet, 3=power_up
+        self._cells = bytearray()
+        self._pellet_count = 0
+        self._power_up_count = 0
         self._cell_size = cell_size if cell_size else sprite_manager.base_sprite_size
         self._width = 0
         self._height = 0
         self._metadata = {}
         self._spawn_positions = {}
         self._original_map_path = None
+        self._walkable = bytearray()
+        self._pathfinder = None
+        self._junction_graph = None
+        self._distance_fields = None
+        self._collision_masks = {}
+        self._path_table = None
+        self._path_cache = PathCache(self)
+        self._snapshot = None
+        self._static_layers = OrderedDict()
+        self._unconverted_layers = set()  # Escalas montadas sem tela/fora da thread principal
         
         # Se dados manuais fornecidos, usa eles (compatibilidade)
         if layout_data:
-            self._layout = layout_data
-            self._update_dimensions()
+            self._set_layout(layout_data)
+            self._build_navigation()
             self._set_default_spawn_positions()
+            self._snapshot = MapSnapshot(self)
         else:
             # Sempre tenta carregar de JSON primeiro
             map_path = map_file_path or "assets/maps/default_map.json"
@@ -51,39 +106,68 @@ class Map:
                 print(f"Erro: Arquivo de mapa não encontrado: {file_path}")
                 return False
             
-            # Carrega e valida JSON
-            with open(file_path, 'r', encoding='utf-8') as f:
-                map_data = json.load(f)
-            
-            # Valida estrutura básica do JSON
-            if not self._validate_map_json(map_data):
-                print(f"Erro: Estrutura inválida no arquivo de mapa: {file_path}")
-                return False
-            
-            # Extrai dados do JSON
-            self._metadata = map_data.get('metadata', {})
-            self._layout = map_data['layout']
+            # Arquivo já lido e não modificado: restaura da memória
+            cache_key = os.path.abspath(file_path)
+            mtime = os.path.getmtime(file_path)
+            with Map._snapshots_lock:
+                snapshot = Map._snapshots.get(cache_key)
+            if snapshot is not None and snapshot.mtime == mtime:
+                self._restore_snapshot(snapshot, rebuild_navigation=True)
+                self._original_map_path = file_path
+                print(f"Mapa restaurado da memória: {self._metadata.get('name', 'Sem nome')}")
+                return True
             
-            # Atualiza cell_size se especificado no JSON
-            if 'cell_size' in self._metadata:
-                self._cell_size = self._metadata['cell_size']
+            # Versão compilada atualizada: lê o binário via mmap
+            compiled = CompiledMap.load_for(file_path)
+            if compiled is not None:
+                self._metadata = compiled.metadata
+                self._set_cells(compiled.width, compiled.height, compiled.cells)
+                if compiled.cell_size:
+                    self._cell_size = compiled.cell_size
+                spawn_data = compiled.spawn_positions
+            else:
+                # Carrega e valida JSON
+                source_stat = os.stat(file_path)
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    map_data = json.load(f)
+                
+                # Valida estrutura básica do JSON
+                if not self._validate_map_json(map_data):
+                    print(f"Erro: Estrutura inválida no arquivo de mapa: {file_path}")
+                    return False
+                
+                # Extrai dados do JSON
+                self._metadata = map_data.get('metadata', {})
+                self._set_layout(map_data['layout'])
+                
+                # Atualiza cell_size se especificado no JSON
+                if 'cell_size' in self._metadata:
+                    self._cell_size = self._metadata['cell_size']
+                
+                spawn_data = map_data.get('spawn_positions', {})
             
             # Carrega posições de spawn
-            spawn_data = map_data.get('spawn_positions', {})
             self._load_spawn_positions(spawn_data)
             
-            # Atualiza dimensões
-            self._update_dimensions()
-            
             # Valida dimensões
             if not self._validate_dimensions():
                 print(f"Erro: Dimensões inválidas no mapa")
                 return False
             
-            # Salva o caminho original para reset
+            # Só um JSON válido vira versão compilada
+            if compiled is None:
+                self._write_compiled(map_data, source_stat, file_path)
+            
+            self._build_navigation()
+            
+            # Salva o caminho original para reset e o estado inicial
             self._original_map_path = file_path
+            self._snapshot = MapSnapshot(self, mtime)
+            with Map._snapshots_lock:
+                Map._snapshots[cache_key] = self._snapshot
             
-            print(f"Mapa carregado com sucesso: {self._metadata.get('name', 'Sem nome')}")
+            origin = " (compilado)" if compiled is not None else ""
+            print(f"Mapa carregado com sucesso{origin}: {self._metadata.get('name', 'Sem nome')}")
             print(f"Dimensões: {self._width}x{self._height}, Cell Size: {self._cell_size}")
             return True
             
@@ -94,6 +178,14 @@ class Map:
             print(f"Erro inesperado ao carregar mapa: {e}")
             return False
 
+    def _write_compiled(self, map_data, source_stat, file_path):
+        """Salva a versão compilada do JSON recém-lido para as próximas cargas"""
+        compiled_path = CompiledMap.path_for(file_path)
+        try:
+            CompiledMap.write(map_data, source_stat, compiled_path)
+        except (OSError, ValueError) as e:
+            print(f"Aviso: não foi possível compilar o mapa em {compiled_path}: {e}")
+
     def _validate_map_json(self, map_data):
         """
         Valida se o JSON do mapa tem a estrutura correta.
@@ -165,18 +257,93 @@ class Map:
             "ghost_orange": Vector2D(18 * self._cell_size + self._cell_size // 2, 10 * self._cell_size + self._cell_size // 2)
         }
 
-    def _update_dimensions(self):
-        """Atualiza as dimensões do mapa baseado no layout."""
-        self._height = len(self._layout)
-        self._width = len(self._layout[0]) if self._layout else 0
+    def _set_layout(self, layout):
+        """
+        Converte o layout (lista de listas) para o array de bytes do mapa e
+        atualiza dimensões e contadores de pellets. Células ausentes em
+        linhas curtas viram parede.
+        """
+        self._height = len(layout)
+        self._width = len(layout[0]) if layout else 0
+        width = self._width
+        
+        cells = bytearray(b"\x01") * (width * self._height)
+        for row_idx, row in enumerate(layout):
+            row = row[:width]
+            cells[row_idx * width:row_idx * width + len(row)] = bytes(row)
+        self._cells = cells
+        self._pellet_count = cells.count(2)
+        self._power_up_count = cells.count(3)
+
+    def _set_cells(self, width, height, cells):
+        """
+        Define o layout a partir de células já em bytes (formato compilado).
+        
+        Args:
+            width, height: Dimensões do mapa em células
+            cells: Bytes das células (row * width + col)
+        """
+        self._width = width
+        self._height = height
+        self._cells = bytearray(cells)
+        self._pellet_count = self._cells.count(2)
+        self._power_up_count = self._cells.count(3)
+
+    def _grid(self):
+        """Visão NumPy (height, width) do layout, sem cópia"""
+        return np.frombuffer(self._cells, dtype=np.uint8).reshape(self._height, self._width)
 
     def _validate_dimensions(self):
         """Valida se as dimensões do mapa são válidas."""
         return self._width > 0 and self._height > 0
 
+    def _build_navigation(self, walkability_ready=False):
+        """Recalcula os dados de navegação que dependem do layout de paredes"""
+        if not walkability_ready:
+            self._build_walkability()
+        for entity_type in ("player", "ghost"):
+            self.get_collision_mask(sprite_manager.base_sprite_size, entity_type)
+
+    def _build_walkability(self):
+        """
+        Pré-calcula o array de caminhabilidade (1 = livre, 0 = parede) indexado
+        por row * width + col. Células ausentes em linhas curtas contam como parede.
+        Invalida o pathfinder, a tabela de caminhos, o grafo de cruzamentos,
+        os campos de distância, o cache de caminhos e a camada estática, que
+        dependem do layout.
+        """
+        self._walkable = bytearray((self._grid() != 1).astype(np.uint8).tobytes())
+        self.invalidate_static_layer()
+        self._pathfinder = None
+        self._path_table = None
+        self._junction_graph = None
+        self._distance_fields = None
+        self._collision_masks = {}
+        self._path_cache.clear()
+
     @property
     def layout(self):
-        return self._layout
+        """
+        Vista somente leitura (height, width) do layout, sem cópia.
+        
+        Acompanha o mapa (ex.: pellets comidos), mas layout[row][col] = valor
+        levanta ValueError: as células só mudam pelos métodos do mapa
+        (remove_pellet_at, reset_map), que mantêm contadores, caminhabilidade
+        e camadas em dia. Para uma cópia editável use layout.tolist().
+        """
+        grid = self._grid().view()
+        grid.flags.writeable = False
+        return grid
+
+    @property
+    def pellet_count(self):
+        """Pellets normais restantes"""
+        return self._pellet_count
+
+    @property
+    def power_up_count(self):
+        """Power-ups restantes"""
+        return self._power_up_count
 
     @property
     def cell_size(self):
@@ -190,6 +357,100 @@ class Map:
     def height(self):
         return self._height
 
+    @property
+    def walkable(self):
+        """Array de caminhabilidade (row * width + col), apenas leitura"""
+        return self._walkable
+
+    @property
+    def pathfinder(self):
+        """Motor de pathfinding em grade (criado sob demanda para o layout atual)"""
+        if self._pathfinder is None:
+            self._pathfinder = GridAStar(self)
+        return self._pathfinder
+
+    @property
+    def junction_graph(self):
+        """Grafo comprimido de cruzamentos e corredores (criado sob demanda)"""
+        if self._junction_graph is None:
+            self._junction_graph = JunctionGraph(self)
+        return self._junction_graph
+
+    @property
+    def path_cache(self):
+        """Cache LRU de caminhos compartilhado pelos fantasmas (PathCache)"""
+        return self._path_cache
+
+    @property
+    def path_table(self):
+        """
+        Tabela de caminhos mínimos entre todas as células (PathTable).
+        
+        Carregada (memória, disco ou construção) só no primeiro acesso: mapas
+        que nunca são jogados, como o padrão de fallback, não pagam a BFS.
+        """
+        if self._path_table is None and self._width > 0:
+            self._path_table = PathTable.for_map(self)
+        return self._path_table
+
+    @property
+    def distance_fields(self):
+        """Campos de distância vetorizados (criados sob demanda)"""
+        if self._distance_fields is None:
+            self._distance_fields = DistanceFields(self)
+        return self._distance_fields
+
+    def get_distance_field(self, sources, slot="default"):
+        """
+        Campo de distâncias (em células) até a origem mais próxima.
+        
+        Args:
+            sources: Célula (col, row) ou lista de células de origem
+            slot: Nome do slot; o campo é reaproveitado enquanto as origens
+                do slot não mudarem
+            
+        Returns:
+            numpy.ndarray: Distâncias no formato (height, width), -1 em
+            paredes e células sem caminho
+        """
+        return self.distance_fields.get(sources, slot)
+
+    def get_distances(self, sources, cells, slot="default"):
+        """
+        Distâncias de várias células até as origens, numa consulta só.
+        
+        Returns:
+            list: Distância de cada célula (-1 se não houver caminho)
+        """
+        fields = self.distance_fields
+        return fields.lookup(fields.get(sources, slot), cells)
+
+    def get_flee_field(self, source_cell):
+        """Campo de fuga a partir de source_cell (menor = mais seguro)"""
+        return self.distance_fields.get_flee_field(source_cell)
+
+    def get_cell(self, position):
+        """Converte posição do mundo para (col, row) da grade"""
+        return (int(position.x // self._cell_size), int(position.y // self._cell_size))
+
+    def get_cells_in_radius(self, position, radius):
+        """
+        Células (col, row) que um círculo de raio dado pode tocar, em ordem de
+        linha (mesma ordem de get_pellets).
+        """
+        cs = self._cell_size
+        first_col = int((position.x - radius) // cs)
+        last_col = int((position.x + radius) // cs)
+        first_row = int((position.y - radius) // cs)
+        last_row = int((position.y + radius) // cs)
+        return [(col, row) for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+
+    def get_cell_center(self, col, row):
+        """Retorna o centro (Vector2D) da célula em coordenadas do mundo"""
+        return Vector2D(col * self._cell_size + self._cell_size // 2,
+                        row * self._cell_size + self._cell_size // 2)
+
     @property
     def metadata(self):
         """Retorna metadados do mapa."""
@@ -210,41 +471,20 @@ class Map:
         """
         Retorna lista de todos os mapas disponíveis ordenados por dificuldade.
         
+        Os metadados vêm do catálogo em cache; só mapas novos ou alterados
+        são relidos do disco.
+        
         Returns:
             List[dict]: Lista de mapas com informações básicas
         """
-        maps_dir = "assets/maps"
-        if not os.path.exists(maps_dir):
-            return []
-        
-        maps = []
-        for file_path in glob.glob(os.path.join(maps_dir, "*.json")):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                metadata = data.get('metadata', {})
-                maps.append({
-                    'file_path': file_path,
-                    'name': metadata.get('name', 'Mapa Sem Nome'),
-                    'difficulty': metadata.get('difficulty', 50),
-                    'description': metadata.get('description', ''),
-                    'width': metadata.get('width', '?'),
-                    'height': metadata.get('height', '?')
-                })
-            except Exception as e:
-                print(f"Erro ao carregar mapa {file_path}: {e}")
-        
-        # Ordena por dificuldade (fácil para difícil)
-        maps.sort(key=lambda m: m['difficulty'])
-        return maps
+        return MapCatalog("assets/maps").refresh()
 
     def load_default_map(self):
         """Carrega um mapa padrão para o jogo (fallback)"""
         print("Carregando mapa padrão como fallback...")
         
         # Layout do labirinto (1=parede, 0=caminho, 2=pellet, 3=power_up)
-        self._layout = [
+        layout = [
             [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
             [1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1],
             [1, 3, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 3, 1],
@@ -268,13 +508,15 @@ class Map:
             [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
         ]
         
-        self._update_dimensions()
+        self._set_layout(layout)
+        self._build_navigation()
         self._set_default_spawn_positions()
         self._metadata = {
             "name": "Mapa Padrão (Fallback)",
             "version": "1.0",
             "description": "Mapa carregado como fallback"
         }
+        self._snapshot = MapSnapshot(self)
 
     def load_map(self, map_file_path):
         """
@@ -290,17 +532,18 @@ class Map:
 
     def get_pellets(self):
         """Retorna lista de pellets baseada no layout do mapa"""
+        grid = self._grid()
+        rows, cols = np.nonzero((grid == 2) | (grid == 3))
+        half = self._cell_size // 2
+        xs = (cols * self._cell_size + half).tolist()
+        ys = (rows * self._cell_size + half).tolist()
+        
         pellets = []
-        for row_idx, row in enumerate(self._layout):
-            for col_idx, cell in enumerate(row):
-                if cell == 2:  # Pellet normal
-                    x = col_idx * self._cell_size + self._cell_size // 2
-                    y = row_idx * self._cell_size + self._cell_size // 2
-                    pellets.append({"position": Vector2D(x, y), "type": "normal", "value": 10})
-                elif cell == 3:  # Power-up
-                    x = col_idx * self._cell_size + self._cell_size // 2
-                    y = row_idx * self._cell_size + self._cell_size // 2
-                    pellets.append({"position": Vector2D(x, y), "type": "power_up", "value": 50})
+        for x, y, cell in zip(xs, ys, grid[rows, cols].tolist()):
+            if cell == 2:
+                pellets.append({"position": Vector2D(x, y), "type": "normal", "value": 10})
+            else:
+                pellets.append({"position": Vector2D(x, y), "type": "power_up", "value": 50})
         return pellets
 
     def get_spawn_position(self, entity_type="player"):
@@ -319,23 +562,67 @@ class Map:
         )
 
     def draw(self, screen, scale_factor=1.0, offset_x=0, offset_y=0):
-        """Desenha o mapa na tela com escala"""
+        """Desenha o mapa na tela com escala (um único blit da camada estática)"""
+        screen.blit(self.get_static_layer(scale_factor), (offset_x, offset_y))
+
+    def get_static_layer(self, scale_factor=1.0):
+        """
+        Retorna a superfície com paredes e chão já desenhados na escala pedida.
+        
+        Pellets não fazem parte da camada: as células de pellet ficam pretas,
+        como o corredor vazio que sobra depois de comidos. A superfície é
+        criada na primeira chamada para cada escala e guardada num cache LRU
+        das últimas STATIC_LAYER_CACHE_SIZE escalas, até as paredes mudarem.
+        Pode ser chamado pela thread de carga: a camada montada lá é
+        convertida para o formato da tela no primeiro uso na thread principal.
+        
+        Args:
+            scale_factor: Fator de escala da tela
+            
+        Returns:
+            pygame.Surface: Camada estática do labirinto
+        """
+        layer = self._static_layers.get(scale_factor)
+        if layer is not None:
+            if scale_factor in self._unconverted_layers and can_convert_surfaces():
+                layer = layer.convert()
+                self._static_layers[scale_factor] = layer
+                self._unconverted_layers.discard(scale_factor)
+            self._static_layers.move_to_end(scale_factor)
+            return layer
+        
         scaled_cell_size = int(self._cell_size * scale_factor)
+        layer_width = int((self._width - 1) * self._cell_size * scale_factor) + scaled_cell_size
+        layer_height = int((self._height - 1) * self._cell_size * scale_factor) + scaled_cell_size
+        layer = pygame.Surface((max(1, layer_width), max(1, layer_height)))
+        if can_convert_surfaces():
+            layer = layer.convert()
+        else:
+            self._unconverted_layers.add(scale_factor)
+        layer.fill((0, 0, 0))  # Preto para caminhos
         
-        for row_idx, row in enumerate(self._layout):
+        border_width = max(1, int(1 * scale_factor))
+        for row_idx in range(self._height):
+            row = self._cells[row_idx * self._width:(row_idx + 1) * self._width]
+            y = int(row_idx * self._cell_size * scale_factor)
             for col_idx, cell in enumerate(row):
-                x = int(col_idx * self._cell_size * scale_factor) + offset_x
-                y = int(row_idx * self._cell_size * scale_factor) + offset_y
-                rect = pygame.Rect(x, y, scaled_cell_size, scaled_cell_size)
-                
                 if cell == 1:  # Parede
+                    x = int(col_idx * self._cell_size * scale_factor)
+                    rect = pygame.Rect(x, y, scaled_cell_size, scaled_cell_size)
                     # Desenho procedural das paredes (sem sprites disponíveis)
-                    pygame.draw.rect(screen, (0, 0, 255), rect)  # Azul para paredes
-                    
-                    border_width = max(1, int(1 * scale_factor))
-                    pygame.draw.rect(screen, (0, 0, 200), rect, border_width)
-                elif cell == 0:  # Caminho vazio
-                    pygame.draw.rect(screen, (0, 0, 0), rect)  # Preto para caminhos
+                    pygame.draw.rect(layer, (0, 0, 255), rect)  # Azul para paredes
+                    pygame.draw.rect(layer, (0, 0, 200), rect, border_width)
+        
+        self._static_layers[scale_factor] = layer
+        if len(self._static_layers) > self.STATIC_LAYER_CACHE_SIZE:
+            evicted_scale, _ = self._static_layers.popitem(last=False)
+            self._unconverted_layers.discard(evicted_scale)
+        return layer
+
+    def invalidate_static_layer(self):
+        """Descarta as camadas estáticas de todas as escalas (ex.: paredes alteradas)"""
+        self._static_layers.clear()
+        self._unconverted_layers.clear()
 
     def is_wall(self, position: Vector2D):
         """Verifica se uma posição é uma parede"""
@@ -348,19 +635,16 @@ class Map:
             return True
         
         # Retorna True se for parede (1)
-        return self._layout[row][col] == 1
+        return self._cells[row * self._width + col] == 1
 
-    def is_valid_position(self, position: Vector2D, object_size=16, type="player"):
+    @staticmethod
+    def get_collision_margin(object_size=16, type="player"):
         """
-        Verifica se uma posição é válida considerando o tamanho do objeto
-        
+        Retorna a meia-largura da caixa de colisão usada em is_valid_position.
+
         Args:
-            position: Posição a ser verificada
             object_size: Tamanho do sprite (geralmente 16px)
             type: Tipo da entidade ("player", "ghost" ou "default")
-        
-        Returns:
-            bool: True se a posição for válida (sem colisão com paredes)
         """
         # Define diferentes margens para diferentes tipos de entidades
         # Margens menores = controle mais preciso, mas mais difícil passar por espaços apertados
@@ -368,26 +652,86 @@ class Map:
         if type == "player":
             # Player tem margem mais apertada para movimento mais preciso e controle responsivo
             # Permite ao jogador navegar por corredores estreitos com mais facilidade
-            half_size = object_size // 2.125
+            return object_size // 2.125
         elif type == "ghost":
             # Fantasmas têm margem ligeiramente mais generosa para movimento mais fluido
             # Evita que os fantasmas fiquem "presos" em situações de pathfinding
-            half_size = object_size // 3  
+            return object_size // 3
         else:
             # Default para outros objetos (pellets, itens especiais, etc.)
-            half_size = object_size //3 
-        
-        corners = [
-            Vector2D(position.x - half_size, position.y - half_size),
-            Vector2D(position.x + half_size, position.y - half_size),
-            Vector2D(position.x - half_size, position.y + half_size),
-            Vector2D(position.x + half_size, position.y + half_size)
-        ]
-        
-        for corner in corners:
-            if self.is_wall(corner):
-                return False
-        return True
+            return object_size //3
+
+    def get_collision_mask(self, object_size=16, type="player"):
+        """
+        Retorna a máscara de colisão por pixel para a margem da entidade.
+
+        A margem é sempre um valor inteiro, então todas as posições dentro do
+        mesmo pixel (floor(x), floor(y)) tocam as mesmas células: a máscara
+        guarda o resultado de is_valid_position para cada pixel do mapa.
+        Máscaras são criadas uma vez por margem e layout.
+
+        Returns:
+            bytes: 1 = posição válida, indexado por int(y) * largura_px + int(x)
+        """
+        key = (object_size, type)
+        mask = self._collision_masks.get(key)
+        if mask is None:
+            half_size = self.get_collision_margin(object_size, type)
+            for (other_size, other_type), other_mask in self._collision_masks.items():
+                if self.get_collision_margin(other_size, other_type) == half_size:
+                    mask = other_mask
+                    break
+            else:
+                mask = self._build_collision_mask(half_size)
+            self._collision_masks[key] = mask
+        return mask
+
+    def _build_collision_mask(self, half_size):
+        cs = self._cell_size
+        walkable = np.frombuffer(bytes(self._walkable), dtype=np.uint8).reshape(self._height, self._width)
+
+        # Borda de parede: cantos fora do mapa caem no índice 0 ou no último
+        padded = np.zeros((self._height + 2, self._width + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = walkable
+
+        pixels_x = np.arange(self._width * cs)
+        pixels_y = np.arange(self._height * cs)
+        low_cols = np.clip((pixels_x - half_size) // cs + 1, 0, self._width + 1).astype(np.intp)
+        high_cols = np.clip((pixels_x + half_size) // cs + 1, 0, self._width + 1).astype(np.intp)
+        low_rows = np.clip((pixels_y - half_size) // cs + 1, 0, self._height + 1).astype(np.intp)
+        high_rows = np.clip((pixels_y + half_size) // cs + 1, 0, self._height + 1).astype(np.intp)
+
+        # Separável: primeiro os cantos esquerdo/direito de cada linha da grade,
+        # depois cantos de cima/baixo copiando linhas inteiras
+        columns = padded[:, low_cols] & padded[:, high_cols]
+        mask = columns[low_rows] & columns[high_rows]
+        return mask.tobytes()
+
+    def is_valid_point(self, x, y, object_size=16, type="player"):
+        """Mesmo que is_valid_position, recebendo as coordenadas separadas"""
+        if x < 0 or y < 0:
+            return False
+        pixel_width = self._width * self._cell_size
+        col = int(x)
+        row = int(y)
+        if col >= pixel_width or row >= self._height * self._cell_size:
+            return False
+        mask = self._collision_masks.get((object_size, type)) or self.get_collision_mask(object_size, type)
+        return mask[row * pixel_width + col] == 1
+
+    def is_valid_position(self, position: Vector2D, object_size=16, type="player"):
+        """
+        Verifica se uma posição é válida considerando o tamanho do objeto
+
+        Args:
+            position: Posição a ser verificada
+            object_size: Tamanho do sprite (geralmente 16px)
+            type: Tipo da entidade ("player", "ghost" ou "default")
+
+        Returns:
+            bool: True se a posição for válida (sem colisão com paredes)
+        """
+        return self.is_valid_point(position.x, position.y, object_size, type)
 
     def remove_pellet_at(self, position: Vector2D):
         """Remove um pellet na posição especificada"""
@@ -395,22 +739,60 @@ class Map:
         row = int(position.y // self._cell_size)
         
         if 0 <= row < self._height and 0 <= col < self._width:
-            if self._layout[row][col] in [2, 3]:  # Se é pellet ou power-up
-                self._layout[row][col] = 0  # Torna caminho vazio
-                return True
+            index = row * self._width + col
+            cell = self._cells[index]
+            if cell == 2:
+                self._pellet_count -= 1
+            elif cell == 3:
+                self._power_up_count -= 1
+            else:
+                return False
+            self._cells[index] = 0  # Torna caminho vazio
+            return True
         return False
 
     def count_pellets(self):
-        """Conta quantos pellets restam no mapa"""
-        count = 0
-        for row in self._layout:
-            for cell in row:
-                if cell in [2, 3]:  # Pellet normal ou power-up
-                    count += 1
-        return count 
+        """Conta quantos pellets restam no mapa (pellets normais e power-ups)"""
+        return self._pellet_count + self._power_up_count
     
+    def _restore_snapshot(self, snapshot, rebuild_navigation=False):
+        """
+        Restaura o estado inicial a partir de um snapshot em memória.
+        
+        Args:
+            snapshot: MapSnapshot de origem
+            rebuild_navigation: Recria os dados de navegação (mapa diferente
+                do atual); no reset do mesmo mapa as paredes não mudam
+        """
+        if len(self._cells) == len(snapshot.cells) and not rebuild_navigation:
+            self._cells[:] = snapshot.cells
+        else:
+            self._cells = bytearray(snapshot.cells)
+        self._pellet_count = snapshot.pellet_count
+        self._power_up_count = snapshot.power_up_count
+        self._spawn_positions = {entity: Vector2D(x, y) for entity, (x, y) in snapshot.spawn_positions.items()}
+        
+        if rebuild_navigation:
+            self._metadata = dict(snapshot.metadata)
+            self._cell_size = snapshot.cell_size
+            self._width = snapshot.width
+            self._height = snapshot.height
+            self._build_walkability()
+            self._collision_masks = dict(snapshot.collision_masks)
+            self._build_navigation(walkability_ready=True)
+        self._snapshot = snapshot
+
     def reset_map(self):
-        """Reseta o mapa para o estado inicial, restaurando todos os pellets"""
+        """
+        Reseta o mapa para o estado inicial, restaurando todos os pellets.
+        
+        Usa o snapshot em memória (uma cópia de buffer, sem I/O); só relê o
+        arquivo se o mapa ainda não tiver snapshot.
+        """
+        if self._snapshot is not None:
+            self._restore_snapshot(self._snapshot)
+            return
+        
         # Tenta recarregar o mapa do JSON original
         if hasattr(self, '_original_map_path'):
             if self.load_from_json(self._original_map_path):
@@ -0,0 +1,164 @@
+"""
+Catálogo dos mapas disponíveis.
+
+Guarda em disco (manifesto JSON) os metadados de cada mapa junto com o
+mtime e o tamanho do arquivo. Na próxima varredura só os arquivos novos ou
+alterados são relidos; os demais vêm do manifesto sem abrir o JSON.
+"""
+import hashlib
+import json
+import os
+import time
+from .map_format import CompiledMap
+
+
+class MapCatalog:
+    """Índice incremental dos metadados dos mapas de uma pasta"""
+
+    CACHE_DIR = os.path.join("cache", "maps")
+    FORMAT_VERSION = 1
+
+    def __init__(self, maps_dir="assets/maps", manifest_path=None):
+        """
+        Args:
+            maps_dir: Pasta com os mapas JSON
+            manifest_path: Arquivo do manifesto (padrão: um por pasta em CACHE_DIR)
+        """
+        self._maps_dir = maps_dir
+        if manifest_path is None:
+            digest = hashlib.sha1(os.path.abspath(maps_dir).encode("utf-8")).hexdigest()[:8]
+            manifest_path = os.path.join(self.CACHE_DIR, f"catalog-{digest}.json")
+        self._manifest_path = manifest_path
+        self._entries = None
+        self._scanned = 0
+        self._reread = 0
+        self._removed = 0
+        self._scan_time_ms = 0.0
+
+    def refresh(self):
+        """
+        Varre a pasta e relê só os mapas novos ou alterados.
+
+        Returns:
+            List[dict]: Mapas válidos ordenados por dificuldade
+        """
+        start_time = time.perf_counter()
+        if self._entries is None:
+            self._entries = self._read_manifest()
+
+        entries = {}
+        reread = 0
+        try:
+            with os.scandir(self._maps_dir) as scan:
+                files = [entry for entry in scan if entry.name.endswith(".json") and entry.is_file()]
+        except OSError:
+            files = []
+
+        for file_entry in files:
+            file_path = os.path.join(self._maps_dir, file_entry.name)
+            stat = file_entry.stat()
+            cached = self._entries.get(file_path)
+            if cached is not None and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                entries[file_path] = cached
+                continue
+            entry = self._read_entry(file_path)
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            entries[file_path] = entry
+            reread += 1
+
+        self._removed = len(set(self._entries) - set(entries))
+        changed = reread > 0 or self._removed > 0
+        self._entries = entries
+        self._scanned = len(files)
+        self._reread = reread
+        if changed:
+            self._write_manifest()
+        self._scan_time_ms = (time.perf_counter() - start_time) * 1000
+        return self.get_maps()
+
+    def get_maps(self):
+        """Mapas válidos da última varredura, ordenados por dificuldade"""
+        maps = [
+            {key: entry[key] for key in ("file_path", "name", "difficulty", "description", "width", "height")}
+            for entry in (self._entries or {}).values() if "error" not in entry
+        ]
+        maps.sort(key=lambda m: (m['difficulty'], m['file_path']))
+        return maps
+
+    def _read_entry(self, file_path):
+        """
+        Lê os metadados de um mapa (da versão compilada, se atualizada).
+
+        Returns:
+            dict: Entrada do catálogo (com "error" se o arquivo for ilegível)
+        """
+        compiled = CompiledMap.load_for(file_path)
+        try:
+            if compiled is not None:
+                metadata = compiled.metadata
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f).get('metadata', {})
+        except Exception as e:
+            print(f"Erro ao carregar mapa {file_path}: {e}")
+            return {"file_path": file_path, "error": str(e)}
+
+        return {
+            "file_path": file_path,
+            "name": metadata.get('name', 'Mapa Sem Nome'),
+            "difficulty": metadata.get('difficulty', 50),
+            "description": metadata.get('description', ''),
+            "width": metadata.get('width', '?'),
+            "height": metadata.get('height', '?')
+        }
+
+    def _read_manifest(self):
+        """Lê o manifesto salvo; retorna {} se ausente, de outra versão ou inválido"""
+        if not os.path.exists(self._manifest_path):
+            return {}
+        try:
+            with open(self._manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get("version") != self.FORMAT_VERSION or manifest.get("maps_dir") != self._maps_dir:
+                return {}
+            return {entry["file_path"]: entry for entry in manifest["maps"]}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Aviso: catálogo de mapas inválido ({self._manifest_path}): {e}")
+            return {}
+
+    def _write_manifest(self):
+        """Salva o manifesto (escrita atômica)"""
+        try:
+            manifest_dir = os.path.dirname(self._manifest_path)
+            if manifest_dir:
+                os.makedirs(manifest_dir, exist_ok=True)
+            temp_path = f"{self._manifest_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": self.FORMAT_VERSION,
+                    "maps_dir": self._maps_dir,
+                    "maps": list(self._entries.values())
+                }, f, ensure_ascii=False)
+            os.replace(temp_path, self._manifest_path)
+        except OSError as e:
+            print(f"Aviso: não foi possível salvar o catálogo de mapas em {self._manifest_path}: {e}")
+
+    @property
+    def manifest_path(self):
+        return self._manifest_path
+
+    @property
+    def scan_time_ms(self):
+        """Tempo da última varredura (manifesto, stat e releituras)"""
+        return self._scan_time_ms
+
+    def get_stats(self):
+        """Retorna contadores da última varredura"""
+        return {
+            "scanned": self._scanned,
+            "reread": self._reread,
+            "removed": self._removed,
+            "maps": len(self.get_maps()),
+            "scan_time_ms": self._scan_time_ms
+        }
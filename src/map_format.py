@@ -0,0 +1,204 @@
+"""
+Formato binário compilado dos mapas.
+
+O JSON continua sendo o formato de origem (editado pelo map_editor); o
+arquivo compilado é um cache com cabeçalho fixo e as células em bytes crus,
+lido via mmap sem parse nem validação célula a célula em Python.
+
+Layout do arquivo (little-endian):
+    cabeçalho  magic, versão, largura, altura, cell_size, dificuldade,
+               número de spawns, tamanho dos metadados, mtime (ns) e
+               tamanho do JSON de origem
+    spawns     nome (16 bytes) e coluna/linha de cada spawn
+    metadados  JSON UTF-8 com o bloco "metadata" do mapa
+    células    largura * altura bytes (0 vazio, 1 parede, 2 pellet, 3 power-up)
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import numpy as np
+
+
+class CompiledMap:
+    """Dados de um mapa lido do formato compilado"""
+
+    CACHE_DIR = os.path.join("cache", "maps")
+    EXTENSION = ".pmap"
+    FORMAT_VERSION = 1
+    _MAGIC = b"PMAP"
+    _HEADER = struct.Struct("<4sHHHHhHIQQ")
+    _SPAWN = struct.Struct("<16sHH")
+    MAX_CELL_VALUE = 3
+
+    def __init__(self, width, height, cell_size, difficulty, metadata, spawn_positions, cells):
+        """
+        Args:
+            width, height: Dimensões do mapa em células
+            cell_size: Tamanho da célula em pixels (0 se o JSON não define)
+            difficulty: Dificuldade declarada nos metadados
+            metadata: Bloco "metadata" do JSON de origem
+            spawn_positions: Spawns em coordenadas de grade ({nome: {"x", "y"}})
+            cells: Células em bytes (row * width + col)
+        """
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.difficulty = difficulty
+        self.metadata = metadata
+        self.spawn_positions = spawn_positions
+        self.cells = cells
+
+    @classmethod
+    def path_for(cls, source_path):
+        """
+        Caminho do arquivo compilado de um JSON de mapa.
+
+        O nome leva um hash do caminho absoluto para que mapas homônimos em
+        pastas diferentes não compartilhem o mesmo arquivo.
+        """
+        source_path = os.path.abspath(source_path)
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        digest = hashlib.sha1(source_path.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(cls.CACHE_DIR, f"{stem}-{digest}{cls.EXTENSION}")
+
+    @classmethod
+    def load_for(cls, source_path):
+        """
+        Carrega a versão compilada de um JSON de mapa, se estiver atualizada.
+
+        Returns:
+            CompiledMap ou None (ausente, desatualizado ou inválido)
+        """
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
+            return None
+        return cls.read(cls.path_for(source_path), source_stat)
+
+    @classmethod
+    def read(cls, path, source_stat=None):
+        """
+        Lê um arquivo compilado via mmap.
+
+        Args:
+            path: Caminho do arquivo .pmap
+            source_stat: os.stat do JSON de origem; se informado, arquivos
+                compilados de outra versão do JSON são ignorados
+
+        Returns:
+            CompiledMap ou None se ausente, desatualizado ou inválido
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                (magic, version, width, height, cell_size, difficulty, spawn_count,
+                 metadata_size, source_mtime_ns, source_size) = cls._HEADER.unpack_from(data)
+                if magic != cls._MAGIC or version != cls.FORMAT_VERSION:
+                    return None
+                if source_stat is not None and (source_mtime_ns, source_size) != (source_stat.st_mtime_ns,
+                                                                                   source_stat.st_size):
+                    return None
+
+                offset = cls._HEADER.size
+                spawn_positions = {}
+                for _ in range(spawn_count):
+                    name, col, row = cls._SPAWN.unpack_from(data, offset)
+                    spawn_positions[name.rstrip(b"\0").decode("utf-8")] = {"x": col, "y": row}
+                    offset += cls._SPAWN.size
+
+                metadata = json.loads(data[offset:offset + metadata_size].decode("utf-8"))
+                offset += metadata_size
+
+                cells = data[offset:offset + width * height]
+                if width == 0 or height == 0 or len(cells) != width * height:
+                    return None
+                if np.frombuffer(cells, dtype=np.uint8).max() > cls.MAX_CELL_VALUE:
+                    return None
+        except (OSError, ValueError, struct.error, UnicodeDecodeError) as e:
+            print(f"Aviso: mapa compilado inválido ({path}): {e}")
+            return None
+
+        return cls(width, height, cell_size, difficulty, metadata, spawn_positions, cells)
+
+    @classmethod
+    def compile(cls, source_path, output_path=None):
+        """
+        Compila um JSON de mapa para o formato binário (escrita atômica).
+
+        Args:
+            source_path: Caminho do JSON de origem
+            output_path: Destino (padrão: path_for(source_path))
+
+        Returns:
+            str: Caminho do arquivo gerado
+
+        Raises:
+            OSError: Falha de leitura ou escrita
+            ValueError: JSON inválido ou estrutura de mapa inválida
+        """
+        source_stat = os.stat(source_path)
+        with open(source_path, "r", encoding="utf-8") as f:
+            map_data = json.load(f)
+        return cls.write(map_data, source_stat, output_path or cls.path_for(source_path))
+
+    @classmethod
+    def write(cls, map_data, source_stat, output_path):
+        """
+        Grava dados de mapa já lidos do JSON no formato binário.
+
+        Args:
+            map_data: Conteúdo do JSON de origem
+            source_stat: os.stat do JSON (registrado para checar atualização)
+            output_path: Destino do arquivo compilado
+
+        Returns:
+            str: Caminho do arquivo gerado
+
+        Raises:
+            OSError: Falha de escrita
+            ValueError: Estrutura de mapa inválida
+        """
+        layout = map_data.get("layout")
+        if not isinstance(layout, list) or len(layout) == 0 or not isinstance(layout[0], list):
+            raise ValueError("layout deve ser uma lista não-vazia de linhas")
+        try:
+            grid = np.array(layout)
+        except ValueError:
+            raise ValueError("linhas do layout com tamanhos inconsistentes")
+        if grid.ndim != 2 or grid.size == 0 or grid.dtype.kind not in "iu":
+            raise ValueError("linhas do layout com tamanhos inconsistentes ou valores não inteiros")
+        if grid.min() < 0 or grid.max() > cls.MAX_CELL_VALUE:
+            raise ValueError(f"valores de célula devem estar entre 0 e {cls.MAX_CELL_VALUE}")
+        height, width = grid.shape
+
+        metadata = map_data.get("metadata", {})
+        cell_size = int(metadata.get("cell_size", 0))
+        difficulty = int(metadata.get("difficulty", 0))
+
+        spawns = []
+        for name, position in map_data.get("spawn_positions", {}).items():
+            if isinstance(position, dict) and "x" in position and "y" in position:
+                encoded = name.encode("utf-8")
+                if len(encoded) > cls._SPAWN.size - 4:
+                    raise ValueError(f"nome de spawn muito longo: {name}")
+                spawns.append(cls._SPAWN.pack(encoded, int(position["x"]), int(position["y"])))
+
+        metadata_bytes = json.dumps(metadata, ensure_ascii=False).encode("utf-8")
+
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        temp_path = f"{output_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(cls._HEADER.pack(cls._MAGIC, cls.FORMAT_VERSION, width, height, cell_size, difficulty,
+                                     len(spawns), len(metadata_bytes), source_stat.st_mtime_ns,
+                                     source_stat.st_size))
+            for entry in spawns:
+                f.write(entry)
+            f.write(metadata_bytes)
+            f.write(grid.astype(np.uint8).tobytes())
+        os.replace(temp_path, output_path)
+        return output_path
@@ -0,0 +1,1536 @@
+import hashlib
+import heapq
+import math
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
+import numpy as np
+from .utils import Vector2D, Direction
+
+
+class _HeapEntry:
+    """
+    Entrada da fila de prioridade do GridAStar.
+
+    Compara apenas pelo f_cost, como o AStarNode, para que empates sejam
+    resolvidos na mesma ordem do AStar original (veja o GridAStar).
+    """
+    __slots__ = ("f_cost", "index")
+
+    def __init__(self, f_cost, index):
+        self.f_cost = f_cost
+        self.index = index
+
+    def __lt__(self, other):
+        return self.f_cost < other.f_cost
+
+
+def _manhattan(dx, dy):
+    return abs(dx) + abs(dy)
+
+
+def _euclidean(dx, dy):
+    return math.sqrt(dx * dx + dy * dy)
+
+
+def _diagonal(dx, dy):
+    return max(abs(dx), abs(dy))
+
+
+def _walkable_neighbors(walkable, width, index):
+    """Células livres vizinhas de index (UP, DOWN, LEFT, RIGHT) num array row * width + col"""
+    col = index % width
+    neighbors = []
+    if index >= width and walkable[index - width]:
+        neighbors.append(index - width)
+    if index < len(walkable) - width and walkable[index + width]:
+        neighbors.append(index + width)
+    if col > 0 and walkable[index - 1]:
+        neighbors.append(index - 1)
+    if col < width - 1 and walkable[index + 1]:
+        neighbors.append(index + 1)
+    return neighbors
+
+
+class GridAStar:
+    """
+    A* sobre índices inteiros de célula e um array de caminhabilidade pré-calculado.
+
+    Substitui o AStar.find_path no dia a dia dos fantasmas: em vez de expandir
+    posições Vector2D e chamar Map.is_valid_position para cada vizinho, trabalha
+    com índices de uma grade com borda de uma célula (sem checagem de limites)
+    e máscaras de colisão calculadas uma única vez por mapa.
+
+    Os nós do A* original ficam em start + k * cell_size, ou seja, herdam o
+    deslocamento da posição inicial dentro da célula. Esse deslocamento define
+    quais células os quatro cantos do fantasma tocam, então existe uma máscara
+    para cada classe de deslocamento (no máximo 9). O caminho tem sempre o
+    mesmo comprimento (ótimo) que o do AStar.find_path. O desempate entre
+    caminhos de mesmo custo só é garantido igual com o início em múltiplos de
+    meio pixel (ex.: os passos de 1.5 px dos fantasmas): o AStar soma cell_size
+    à posição a cada passo em ponto flutuante, e com frações quaisquer esse
+    arredondamento muda as heurísticas e até quais nós ele considera iguais.
+    O benchmark_pathfinding.py confere as duas situações.
+    """
+
+    _HEURISTICS = {
+        "manhattan": _manhattan,
+        "euclidean": _euclidean,
+        "diagonal": _diagonal
+    }
+
+    def __init__(self, game_map, object_size=16, entity_type="ghost"):
+        """
+        Args:
+            game_map: Instância do mapa (usa game_map.walkable)
+            object_size: Tamanho do objeto usado na checagem de colisão
+            entity_type: Tipo da entidade ("player", "ghost" ou "default")
+        """
+        self._cell_size = game_map.cell_size
+        self._map_width = game_map.width
+        self._map_height = game_map.height
+        self._walkable = game_map.walkable
+        self._half_size = game_map.get_collision_margin(object_size, entity_type)
+
+        # Grade com borda: índice = (row + 1) * stride + (col + 1)
+        self._stride = self._map_width + 2
+        self._size = self._stride * (self._map_height + 2)
+        self._padded_cols = [i % self._stride for i in range(self._size)]
+        self._padded_rows = [i // self._stride for i in range(self._size)]
+
+        self._masks = {}
+        self._components = {}
+        self._nodes_expanded = 0
+
+    @property
+    def stride(self):
+        return self._stride
+
+    @property
+    def nodes_expanded(self):
+        """Nós expandidos na última busca"""
+        return self._nodes_expanded
+
+    def cell_index(self, col, row):
+        """Converte (col, row) do mapa para índice da grade com borda"""
+        return (row + 1) * self._stride + (col + 1)
+
+    def index_to_cell(self, index):
+        """Converte índice da grade com borda para (col, row) do mapa"""
+        return (self._padded_cols[index] - 1, self._padded_rows[index] - 1)
+
+    def _offset_class(self, start):
+        """
+        Calcula quais células os cantos tocam relativo à célula do nó.
+
+        Returns:
+            tuple: (lx, hx, ly, hy) com deslocamentos de coluna/linha dos cantos
+        """
+        cs = self._cell_size
+        half = self._half_size
+        rel_x = start.x - (start.x // cs) * cs
+        rel_y = start.y - (start.y // cs) * cs
+        return (
+            int((rel_x - half) // cs), int((rel_x + half) // cs),
+            int((rel_y - half) // cs), int((rel_y + half) // cs)
+        )
+
+    def _get_mask(self, offset_class):
+        """Retorna (criando se necessário) a máscara de nós válidos para a classe"""
+        mask = self._masks.get(offset_class)
+        if mask is not None:
+            return mask
+
+        lx, hx, ly, hy = offset_class
+        width, height = self._map_width, self._map_height
+        walkable = self._walkable
+
+        def free(col, row):
+            return 0 <= col < width and 0 <= row < height and walkable[row * width + col]
+
+        mask = bytearray(self._size)
+        for row in range(height):
+            base = (row + 1) * self._stride + 1
+            for col in range(width):
+                if (free(col + lx, row + ly) and free(col + hx, row + ly) and
+                        free(col + lx, row + hy) and free(col + hx, row + hy)):
+                    mask[base + col] = 1
+
+        self._masks[offset_class] = mask
+        self._components[offset_class] = self._label_components(mask)
+        return mask
+
+    def _label_components(self, mask):
+        """Rotula componentes conexas da máscara (0 = inválido)"""
+        stride = self._stride
+        labels = [0] * self._size
+        label = 0
+        for seed in range(self._size):
+            if not mask[seed] or labels[seed]:
+                continue
+            label += 1
+            labels[seed] = label
+            stack = [seed]
+            while stack:
+                current = stack.pop()
+                for neighbor in (current - stride, current + stride, current - 1, current + 1):
+                    if mask[neighbor] and not labels[neighbor]:
+                        labels[neighbor] = label
+                        stack.append(neighbor)
+        return labels
+
+    def _goal_index(self, start, goal, start_col, start_row):
+        """
+        Encontra o nó da grade que satisfaz a tolerância de 8 pixels do objetivo.
+
+        Como os nós estão espaçados de cell_size, no máximo um nó está a menos
+        de 8 pixels do objetivo.
+        """
+        cs = self._cell_size
+        base_i = math.floor((goal.x - start.x) / cs)
+        base_j = math.floor((goal.y - start.y) / cs)
+        for i in (base_i, base_i + 1):
+            for j in (base_j, base_j + 1):
+                dx = (start.x + i * cs) - goal.x
+                dy = (start.y + j * cs) - goal.y
+                if math.sqrt(dx * dx + dy * dy) < 8:
+                    col, row = start_col + i, start_row + j
+                    if -1 <= col <= self._map_width and -1 <= row <= self._map_height:
+                        return self.cell_index(col, row)
+                    return None
+        return None
+
+    def find_path(self, start, goal, heuristic_type="manhattan"):
+        """
+        Encontra o caminho mais curto entre duas posições em pixels.
+
+        Args:
+            start: Vector2D posição inicial (em pixels)
+            goal: Vector2D posição objetivo (em pixels)
+            heuristic_type: "manhattan", "euclidean" ou "diagonal"
+
+        Returns:
+            List[tuple]: Células (col, row) do caminho, da célula de start até
+            a do objetivo (vazia se não houver caminho)
+        """
+        cs = self._cell_size
+        stride = self._stride
+        start_col = int(start.x // cs)
+        start_row = int(start.y // cs)
+        if not (0 <= start_col < self._map_width and 0 <= start_row < self._map_height):
+            return []
+
+        start_index = self.cell_index(start_col, start_row)
+        goal_index = self._goal_index(start, goal, start_col, start_row)
+        if goal_index is None:
+            return []
+        if goal_index == start_index:
+            return [(start_col, start_row)]
+
+        offset_class = self._offset_class(start)
+        mask = self._get_mask(offset_class)
+        if not mask[goal_index]:
+            return []
+
+        # Sem caminho possível: evita explorar toda a componente
+        labels = self._components[offset_class]
+        goal_label = labels[goal_index]
+        reachable = {labels[n] for n in (start_index, start_index - stride, start_index + stride,
+                                         start_index - 1, start_index + 1)}
+        if goal_label not in reachable:
+            return []
+
+        # Heurística separável por eixo (índices da grade com borda); com o
+        # início em múltiplos de meio pixel é igual bit a bit à do AStar
+        cols, rows = self._padded_cols, self._padded_rows
+        dx = [(start.x + (col - 1 - start_col) * cs) - goal.x for col in range(self._stride)]
+        dy = [(start.y + (row - 1 - start_row) * cs) - goal.y for row in range(self._map_height + 2)]
+        heuristic = self._HEURISTICS.get(heuristic_type, _manhattan)
+        if heuristic is _manhattan:
+            dx = [abs(v) for v in dx]
+            dy = [abs(v) for v in dy]
+
+        g_costs = {start_index: 0}
+        parents = {start_index: -1}
+        closed = set()
+        open_list = [_HeapEntry(heuristic(dx[start_col + 1], dy[start_row + 1]), start_index)]
+        push, pop = heapq.heappush, heapq.heappop
+        expanded = 0
+
+        while open_list:
+            current = pop(open_list).index
+            if current == goal_index:
+                break
+
+            closed.add(current)
+            expanded += 1
+            g_cost = g_costs[current] + cs
+
+            # UP, DOWN, LEFT, RIGHT (mesma ordem do AStar.get_neighbors)
+            for neighbor in (current - stride, current + stride, current - 1, current + 1):
+                if not mask[neighbor] or neighbor in closed:
+                    continue
+                if neighbor in g_costs and g_cost >= g_costs[neighbor]:
+                    continue
+
+                g_costs[neighbor] = g_cost
+                parents[neighbor] = current
+                if heuristic is _manhattan:
+                    h_cost = dx[cols[neighbor]] + dy[rows[neighbor]]
+                else:
+                    h_cost = heuristic(dx[cols[neighbor]], dy[rows[neighbor]])
+                push(open_list, _HeapEntry(g_cost + h_cost, neighbor))
+        else:
+            self._nodes_expanded = expanded
+            return []
+
+        self._nodes_expanded = expanded
+        path = []
+        current = goal_index
+        while current != -1:
+            path.append((cols[current] - 1, rows[current] - 1))
+            current = parents[current]
+        path.reverse()
+        return path
+
+    def to_cell_centers(self, cells):
+        """Converte um caminho de células em waypoints no centro de cada célula"""
+        cs = self._cell_size
+        return [Vector2D(col * cs + cs // 2, row * cs + cs // 2) for col, row in cells]
+
+    def to_waypoints(self, cells, start):
+        """
+        Converte um caminho de células em waypoints (Vector2D) para o fantasma.
+
+        Os waypoints mantêm o deslocamento de start dentro da célula, igual aos
+        nós do AStar original.
+        """
+        if not cells:
+            return []
+        cs = self._cell_size
+        start_col, start_row = cells[0]
+        return [
+            Vector2D(start.x + (col - start_col) * cs, start.y + (row - start_row) * cs)
+            for col, row in cells
+        ]
+
+
+class JunctionGraph:
+    """
+    Grafo comprimido do labirinto: nós são cruzamentos e becos sem saída,
+    arestas são os corredores entre eles, com o comprimento em células.
+
+    Como os mapas são quase só corredores de uma célula, a busca no grafo
+    expande apenas os cruzamentos em vez de cada célula do corredor. As
+    células dos corredores são interpoladas de volta no caminho final, que
+    tem o mesmo formato (lista de (col, row)) do GridAStar.
+
+    A busca é centro a centro de célula, como as consultas do PathCache:
+    com a margem de colisão do fantasma, o centro de uma célula livre não
+    toca células vizinhas, então o grafo usa diretamente game_map.walkable.
+    """
+
+    _HEURISTICS = GridAStar._HEURISTICS
+    _START = -1
+    _GOAL = -2
+
+    def __init__(self, game_map):
+        """
+        Args:
+            game_map: Instância do mapa (usa game_map.walkable)
+        """
+        self._width = game_map.width
+        self._height = game_map.height
+        self._walkable = game_map.walkable
+        self._edges = []          # células (índices row * width + col) de cada corredor
+        self._adjacency = {}      # nó -> [(vizinho, aresta, k_origem, k_destino)]
+        self._corridor_cells = {} # célula interna de corredor -> (aresta, k)
+        self._components = [0] * len(self._walkable)
+        self._nodes_expanded = 0
+        self._build()
+
+    @property
+    def node_count(self):
+        return len(self._adjacency)
+
+    @property
+    def edge_count(self):
+        return len(self._edges)
+
+    @property
+    def nodes_expanded(self):
+        """Nós do grafo expandidos na última busca"""
+        return self._nodes_expanded
+
+    def _build(self):
+        walkable = self._walkable
+        neighbors = {i: _walkable_neighbors(walkable, self._width, i)
+                     for i in range(len(walkable)) if walkable[i]}
+        nodes = [i for i, adjacent in neighbors.items() if len(adjacent) != 2]
+        walked = set()
+
+        while True:
+            for node in nodes:
+                self._adjacency.setdefault(node, [])
+                for first in neighbors[node]:
+                    if (node, first) not in walked:
+                        self._walk_corridor(node, first, neighbors, walked)
+
+            # Ciclos sem cruzamento: promove uma célula de cada ciclo a nó
+            orphans = [i for i in neighbors
+                       if i not in self._adjacency and i not in self._corridor_cells]
+            if not orphans:
+                break
+            nodes = orphans[:1]
+
+        # Componentes conexas: pares sem caminho são descartados sem busca
+        label = 0
+        for seed in neighbors:
+            if self._components[seed]:
+                continue
+            label += 1
+            self._components[seed] = label
+            stack = [seed]
+            while stack:
+                current = stack.pop()
+                for neighbor in neighbors[current]:
+                    if not self._components[neighbor]:
+                        self._components[neighbor] = label
+                        stack.append(neighbor)
+
+    def _walk_corridor(self, node, first, neighbors, walked):
+        """Percorre o corredor a partir de node até o próximo nó e registra a aresta"""
+        cells = [node, first]
+        previous, current = node, first
+        while current not in self._adjacency and len(neighbors[current]) == 2:
+            a, b = neighbors[current]
+            previous, current = current, (b if a == previous else a)
+            cells.append(current)
+        self._adjacency.setdefault(current, [])
+
+        edge = len(self._edges)
+        length = len(cells) - 1
+        self._edges.append(cells)
+        self._adjacency[node].append((current, edge, 0, length))
+        if current != node:
+            self._adjacency[current].append((node, edge, length, 0))
+        walked.add((node, first))
+        walked.add((current, previous))
+        for k in range(1, length):
+            self._corridor_cells[cells[k]] = (edge, k)
+
+    def _links(self, index):
+        """
+        Ligações de uma célula com o grafo.
+
+        Returns:
+            list: [(nó, aresta, k_célula, k_nó)] para uma célula de corredor,
+            ou None se a célula já é um nó
+        """
+        if index in self._adjacency:
+            return None
+        edge, k = self._corridor_cells[index]
+        cells = self._edges[edge]
+        return [(cells[0], edge, k, 0), (cells[-1], edge, k, len(cells) - 1)]
+
+    def find_path(self, start_cell, goal_cell, heuristic_type="manhattan"):
+        """
+        Encontra o caminho mais curto entre duas células livres.
+
+        Args:
+            start_cell: (col, row) inicial
+            goal_cell: (col, row) objetivo
+            heuristic_type: "manhattan", "euclidean" ou "diagonal"
+
+        Returns:
+            List[tuple]: Células (col, row) do caminho, de start_cell até
+            goal_cell (vazia se não houver caminho)
+        """
+        width, height = self._width, self._height
+        self._nodes_expanded = 0
+        for col, row in (start_cell, goal_cell):
+            if not (0 <= col < width and 0 <= row < height) or not self._walkable[row * width + col]:
+                return []
+        if start_cell == goal_cell:
+            return [start_cell]
+
+        start = start_cell[1] * width + start_cell[0]
+        goal_col, goal_row = goal_cell
+        goal = goal_row * width + goal_col
+        if self._components[start] != self._components[goal]:
+            return []
+        heuristic = self._HEURISTICS.get(heuristic_type, _manhattan)
+
+        # Objetivo no meio de um corredor vira um nó virtual ligado às pontas
+        goal_links = self._links(goal)
+        goal_edges = {}
+        if goal_links is not None:
+            for node, edge, k_goal, k_node in goal_links:
+                goal_edges.setdefault(node, []).append((edge, k_node, k_goal))
+            goal = self._GOAL
+
+        g_costs = {}
+        parents = {}
+        open_list = []
+        counter = 0
+
+        def relax(node, g_cost, parent):
+            nonlocal counter
+            if node in g_costs and g_cost >= g_costs[node]:
+                return
+            g_costs[node] = g_cost
+            parents[node] = parent
+            if node == goal:
+                h_cost = 0
+            else:
+                h_cost = heuristic(node % width - goal_col, node // width - goal_row)
+            counter += 1
+            # Empate no f_cost: prefere o nó mais adiantado no caminho
+            heapq.heappush(open_list, (g_cost + h_cost, -g_cost, counter, node))
+
+        start_links = self._links(start)
+        if start_links is None:
+            relax(start, 0, None)
+        else:
+            for node, edge, k_start, k_node in start_links:
+                relax(node, abs(k_node - k_start), (self._START, edge, k_start, k_node))
+            # Início e objetivo no mesmo corredor: caminho direto pelo corredor
+            if goal_links is not None and goal_links[0][1] == start_links[0][1]:
+                k_goal = goal_links[0][2]
+                relax(goal, abs(k_goal - start_links[0][2]),
+                      (self._START, start_links[0][1], start_links[0][2], k_goal))
+
+        closed = set()
+        expanded = 0
+        while open_list:
+            current = heapq.heappop(open_list)[3]
+            if current in closed:
+                continue
+            if current == goal:
+                break
+            closed.add(current)
+            expanded += 1
+            g_cost = g_costs[current]
+
+            for neighbor, edge, k_from, k_to in self._adjacency[current]:
+                if neighbor not in closed:
+                    relax(neighbor, g_cost + abs(k_to - k_from), (current, edge, k_from, k_to))
+            for edge, k_node, k_goal in goal_edges.get(current, ()):
+                relax(goal, g_cost + abs(k_goal - k_node), (current, edge, k_node, k_goal))
+        else:
+            self._nodes_expanded = expanded
+            return []
+
+        self._nodes_expanded = expanded
+        return self._reconstruct(parents, goal, start)
+
+    def _reconstruct(self, parents, goal, start):
+        """Interpola as células dos corredores entre os nós do caminho"""
+        segments = []
+        node = goal
+        while parents[node] is not None:
+            previous, edge, k_from, k_to = parents[node]
+            segments.append((edge, k_from, k_to))
+            if previous == self._START:
+                break
+            node = previous
+        segments.reverse()
+
+        width = self._width
+        path = [start]
+        for edge, k_from, k_to in segments:
+            cells = self._edges[edge]
+            if k_to > k_from:
+                path.extend(cells[k_from + 1:k_to + 1])
+            else:
+                path.extend(cells[k_to:k_from][::-1])
+        return [(index % width, index // width) for index in path]
+
+
+class IncrementalAStar:
+    """
+    A* incremental por fantasma para um alvo que se move (estilo LPA*/D* Lite).
+
+    A busca parte da célula do fantasma (raiz) e mantém as listas aberta e
+    fechada entre as consultas. O labirinto é estático, então os custos g das
+    células fechadas continuam exatos: quando o jogador anda uma ou duas
+    células, a busca apenas continua a partir da fronteira existente, e se o
+    novo alvo já estiver fechado o caminho sai sem nenhuma expansão.
+
+    As chaves da lista aberta usam a correção km do D* Lite: a cada mudança
+    de alvo, km aumenta da distância entre o alvo antigo e o novo, de modo que
+    as chaves antigas continuam sendo limites inferiores e são atualizadas
+    apenas quando saem da fila.
+
+    Enquanto o fantasma segue o caminho, o trecho a partir da sua célula
+    continua mínimo; a busca só é reiniciada (nova raiz) quando o fantasma
+    sai da árvore ou do novo caminho.
+    """
+
+    def __init__(self, game_map):
+        """
+        Args:
+            game_map: Instância do mapa (usa game_map.walkable)
+        """
+        self._width = game_map.width
+        self._height = game_map.height
+        self._walkable = game_map.walkable
+        self._root = None
+        self._goal = None
+        self._g_costs = {}
+        self._parents = {}
+        self._closed = set()
+        self._open_list = []
+        self._km = 0
+        self._counter = 0
+        self._nodes_expanded = 0
+        self._total_expanded = 0
+        self._searches = 0
+        self._resets = 0
+
+    @property
+    def walkable(self):
+        """Array de caminhabilidade do layout usado pela busca"""
+        return self._walkable
+
+    @property
+    def nodes_expanded(self):
+        """Células expandidas na última consulta"""
+        return self._nodes_expanded
+
+    @property
+    def total_expanded(self):
+        """Células expandidas desde a criação"""
+        return self._total_expanded
+
+    @property
+    def searches(self):
+        return self._searches
+
+    @property
+    def resets(self):
+        """Quantas vezes a busca recomeçou do zero"""
+        return self._resets
+
+    def _distance(self, index_a, index_b):
+        width = self._width
+        return abs(index_a % width - index_b % width) + abs(index_a // width - index_b // width)
+
+    def _push(self, index):
+        g_cost = self._g_costs[index]
+        self._counter += 1
+        key = g_cost + self._distance(index, self._goal) + self._km
+        # Empate na chave: prefere a célula mais adiantada no caminho
+        heapq.heappush(self._open_list, (key, -g_cost, self._counter, index))
+
+    def _reset(self, root):
+        self._root = root
+        self._g_costs = {root: 0}
+        self._parents = {root: -1}
+        self._closed = set()
+        self._open_list = []
+        self._km = 0
+        self._resets += 1
+        self._push(root)
+
+    def _search(self):
+        """Continua a busca até fechar o alvo atual"""
+        goal = self._goal
+        closed = self._closed
+        open_list = self._open_list
+        g_costs = self._g_costs
+        parents = self._parents
+        walkable = self._walkable
+        width = self._width
+        expanded = 0
+
+        while goal not in closed and open_list:
+            key, _, _, current = heapq.heappop(open_list)
+            if current in closed:
+                continue
+            g_cost = g_costs[current]
+            if key < g_cost + self._distance(current, goal) + self._km:
+                # Chave de um alvo anterior: atualiza e devolve à fila
+                self._push(current)
+                continue
+
+            closed.add(current)
+            expanded += 1
+            g_cost += 1
+            for neighbor in _walkable_neighbors(walkable, width, current):
+                if neighbor not in closed and g_cost < g_costs.get(neighbor, g_cost + 1):
+                    g_costs[neighbor] = g_cost
+                    parents[neighbor] = current
+                    self._push(neighbor)
+
+        self._nodes_expanded += expanded
+        if goal not in closed:
+            return []
+        path = []
+        current = goal
+        while current != -1:
+            path.append(current)
+            current = parents[current]
+        path.reverse()
+        return path
+
+    def find_path(self, start_cell, goal_cell):
+        """
+        Caminho mais curto entre duas células livres, reaproveitando a busca anterior.
+
+        Args:
+            start_cell: (col, row) do fantasma
+            goal_cell: (col, row) do alvo
+
+        Returns:
+            List[tuple]: Células (col, row) do caminho, de start_cell até
+            goal_cell (vazia se não houver caminho)
+        """
+        width, height = self._width, self._height
+        self._nodes_expanded = 0
+        for col, row in (start_cell, goal_cell):
+            if not (0 <= col < width and 0 <= row < height) or not self._walkable[row * width + col]:
+                return []
+
+        self._searches += 1
+        start = start_cell[1] * width + start_cell[0]
+        goal = goal_cell[1] * width + goal_cell[0]
+        previous_goal = self._goal
+        self._goal = goal
+
+        if self._root is None or (start != self._root and start not in self._closed):
+            self._reset(start)
+        elif goal != previous_goal:
+            self._km += self._distance(previous_goal, goal)
+
+        path = self._search()
+        if path and start not in path:
+            # O fantasma saiu do caminho mínimo a partir da raiz: nova raiz
+            self._reset(start)
+            path = self._search()
+
+        self._total_expanded += self._nodes_expanded
+        if not path:
+            return []
+        return [(index % width, index // width) for index in path[path.index(start):]]
+
+
+class PathCache:
+    """
+    Cache LRU de caminhos compartilhado por todos os fantasmas de um mapa.
+
+    As consultas são quantizadas para células: o caminho entre a célula de
+    início e a célula objetivo é calculado uma vez (centro a centro) e
+    reaproveitado por qualquer fantasma que peça o mesmo par, inclusive nos
+    replanejamentos seguidos a cada 100 ms.
+
+    As falhas são resolvidas pelo JunctionGraph do mapa (backend "graph") ou
+    pelo GridAStar célula a célula (backend "grid").
+    """
+
+    BACKENDS = ("graph", "grid")
+
+    def __init__(self, game_map, capacity=512, backend="graph"):
+        """
+        Args:
+            game_map: Mapa dono do cache (fornece pathfinder e células)
+            capacity: Número máximo de caminhos guardados
+            backend: "graph" (cruzamentos) ou "grid" (célula a célula)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend de pathfinding inválido: {backend}")
+        self._map = game_map
+        self._capacity = capacity
+        self._backend = backend
+        self._paths = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._nodes_expanded = 0
+
+    def find_path(self, start, goal, heuristic_type="manhattan"):
+        """
+        Retorna o caminho de células entre as células de start e goal.
+
+        Args:
+            start: Vector2D posição inicial (em pixels)
+            goal: Vector2D posição objetivo (em pixels)
+            heuristic_type: Tipo de heurística do A*
+
+        Returns:
+            List[tuple]: Células (col, row) do caminho (vazia se não houver caminho)
+        """
+        start_cell = self._map.get_cell(start)
+        goal_cell = self._map.get_cell(goal)
+        key = (start_cell, goal_cell, heuristic_type)
+
+        path = self._paths.get(key)
+        if path is not None:
+            self._hits += 1
+            self._paths.move_to_end(key)
+            return path
+
+        self._misses += 1
+        if self._backend == "graph":
+            engine = self._map.junction_graph
+            path = engine.find_path(start_cell, goal_cell, heuristic_type)
+        else:
+            engine = self._map.pathfinder
+            path = engine.find_path(
+                self._map.get_cell_center(*start_cell),
+                self._map.get_cell_center(*goal_cell),
+                heuristic_type
+            )
+        self._nodes_expanded += engine.nodes_expanded
+        self._paths[key] = path
+        if len(self._paths) > self._capacity:
+            self._paths.popitem(last=False)
+            self._evictions += 1
+        return path
+
+    @property
+    def backend(self):
+        return self._backend
+
+    @backend.setter
+    def backend(self, value):
+        if value not in self.BACKENDS:
+            raise ValueError(f"Backend de pathfinding inválido: {value}")
+        if value != self._backend:
+            self._backend = value
+            self._paths.clear()
+
+    def clear(self):
+        """Descarta todos os caminhos (ex.: troca de mapa ou de layout)"""
+        self._paths.clear()
+
+    def reset_stats(self):
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._nodes_expanded = 0
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def get_stats(self):
+        """Retorna contadores do cache"""
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "nodes_expanded": self._nodes_expanded,
+            "size": len(self._paths),
+            "capacity": self._capacity,
+            "backend": self._backend,
+            "hit_rate": self._hits / total if total else 0.0
+        }
+
+
+class PathTable:
+    """
+    Tabela de caminhos mínimos entre todos os pares de células livres do mapa.
+
+    Para cada par (origem, destino) guarda a distância em células e a direção
+    do primeiro passo, calculadas por uma BFS a partir de cada destino. Com
+    ela, a decisão de um fantasma vira uma consulta O(1) em vez de uma busca.
+
+    Construir a tabela custa uma BFS por célula, então o resultado é salvo em
+    disco (CACHE_DIR) com nome igual ao hash do layout de paredes: se o JSON
+    do mapa mudar, o hash muda e a tabela é reconstruída automaticamente.
+    """
+
+    CACHE_DIR = os.path.join("cache", "path_tables")
+    FORMAT_VERSION = 1
+    _MAGIC = b"PMPT"
+    _HEADER = struct.Struct("<4sHHHH")
+    _DIRECTIONS = (Direction.NONE, Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+    UNREACHABLE = 0xFFFF
+
+    # Tabelas já carregadas neste processo, por hash do layout; também
+    # acessadas pela thread de carga do jogo, daí o lock
+    _loaded = {}
+    _loaded_lock = threading.Lock()
+
+    def __init__(self, width, height, walkable, next_steps=None, distances=None):
+        """
+        Args:
+            width, height: Dimensões do mapa em células
+            walkable: Array de caminhabilidade (row * width + col)
+            next_steps: Direções já calculadas (bytearray N*N, opcional)
+            distances: Distâncias já calculadas (array 'H' N*N, opcional)
+        """
+        self._width = width
+        self._height = height
+        self._cell_ids = [-1] * (width * height)
+        self._cells = []
+        for index, free in enumerate(walkable):
+            if free:
+                self._cell_ids[index] = len(self._cells)
+                self._cells.append(index)
+        self._count = len(self._cells)
+
+        if next_steps is None or distances is None:
+            next_steps, distances = self._build(walkable)
+        self._next_steps = next_steps
+        self._distances = distances
+
+        self._load_time_ms = 0.0
+        self._from_cache = False
+
+    @staticmethod
+    def layout_hash(width, height, walkable):
+        """Hash do layout de paredes (pellets não influenciam a tabela)"""
+        digest = hashlib.sha1()
+        digest.update(struct.pack("<HHH", PathTable.FORMAT_VERSION, width, height))
+        digest.update(bytes(walkable))
+        return digest.hexdigest()
+
+    @classmethod
+    def for_map(cls, game_map):
+        """
+        Retorna a tabela do mapa, usando memória, depois disco e, por último,
+        construindo do zero (e salvando no cache).
+        """
+        width, height, walkable = game_map.width, game_map.height, game_map.walkable
+        key = cls.layout_hash(width, height, walkable)
+        with cls._loaded_lock:
+            table = cls._loaded.get(key)
+        if table is not None:
+            return table
+
+        start_time = time.perf_counter()
+        cache_path = os.path.join(cls.CACHE_DIR, f"{key}.bin")
+        table = cls._read_cache(cache_path, width, height, walkable)
+        if table is not None:
+            table._from_cache = True
+        else:
+            table = cls(width, height, walkable)
+            table._write_cache(cache_path)
+        table._load_time_ms = (time.perf_counter() - start_time) * 1000
+
+        origin = "cache (quente)" if table._from_cache else "construída (fria)"
+        print(f"Tabela de caminhos: {table._count} células, {origin} em {table._load_time_ms:.1f} ms")
+        # A carga fica fora do lock; se duas threads carregarem a mesma
+        # tabela, vale a primeira registrada
+        with cls._loaded_lock:
+            return cls._loaded.setdefault(key, table)
+
+    def _build(self, walkable):
+        """Executa uma BFS a partir de cada célula livre (destino)"""
+        count = self._count
+        width = self._width
+        cell_ids = self._cell_ids
+        next_steps = bytearray(count * count)
+        distances = array("H", [self.UNREACHABLE]) * (count * count)
+
+        # Vizinhos de cada célula com o código da direção que leva do vizinho
+        # de volta à célula (o passo em direção ao destino da BFS)
+        neighbors = []
+        for index in self._cells:
+            col, row = index % width, index // width
+            entries = []
+            for code, (dc, dr) in ((2, (0, -1)), (1, (0, 1)), (4, (-1, 0)), (3, (1, 0))):
+                n_col, n_row = col + dc, row + dr
+                if 0 <= n_col < width and 0 <= n_row < self._height:
+                    neighbor_id = cell_ids[n_row * width + n_col]
+                    if neighbor_id >= 0:
+                        entries.append((neighbor_id, code))
+            neighbors.append(entries)
+
+        for target in range(count):
+            distances[target * count + target] = 0
+            frontier = [target]
+            distance = 0
+            while frontier:
+                distance += 1
+                next_frontier = []
+                for current in frontier:
+                    for neighbor, code in neighbors[current]:
+                        slot = neighbor * count + target
+                        if distances[slot] == self.UNREACHABLE:
+                            distances[slot] = distance
+                            next_steps[slot] = code
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+
+        return next_steps, distances
+
+    @classmethod
+    def _read_cache(cls, path, width, height, walkable):
+        """Lê a tabela do disco; retorna None se ausente ou inválida"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            magic, version, f_width, f_height, count = cls._HEADER.unpack_from(data)
+            if magic != cls._MAGIC or version != cls.FORMAT_VERSION or (f_width, f_height) != (width, height):
+                return None
+
+            pairs = count * count
+            offset = cls._HEADER.size
+            next_steps = bytearray(data[offset:offset + pairs])
+            distances = array("H")
+            distances.frombytes(data[offset + pairs:offset + 3 * pairs])
+            if sys.byteorder == "big":
+                distances.byteswap()
+            if len(next_steps) != pairs or len(distances) != pairs:
+                return None
+
+            table = cls(width, height, walkable, next_steps, distances)
+            if table._count != count:
+                return None
+            return table
+        except (OSError, struct.error, ValueError) as e:
+            print(f"Aviso: cache de tabela de caminhos inválido ({path}): {e}")
+            return None
+
+    def _write_cache(self, path):
+        """Salva a tabela no disco (escrita atômica)"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            distances = array("H", self._distances)
+            if sys.byteorder == "big":
+                distances.byteswap()
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(self._HEADER.pack(self._MAGIC, self.FORMAT_VERSION, self._width, self._height, self._count))
+                f.write(self._next_steps)
+                f.write(distances.tobytes())
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Aviso: não foi possível salvar tabela de caminhos em {path}: {e}")
+
+    @property
+    def cell_count(self):
+        return self._count
+
+    @property
+    def load_time_ms(self):
+        """Tempo gasto para obter a tabela (leitura do cache ou construção)"""
+        return self._load_time_ms
+
+    @property
+    def from_cache(self):
+        """True se a tabela veio do cache em disco"""
+        return self._from_cache
+
+    def _slot(self, from_cell, to_cell):
+        """Índice do par na tabela (None se alguma célula não for livre)"""
+        width = self._width
+        from_col, from_row = from_cell
+        to_col, to_row = to_cell
+        if not (0 <= from_col < width and 0 <= from_row < self._height and
+                0 <= to_col < width and 0 <= to_row < self._height):
+            return None
+        from_id = self._cell_ids[from_row * width + from_col]
+        to_id = self._cell_ids[to_row * width + to_col]
+        if from_id < 0 or to_id < 0:
+            return None
+        return from_id * self._count + to_id
+
+    def next_direction(self, from_cell, to_cell):
+        """
+        Direção do primeiro passo do caminho mínimo entre duas células.
+
+        Args:
+            from_cell, to_cell: Tuplas (col, row)
+
+        Returns:
+            Direction: Direção a seguir (Direction.NONE se já chegou ou não há caminho)
+        """
+        slot = self._slot(from_cell, to_cell)
+        if slot is None:
+            return Direction.NONE
+        return self._DIRECTIONS[self._next_steps[slot]]
+
+    def distance(self, from_cell, to_cell):
+        """
+        Distância em células entre duas células livres.
+
+        Returns:
+            int: Número de passos, ou None se não houver caminho
+        """
+        slot = self._slot(from_cell, to_cell)
+        if slot is None or self._distances[slot] == self.UNREACHABLE:
+            return None
+        return self._distances[slot]
+
+
+class FlowField:
+    """
+    Campo de fluxo (BFS) a partir de uma célula de origem, normalmente a do jogador.
+
+    Guarda, para cada célula livre, a distância até a origem e a direção do
+    próximo passo. É recalculado apenas quando a origem muda de célula e pode
+    ser lido por qualquer número de fantasmas sem custo adicional.
+    """
+
+    UNREACHABLE = 0xFFFF
+    _DIRECTIONS = (Direction.NONE, Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+
+    def __init__(self, game_map):
+        """
+        Args:
+            game_map: Instância do mapa (usa game_map.walkable)
+        """
+        self._width = game_map.width
+        self._height = game_map.height
+        self._walkable = game_map.walkable
+        self._source = None
+        self._distances = array("H", [self.UNREACHABLE]) * (self._width * self._height)
+        self._next_steps = bytearray(self._width * self._height)
+        self._rebuilds = 0
+
+    @property
+    def source(self):
+        """Célula (col, row) de origem do campo atual"""
+        return self._source
+
+    @property
+    def rebuilds(self):
+        """Quantas vezes o campo foi recalculado"""
+        return self._rebuilds
+
+    def update(self, source_cell):
+        """
+        Recalcula o campo se a célula de origem mudou.
+
+        Returns:
+            bool: True se o campo foi recalculado
+        """
+        if source_cell == self._source:
+            return False
+        self._source = source_cell
+        self._rebuild()
+        return True
+
+    def _rebuild(self):
+        width, height = self._width, self._height
+        walkable = self._walkable
+        size = width * height
+        distances = array("H", [self.UNREACHABLE]) * size
+        next_steps = bytearray(size)
+
+        col, row = self._source
+        if 0 <= col < width and 0 <= row < height and walkable[row * width + col]:
+            source = row * width + col
+            distances[source] = 0
+            frontier = [source]
+            distance = 0
+            while frontier:
+                distance += 1
+                next_frontier = []
+                for current in frontier:
+                    current_col = current % width
+                    # Vizinho e direção que leva dele de volta à célula atual
+                    for neighbor, code, inside in (
+                        (current - width, 2, current >= width),
+                        (current + width, 1, current < size - width),
+                        (current - 1, 4, current_col > 0),
+                        (current + 1, 3, current_col < width - 1)
+                    ):
+                        if inside and walkable[neighbor] and distances[neighbor] == self.UNREACHABLE:
+                            distances[neighbor] = distance
+                            next_steps[neighbor] = code
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+
+        self._distances = distances
+        self._next_steps = next_steps
+        self._rebuilds += 1
+
+    def _index(self, cell):
+        col, row = cell
+        if 0 <= col < self._width and 0 <= row < self._height:
+            return row * self._width + col
+        return None
+
+    def next_direction(self, cell):
+        """
+        Direção do próximo passo de uma célula em direção à origem.
+
+        Returns:
+            Direction: Direção a seguir (Direction.NONE na origem ou sem caminho)
+        """
+        index = self._index(cell)
+        if index is None:
+            return Direction.NONE
+        return self._DIRECTIONS[self._next_steps[index]]
+
+    def distance(self, cell):
+        """
+        Distância em células até a origem.
+
+        Returns:
+            int: Número de passos, ou None se não houver caminho
+        """
+        index = self._index(cell)
+        if index is None or self._distances[index] == self.UNREACHABLE:
+            return None
+        return self._distances[index]
+
+
+class PathfindingScheduler:
+    """
+    Escalonador do trabalho de pathfinding dos fantasmas, com orçamento por frame.
+
+    Em vez de replanejar ou recalcular campos na hora, os fantasmas e o Game
+    enviam solicitações (uma por dono: fantasma, campo de fluxo ou campos de
+    distância do mapa) executadas no fim de cada tick, da mais urgente para a
+    menos urgente, até esgotar o orçamento em ms. As que sobram ficam para o
+    próximo tick, ganhando prioridade a cada tick de espera; enquanto isso o
+    fantasma segue na direção atual ou no último campo calculado.
+
+    Com begin_frame() o orçamento vale para o quadro renderizado inteiro,
+    somando todos os ticks executados nele; sem begin_frame() cada chamada a
+    run_frame() tem o orçamento inteiro. O orçamento é verificado antes de cada
+    solicitação, então a mais urgente do quadro sempre é atendida e o excesso
+    máximo é o de uma única tarefa.
+    """
+
+    URGENCY_REFRESH = 0       # timer de replanejamento expirou
+    URGENCY_NO_PATH = 1       # caminho vazio ou concluído
+    URGENCY_TARGET_MOVED = 2  # alvo se afastou do caminho planejado
+    URGENCY_BLOCKED = 3       # fantasma parado contra uma parede
+    AGING_PER_FRAME = 0.25
+
+    def __init__(self, budget_ms=1.0, history_size=120):
+        """
+        Args:
+            budget_ms: Tempo máximo de pathfinding por frame, em milissegundos
+            history_size: Quantos frames guardar no histórico de adiamentos
+        """
+        self._budget_ms = budget_ms
+        self._pending = {}  # solicitante -> [urgência, frame da solicitação, tarefa]
+        self._frame = 0
+        self._frame_open = False  # begin_frame() chamado: orçamento por quadro renderizado
+        self._frame_spent = 0.0
+        self._frame_executed = 0
+        self._last_executed = 0
+        self._last_deferred = 0
+        self._last_elapsed_ms = 0.0
+        self._total_executed = 0
+        self._total_deferred = 0
+        self._max_deferred = 0
+        self._deferred_history = deque(maxlen=history_size)
+
+    @property
+    def budget_ms(self):
+        return self._budget_ms
+
+    @budget_ms.setter
+    def budget_ms(self, value):
+        self._budget_ms = max(0.0, value)
+
+    @property
+    def last_deferred(self):
+        """Solicitações adiadas no último frame"""
+        return self._last_deferred
+
+    @property
+    def deferred_history(self):
+        """Adiamentos por frame dos últimos frames (mais antigo primeiro)"""
+        return list(self._deferred_history)
+
+    def submit(self, requester, urgency, task):
+        """
+        Registra (ou atualiza) a solicitação de um fantasma ou de um campo.
+
+        Args:
+            requester: Dono da solicitação (no máximo uma pendente por dono;
+                a tarefa mais recente substitui a anterior)
+            urgency: Uma das constantes URGENCY_*
+            task: Função sem argumentos que faz o replanejamento ou o cálculo
+        """
+        entry = self._pending.get(requester)
+        if entry is None:
+            self._pending[requester] = [urgency, self._frame, task]
+        else:
+            entry[0] = max(entry[0], urgency)
+            entry[2] = task
+
+    def is_pending(self, requester):
+        return requester in self._pending
+
+    def begin_frame(self):
+        """
+        Abre um quadro renderizado: as chamadas a run_frame() até o próximo
+        begin_frame() dividem um único orçamento.
+        """
+        self._frame_open = True
+        self._frame_spent = 0.0
+        self._frame_executed = 0
+
+    def run_frame(self):
+        """
+        Executa as solicitações pendentes por prioridade dentro do orçamento.
+
+        Returns:
+            int: Número de solicitações adiadas para o próximo frame
+        """
+        if not self._frame_open:
+            self._frame_spent = 0.0
+            self._frame_executed = 0
+        frame = self._frame
+        queue = sorted(
+            self._pending.items(),
+            key=lambda item: item[1][0] + (frame - item[1][1]) * self.AGING_PER_FRAME,
+            reverse=True
+        )
+
+        budget = self._budget_ms / 1000.0 - self._frame_spent
+        start_time = time.perf_counter()
+        executed = 0
+        for requester, (_, _, task) in queue:
+            if time.perf_counter() - start_time >= budget and self._frame_executed:
+                break
+            del self._pending[requester]
+            task()
+            executed += 1
+            self._frame_executed += 1
+
+        deferred = len(self._pending)
+        elapsed = time.perf_counter() - start_time
+        self._frame_spent += elapsed
+        self._last_elapsed_ms = elapsed * 1000
+        self._last_executed = executed
+        self._last_deferred = deferred
+        self._total_executed += executed
+        self._total_deferred += deferred
+        self._max_deferred = max(self._max_deferred, deferred)
+        self._deferred_history.append(deferred)
+        self._frame += 1
+        return deferred
+
+    def clear(self):
+        """Descarta solicitações pendentes (ex.: troca de mapa ou reinício de posições)"""
+        self._pending.clear()
+
+    def reset_stats(self):
+        self._total_executed = 0
+        self._total_deferred = 0
+        self._max_deferred = 0
+        self._deferred_history.clear()
+
+    def get_stats(self):
+        """Retorna contadores do escalonador"""
+        return {
+            "budget_ms": self._budget_ms,
+            "frames": self._frame,
+            "pending": len(self._pending),
+            "last_executed": self._last_executed,
+            "last_deferred": self._last_deferred,
+            "last_elapsed_ms": self._last_elapsed_ms,
+            "total_executed": self._total_executed,
+            "total_deferred": self._total_deferred,
+            "max_deferred": self._max_deferred
+        }
+
+
+class DistanceFields:
+    """
+    Campos de distância (BFS) sobre a grade inteira, calculados com NumPy.
+
+    A BFS é uma frente de onda sobre a máscara booleana de células livres:
+    cada passo expande a fronteira nas quatro direções com deslocamentos de
+    array, sem fila em Python. Aceita uma ou várias células de origem (ex.:
+    todos os spawns da casa dos fantasmas de uma vez).
+
+    Cada campo fica guardado num slot nomeado e é reaproveitado enquanto as
+    células de origem do slot não mudarem.
+    """
+
+    UNREACHABLE = -1
+    FLEE_FACTOR = -1.2
+    # Passadas de relaxamento do campo de fuga: nos mapas do jogo ele
+    # estabiliza em até ~50; no limite o campo fica como está (ainda aponta
+    # para longe da origem, só menos refinado)
+    FLEE_MAX_ITERATIONS = 64
+    FLEE_ITERATIONS_PER_STEP = 16
+
+    def __init__(self, game_map):
+        """
+        Args:
+            game_map: Instância do mapa (usa game_map.walkable)
+        """
+        self._width = game_map.width
+        self._height = game_map.height
+        walkable = np.frombuffer(bytes(game_map.walkable), dtype=np.uint8)
+        walkable = walkable.reshape(self._height, self._width).astype(bool)
+
+        # Máscara com borda de parede: os deslocamentos não saem do array
+        self._mask = np.zeros((self._height + 2, self._width + 2), dtype=bool)
+        self._mask[1:-1, 1:-1] = walkable
+        self._fields = {}  # slot -> (origens, campo)
+        self._flee_job = None  # [origens, campo com borda, passadas feitas] em andamento
+        self._computations = 0
+
+    @property
+    def computations(self):
+        """Quantos campos foram calculados (não reaproveitados)"""
+        return self._computations
+
+    def _normalize_sources(self, sources):
+        if isinstance(sources, tuple) and len(sources) == 2 and isinstance(sources[0], int):
+            sources = [sources]
+        return tuple(sorted(set(sources)))
+
+    def get(self, sources, slot="default"):
+        """
+        Campo de distâncias até a origem mais próxima.
+
+        Args:
+            sources: Célula (col, row) ou lista de células de origem
+            slot: Nome do slot de cache (um campo por slot)
+
+        Returns:
+            numpy.ndarray: Distâncias em células, formato (height, width),
+            UNREACHABLE em paredes e células sem caminho
+        """
+        sources = self._normalize_sources(sources)
+        cached = self._fields.get(slot)
+        if cached is not None and cached[0] == sources:
+            return cached[1]
+        field = self._wavefront(sources)
+        self._fields[slot] = (sources, field)
+        return field
+
+    def lookup(self, field, cells):
+        """
+        Distâncias de várias células num campo, numa única indexação.
+
+        Returns:
+            list: Distância de cada célula (UNREACHABLE fora do mapa ou sem caminho)
+        """
+        if not cells:
+            return []
+        cols = np.array([col for col, _ in cells])
+        rows = np.array([row for _, row in cells])
+        inside = (cols >= 0) & (cols < self._width) & (rows >= 0) & (rows < self._height)
+        distances = np.full(len(cells), self.UNREACHABLE, dtype=np.int32)
+        distances[inside] = field[rows[inside], cols[inside]]
+        return distances.tolist()
+
+    def get_flee_field(self, source_cell):
+        """
+        Campo de fuga a partir de uma célula (normalmente a do jogador).
+
+        Parte das distâncias multiplicadas por FLEE_FACTOR (negativo) e
+        relaxa o campo até estabilizar (no máximo FLEE_MAX_ITERATIONS
+        passadas): descer por ele afasta da origem, mas prefere rotas que
+        continuam abertas em vez de becos sem saída próximos. Calcula tudo de
+        uma vez; para dividir o cálculo entre frames use step_flee_field.
+
+        Returns:
+            numpy.ndarray: Valores de fuga (menor = mais seguro), formato
+            (height, width), inf em paredes e células sem caminho
+        """
+        while not self.step_flee_field(source_cell, self.FLEE_MAX_ITERATIONS):
+            pass
+        return self._fields["_flee"][1]
+
+    def step_flee_field(self, source_cell, max_iterations=None):
+        """
+        Avança o cálculo do campo de fuga de uma célula.
+
+        O primeiro passo calcula as distâncias; os seguintes fazem até
+        max_iterations passadas de relaxamento. Um pedido para outra célula
+        descarta o cálculo em andamento.
+
+        Args:
+            source_cell: Célula (col, row) de origem
+            max_iterations: Passadas por passo (padrão FLEE_ITERATIONS_PER_STEP)
+
+        Returns:
+            bool: True se o campo da célula está pronto
+        """
+        sources = self._normalize_sources(source_cell)
+        cached = self._fields.get("_flee")
+        if cached is not None and cached[0] == sources:
+            return True
+
+        job = self._flee_job
+        if job is None or job[0] != sources:
+            distances = self.get(sources, slot="_flee_distances")
+            field = np.full(self._mask.shape, np.inf)
+            reachable = distances != self.UNREACHABLE
+            field[1:-1, 1:-1][reachable] = distances[reachable] * self.FLEE_FACTOR
+            self._flee_job = [sources, field, 0]
+            return False
+
+        if max_iterations is None:
+            max_iterations = self.FLEE_ITERATIONS_PER_STEP
+        _, field, iterations = job
+        walkable = self._mask[1:-1, 1:-1]
+        stable = False
+        for _ in range(min(max_iterations, self.FLEE_MAX_ITERATIONS - iterations)):
+            neighbors = np.minimum(
+                np.minimum(field[:-2, 1:-1], field[2:, 1:-1]),
+                np.minimum(field[1:-1, :-2], field[1:-1, 2:])
+            ) + 1
+            relaxed = np.where(walkable, np.minimum(field[1:-1, 1:-1], neighbors), np.inf)
+            iterations += 1
+            if np.array_equal(relaxed, field[1:-1, 1:-1]):
+                stable = True
+                break
+            field[1:-1, 1:-1] = relaxed
+        job[2] = iterations
+
+        if not stable and iterations < self.FLEE_MAX_ITERATIONS:
+            return False
+        self._fields["_flee"] = (sources, field[1:-1, 1:-1].copy())
+        self._flee_job = None
+        return True
+
+    def latest_flee_field(self, source_cell):
+        """
+        Último campo de fuga calculado, sem calcular nada.
+
+        Returns:
+            tuple: (campo ou None se nenhum foi calculado, se o campo é o da
+            célula pedida)
+        """
+        cached = self._fields.get("_flee")
+        if cached is None:
+            return None, False
+        return cached[1], cached[0] == self._normalize_sources(source_cell)
+
+    def _wavefront(self, sources):
+        mask = self._mask
+        distances = np.full((self._height, self._width), self.UNREACHABLE, dtype=np.int32)
+        frontier = np.zeros(mask.shape, dtype=bool)
+        for col, row in sources:
+            if 0 <= col < self._width and 0 <= row < self._height:
+                frontier[row + 1, col + 1] = mask[row + 1, col + 1]
+        visited = frontier.copy()
+
+        distance = 0
+        while frontier.any():
+            distances[frontier[1:-1, 1:-1]] = distance
+            grown = np.zeros(mask.shape, dtype=bool)
+            grown[1:-1, 1:-1] = (frontier[:-2, 1:-1] | frontier[2:, 1:-1] |
+                                 frontier[1:-1, :-2] | frontier[1:-1, 2:])
+            grown &= mask
+            grown &= ~visited
+            visited |= grown
+            frontier = grown
+            distance += 1
+
+        self._computations += 1
+        return distances
+
+    def clear(self):
+        self._fields.clear()
+        self._flee_job = None
@@ -0,0 +1,145 @@
+import pygame
+from .sprite_manager import sprite_manager, can_convert_surfaces
+
+
+class PelletLayer:
+    """
+    Camada com os pellets do nível já desenhados.
+
+    Os pellets normais são compostos uma vez numa superfície transparente do
+    tamanho do labirinto (por escala) e, ao serem comidos, só a área do
+    sprite é apagada. Os power-ups, que piscam, ficam fora da camada e são
+    desenhados a cada frame.
+    """
+
+    def __init__(self, game_map, pellets):
+        """
+        Args:
+            game_map: Mapa do nível (define o tamanho da camada)
+            pellets: Dicionário célula -> Pellet do nível
+        """
+        self._map = game_map
+        self._normal = [pellet for pellet in pellets.values() if pellet.type != "power_up"]
+        self._power_ups = [pellet for pellet in pellets.values() if pellet.type == "power_up"]
+        self._surface = None
+        self._scale_factor = None
+        self._converted = False
+        self._pending = []
+        self._removed_power_ups = []
+        self._drawn_frames = {}
+
+    def remove(self, pellet):
+        """Retira um pellet comido; o apagamento na camada acontece no próximo desenho"""
+        if pellet.type == "power_up":
+            self._power_ups.remove(pellet)
+            self._removed_power_ups.append(pellet)
+            self._drawn_frames.pop(pellet, None)
+        else:
+            self._normal.remove(pellet)
+            self._pending.append(pellet)
+
+    def get_surface(self, scale_factor=1.0):
+        """
+        Retorna a camada de pellets normais na escala pedida, já sem os
+        pellets comidos.
+        """
+        self.flush(scale_factor)
+        return self._surface
+
+    def flush(self, scale_factor=1.0):
+        """
+        Aplica na camada os pellets comidos desde a última chamada.
+
+        Returns:
+            List[pygame.Rect]: Áreas apagadas, em coordenadas da camada
+                (vazia se a camada foi recriada do zero)
+        """
+        if self._surface is None or self._scale_factor != scale_factor:
+            self._build(scale_factor, sprite_manager.get_pellet_sprite("normal"))
+            return []
+        if not self._converted and can_convert_surfaces():
+            self._surface = self._surface.convert_alpha()
+            self._converted = True
+
+        erased = []
+        sprite_size = sprite_manager.sprite_size
+        for pellet in self._pending:
+            x = int((pellet.position.x - sprite_manager.base_sprite_size // 2) * scale_factor)
+            y = int((pellet.position.y - sprite_manager.base_sprite_size // 2) * scale_factor)
+            rect = pygame.Rect(x, y, sprite_size, sprite_size)
+            self._surface.fill((0, 0, 0, 0), rect)
+            erased.append(rect)
+        self._pending.clear()
+        return erased
+
+    def prepare(self, scale_factor):
+        """
+        Monta a camada antes do primeiro desenho (ex.: pela thread de carga).
+        
+        Só monta se o atlas da escala já estiver pronto, para não montar
+        atlas fora da thread principal; senão fica para o primeiro desenho.
+        
+        Returns:
+            bool: True se a camada foi montada
+        """
+        sprite = sprite_manager.get_cached_pellet_sprite(scale_factor)
+        if sprite is None:
+            return False
+        self._build(scale_factor, sprite)
+        return True
+
+    def _build(self, scale_factor, sprite):
+        """Desenha todos os pellets normais restantes numa camada nova"""
+        size = self._map.get_static_layer(scale_factor).get_size()
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        self._converted = can_convert_surfaces()
+        if self._converted:
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        half_size = sprite_manager.base_sprite_size // 2
+        for pellet in self._normal:
+            x = int((pellet.position.x - half_size) * scale_factor)
+            y = int((pellet.position.y - half_size) * scale_factor)
+            surface.blit(sprite, (x, y))
+        self._surface = surface
+        self._scale_factor = scale_factor
+        self._pending.clear()
+
+    def draw(self, screen, scale_factor=1.0, offset_x=0, offset_y=0):
+        """Desenha os pellets normais (um blit) e os power-ups"""
+        screen.blit(self.get_surface(scale_factor), (offset_x, offset_y))
+        self.draw_power_ups(screen, scale_factor, offset_x, offset_y)
+
+    def draw_power_ups(self, screen, scale_factor=1.0, offset_x=0, offset_y=0, power_ups=None):
+        """
+        Desenha os power-ups (animados, fora da camada).
+        
+        Args:
+            power_ups: Subconjunto a desenhar (padrão: todos os restantes)
+        """
+        if power_ups is None:
+            power_ups = self._power_ups
+        for pellet in power_ups:
+            pellet.draw(screen, scale_factor, offset_x, offset_y)
+            self._drawn_frames[pellet] = pellet.animation_frame
+
+    def pop_changed_power_up_rects(self, scale_factor=1.0, offset_x=0, offset_y=0):
+        """
+        Áreas de power-ups comidos ou que mudaram de quadro de animação desde
+        o último desenho.
+        """
+        rects = [pellet.get_draw_rect(scale_factor, offset_x, offset_y) for pellet in self._removed_power_ups]
+        self._removed_power_ups.clear()
+        for pellet in self._power_ups:
+            if self._drawn_frames.get(pellet) != pellet.animation_frame:
+                rects.append(pellet.get_draw_rect(scale_factor, offset_x, offset_y))
+        return rects
+
+    @property
+    def power_ups(self):
+        """Power-ups restantes"""
+        return self._power_ups
+
+    @property
+    def pellet_count(self):
+        return len(self._normal) + len(self._power_ups)
@@ -1,37 +1,157 @@
 import pygame
 import os
+import threading
+from collections import OrderedDict
 from .utils import Direction
 
+# IDs dos sprites no atlas (índices da lista de superfícies)
+PACMAN_CLOSED = 0
+PACMAN_RIGHT = 1
+PACMAN_RIGHT_OPEN = 2
+PACMAN_LEFT = 3
+PACMAN_LEFT_OPEN = 4
+PACMAN_UP = 5
+PACMAN_UP_OPEN = 6
+PACMAN_DOWN = 7
+PACMAN_DOWN_CLOSED = 8
+# Fantasmas: GHOST_BASE + (cor * 4 + direção) * 2 + quadro
+GHOST_BASE = 9
+GHOST_VULNERABLE_BLUE_1 = GHOST_BASE + 32
+GHOST_VULNERABLE_BLUE_2 = GHOST_VULNERABLE_BLUE_1 + 1
+GHOST_VULNERABLE_WHITE_1 = GHOST_VULNERABLE_BLUE_1 + 2
+GHOST_VULNERABLE_WHITE_2 = GHOST_VULNERABLE_BLUE_1 + 3
+PELLET_NORMAL = GHOST_VULNERABLE_BLUE_1 + 4
+PELLET_POWER_UP = PELLET_NORMAL + 1
+PELLET_BLANK = PELLET_NORMAL + 2
+SPRITE_COUNT = PELLET_NORMAL + 3
+# Efeitos desenhados na escala do atlas (não são sprites escalados)
+PACMAN_GLOW_BRIGHT = SPRITE_COUNT
+PACMAN_GLOW_DIM = SPRITE_COUNT + 1
+# Overlay do spawn: GHOST_SPAWN_OVERLAY_BASE + (alpha - SPAWN_OVERLAY_MIN_ALPHA)
+SPAWN_OVERLAY_MIN_ALPHA = 80
+SPAWN_OVERLAY_MAX_ALPHA = 120
+GHOST_SPAWN_OVERLAY_BASE = SPRITE_COUNT + 2
+EFFECT_COUNT = 2 + SPAWN_OVERLAY_MAX_ALPHA - SPAWN_OVERLAY_MIN_ALPHA + 1
+
+# Quadros de animação por segundo: os divisores dos get_*_sprite contam nesses
+# quadros, derivados do tempo decorrido (não dos ticks nem dos quadros renderizados)
+ANIMATION_FPS = 60
+
+
+def can_convert_surfaces():
+    """
+    Se convert()/convert_alpha() podem ser usados agora: exige uma tela
+    aberta e a thread principal (as threads de carga deixam as superfícies
+    no formato original e quem as usa converte depois).
+    """
+    return (pygame.display.get_surface() is not None
+            and threading.current_thread() is threading.main_thread())
+
+_GHOST_COLORS = ('red', 'pink', 'blue', 'yellow')
+_GHOST_DIRECTIONS = ('up', 'down', 'left', 'right')
+
 class SpriteManager:
     """Gerenciador de sprites para o jogo Pac-Man"""
     
+    # Escalas com atlas guardado (redimensionar a janela e voltar não reescala)
+    ATLAS_CACHE_SIZE = 4
+    
     def __init__(self):
         self._sprites = {}
         self._base_sprite_size = 16  
         self._current_sprite_size = 16 
         self._scale_factor = 1.0  
-        self._scaled_sprites = {}  
+        self._atlas = None
+        self._atlases = OrderedDict()
         self._load_all_sprites()
+        self._base_atlas = self._build_base_atlas()
+        
+        # Tabelas de consulta montadas uma vez (sem alocação por chamada)
+        self._pacman_ids = {
+            Direction.RIGHT: (PACMAN_RIGHT, PACMAN_RIGHT_OPEN),
+            Direction.LEFT: (PACMAN_LEFT, PACMAN_LEFT_OPEN),
+            Direction.UP: (PACMAN_UP, PACMAN_UP_OPEN),
+            Direction.DOWN: (PACMAN_DOWN_CLOSED, PACMAN_DOWN),
+            Direction.NONE: (PACMAN_CLOSED, PACMAN_CLOSED)
+        }
+        # Cyan usa sprites azuis e orange usa sprites amarelos
+        self._ghost_color_index = {"red": 0, "pink": 1, "cyan": 2, "orange": 3}
+        self._ghost_direction_index = {Direction.UP: 0, Direction.DOWN: 1, Direction.LEFT: 2, Direction.RIGHT: 3}
+        self._vulnerable_ids = (GHOST_VULNERABLE_BLUE_1, GHOST_VULNERABLE_BLUE_2,
+                                GHOST_VULNERABLE_WHITE_1, GHOST_VULNERABLE_WHITE_2)
     
     def set_scale_factor(self, scale_factor):
         """Define o fator de escala para os sprites"""
         if scale_factor != self._scale_factor:
             self._scale_factor = scale_factor
             self._current_sprite_size = int(self._base_sprite_size * scale_factor)
-            self._scaled_sprites.clear()  
+            self._atlas = self._atlases.get(scale_factor)
+            if self._atlas is not None:
+                self._atlases.move_to_end(scale_factor)
             print(f"Escala de sprites alterada: {scale_factor:.2f}x (tamanho: {self._current_sprite_size}px)")
     
-    def _get_scaled_sprite(self, sprite_key, sprite):
-        """Retorna uma versão escalada do sprite, usando cache quando possível"""
-        if self._scale_factor == 1.0:
-            return sprite
-            
-        cache_key = f"{sprite_key}_{self._scale_factor}"
-        if cache_key not in self._scaled_sprites:
-            new_size = (self._current_sprite_size, self._current_sprite_size)
-            self._scaled_sprites[cache_key] = pygame.transform.scale(sprite, new_size)
-        
-        return self._scaled_sprites[cache_key]
+    def _build_base_atlas(self):
+        """Lista das superfícies originais (16x16) na ordem dos IDs"""
+        pacman = self._sprites['pacman']
+        atlas = [pacman[key] for key in ('closed', 'right', 'right_open', 'left', 'left_open',
+                                         'up', 'up_open', 'down', 'down_closed')]
+        for color in _GHOST_COLORS:
+            ghost_sprites = self._sprites[f'ghost_{color}']
+            for direction in _GHOST_DIRECTIONS:
+                for frame in ('1', '2'):
+                    atlas.append(ghost_sprites[f'{direction}_{frame}'])
+        vulnerable = self._sprites['ghost_vulnerable']
+        atlas.extend(vulnerable[key] for key in ('blue_1', 'blue_2', 'white_1', 'white_2'))
+        atlas.append(self._sprites['pellet']['normal'])
+        atlas.append(self._sprites['pellet']['power_up'])
+        atlas.append(pygame.Surface((self._base_sprite_size, self._base_sprite_size), pygame.SRCALPHA))
+        return atlas
+    
+    def _build_atlas(self):
+        """
+        Monta o atlas da escala atual: sprites escalados e convertidos para o
+        formato da tela (quando já existe uma), prontos para blit, seguidos
+        dos efeitos. Os atlas das últimas ATLAS_CACHE_SIZE escalas ficam
+        guardados.
+        """
+        size = (self._current_sprite_size, self._current_sprite_size)
+        convert = can_convert_surfaces()
+        atlas = []
+        for sprite in self._base_atlas:
+            if self._scale_factor != 1.0:
+                sprite = pygame.transform.scale(sprite, size)
+            atlas.append(sprite.convert_alpha() if convert else sprite)
+        atlas.extend(self._build_effects())
+        self._atlas = atlas
+        self._atlases[self._scale_factor] = atlas
+        if len(self._atlases) > self.ATLAS_CACHE_SIZE:
+            self._atlases.popitem(last=False)
+        return atlas
+    
+    def _build_effects(self):
+        """
+        Superfícies dos efeitos na escala atual, na ordem dos IDs: brilho do
+        Pac-Man com power-up (duas fases) e overlay do fantasma no spawn
+        (um por nível de alpha).
+        """
+        sprite_size = self._current_sprite_size
+        glow_size = sprite_size + int(4 * self._scale_factor)
+        glow_radius = sprite_size // 2 + int(2 * self._scale_factor)
+        effects = []
+        for glow_color in ((255, 255, 0, 150), (255, 255, 100, 100)):
+            glow = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+            pygame.draw.circle(glow, glow_color, (glow_size // 2, glow_size // 2), glow_radius)
+            effects.append(glow)
+        for alpha in range(SPAWN_OVERLAY_MIN_ALPHA, SPAWN_OVERLAY_MAX_ALPHA + 1):
+            overlay = pygame.Surface((sprite_size, sprite_size), pygame.SRCALPHA)
+            overlay.fill((255, 255, 255, alpha))
+            effects.append(overlay)
+        return effects
+    
+    def get_sprite(self, sprite_id):
+        """Retorna o sprite do atlas da escala atual pelo ID"""
+        atlas = self._atlas or self._build_atlas()
+        return atlas[sprite_id]
     
     def _load_sprite(self, path):
         """Carrega um sprite individual"""
@@ -129,82 +249,53 @@ class SpriteManager:
         """Retorna sprite do Pac-Man baseado na direção e frame de animação"""
         # Animação simples: alterna entre aberto e fechado
         is_open = (animation_frame // 10) % 2 == 0
-        
-        sprite_key = None
-        if direction == Direction.RIGHT:
-            sprite_key = 'right_open' if is_open else 'right'
-            sprite = self._sprites['pacman'][sprite_key]
-        elif direction == Direction.LEFT:
-            sprite_key = 'left_open' if is_open else 'left'
-            sprite = self._sprites['pacman'][sprite_key]
-        elif direction == Direction.UP:
-            sprite_key = 'up_open' if is_open else 'up'
-            sprite = self._sprites['pacman'][sprite_key]
-        elif direction == Direction.DOWN:
-            sprite_key = 'down_closed' if not is_open else 'down'
-            sprite = self._sprites['pacman'][sprite_key]
-        else:
-            sprite_key = 'closed'
-            sprite = self._sprites['pacman'][sprite_key]
-            
-        return self._get_scaled_sprite(f"pacman_{sprite_key}", sprite)
+        atlas = self._atlas or self._build_atlas()
+        return atlas[self._pacman_ids[direction][is_open]]
     
     def get_ghost_sprite(self, ghost_type, direction, animation_frame, state="normal"):
         """Retorna sprite do fantasma baseado no tipo, direção, frame e estado"""
+        atlas = self._atlas or self._build_atlas()
         if state == "vulnerable":
             # Animação de vulnerabilidade alternando entre azul e branco
             timer = animation_frame // 15
-            if timer % 4 < 2:
-                sprite_key = 'blue_1' if timer % 2 == 0 else 'blue_2'
-                sprite = self._sprites['ghost_vulnerable'][sprite_key]
-            else:
-                sprite_key = 'white_1' if timer % 2 == 0 else 'white_2'
-                sprite = self._sprites['ghost_vulnerable'][sprite_key]
-            return self._get_scaled_sprite(f"ghost_vulnerable_{sprite_key}", sprite)
-        
-        # Mapear types para cores corretas
-        color_map = {
-            "red": "red",
-            "pink": "pink", 
-            "cyan": "blue",  # Cyan usa sprites azuis
-            "orange": "yellow"  # Orange usa sprites amarelos
-        }
-        
-        color = color_map.get(ghost_type, "red")
-        ghost_sprites = self._sprites.get(f'ghost_{color}', self._sprites['ghost_red'])
-        
-        # Escolhe direção
-        direction_map = {
-            Direction.UP: 'up',
-            Direction.DOWN: 'down',
-            Direction.LEFT: 'left',
-            Direction.RIGHT: 'right'
-        }
-        
-        dir_name = direction_map.get(direction, 'up')
+            return atlas[self._vulnerable_ids[(timer % 4 >= 2) * 2 + timer % 2]]
         
+        color = self._ghost_color_index.get(ghost_type, 0)
+        direction_index = self._ghost_direction_index.get(direction, 0)
         # Animação alternando entre frame 1 e 2
-        frame = '1' if (animation_frame // 20) % 2 == 0 else '2'
-        
-        sprite_key = f'{dir_name}_{frame}'
-        sprite = ghost_sprites.get(sprite_key, ghost_sprites.get('up_1', self._sprites['ghost_red']['up_1']))
-        
-        return self._get_scaled_sprite(f"ghost_{color}_{sprite_key}", sprite)
+        frame = (animation_frame // 20) % 2
+        return atlas[GHOST_BASE + (color * 4 + direction_index) * 2 + frame]
     
     def get_pellet_sprite(self, pellet_type, animation_frame=0):
         """Retorna sprite do pellet"""
+        atlas = self._atlas or self._build_atlas()
         if pellet_type == "power_up":
-            # Power-up pisca
-            if (animation_frame // 15) % 2 == 0:
-                sprite = self._sprites['pellet']['power_up']
-                return self._get_scaled_sprite("pellet_power_up", sprite)
-            else:
-                # Retorna sprite transparente para efeito de piscar
-                transparent = pygame.Surface((self._current_sprite_size, self._current_sprite_size), pygame.SRCALPHA)
-                return transparent
-        else:
-            sprite = self._sprites['pellet']['normal']
-            return self._get_scaled_sprite("pellet_normal", sprite)
+            # Power-up pisca (sprite transparente na fase apagada)
+            return atlas[PELLET_POWER_UP if (animation_frame // 15) % 2 == 0 else PELLET_BLANK]
+        return atlas[PELLET_NORMAL]
+    
+    def get_cached_pellet_sprite(self, scale_factor):
+        """
+        Sprite do pellet normal na escala pedida, só se o atlas dessa escala
+        já estiver no cache (não monta atlas; pode ser chamado pela thread
+        de carga).
+        
+        Returns:
+            pygame.Surface ou None
+        """
+        atlas = self._atlases.get(scale_factor)
+        return atlas[PELLET_NORMAL] if atlas is not None else None
+    
+    def get_pacman_glow(self, animation_frame=0):
+        """Retorna o brilho do Pac-Man com power-up (alterna a cada 5 quadros de animação)"""
+        atlas = self._atlas or self._build_atlas()
+        return atlas[PACMAN_GLOW_DIM if (animation_frame // 5) % 2 else PACMAN_GLOW_BRIGHT]
+    
+    def get_spawn_overlay(self, alpha):
+        """Retorna o overlay branco do fantasma no spawn com o alpha pedido (80 a 120)"""
+        atlas = self._atlas or self._build_atlas()
+        alpha = min(max(int(alpha), SPAWN_OVERLAY_MIN_ALPHA), SPAWN_OVERLAY_MAX_ALPHA)
+        return atlas[GHOST_SPAWN_OVERLAY_BASE + alpha - SPAWN_OVERLAY_MIN_ALPHA]
     
     @property
     def sprite_size(self):
@@ -0,0 +1,110 @@
+"""
+Contador de superfícies criadas por quadro (depuração).
+
+Enquanto instalado, substitui pygame.Surface por uma subclasse que conta as
+criações e envolve as funções de pygame.transform que retornam superfícies
+novas (chamadas com dest_surface não contam). Textos renderizados por fontes
+não passam por aqui (veja as estatísticas do TextCache).
+"""
+import pygame
+
+_TRANSFORM_FUNCTIONS = ("scale", "smoothscale", "rotate", "rotozoom", "flip", "scale2x")
+# Posição do argumento dest_surface: com destino a função não cria superfície
+_DEST_ARGUMENT = {"scale": 2, "smoothscale": 2, "scale2x": 1}
+
+
+class SurfaceAllocationCounter:
+    """Conta superfícies criadas a cada quadro e avisa quando um quadro verificado aloca"""
+
+    def __init__(self):
+        self._installed = False
+        self._original_surface = None
+        self._original_transforms = {}
+        self._count = 0
+        self._frame_start = 0
+        self._last_frame = 0
+        self._checked_frames = 0
+        self._allocating_frames = 0
+        self._max_per_frame = 0
+
+    def install(self):
+        """Passa a contar as criações de superfícies"""
+        if self._installed:
+            return
+        counter = self
+        original_surface = pygame.Surface
+
+        class CountedSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                counter._count += 1
+                super().__init__(*args, **kwargs)
+
+        self._original_surface = original_surface
+        pygame.Surface = CountedSurface
+        for name in _TRANSFORM_FUNCTIONS:
+            function = getattr(pygame.transform, name, None)
+            if function is None:
+                continue
+            self._original_transforms[name] = function
+            setattr(pygame.transform, name, self._wrap(function, _DEST_ARGUMENT.get(name)))
+        self._installed = True
+
+    def uninstall(self):
+        """Restaura pygame.Surface e pygame.transform originais"""
+        if not self._installed:
+            return
+        pygame.Surface = self._original_surface
+        for name, function in self._original_transforms.items():
+            setattr(pygame.transform, name, function)
+        self._original_transforms.clear()
+        self._installed = False
+
+    def _wrap(self, function, dest_argument=None):
+        """Envolve uma função de pygame.transform para contar a superfície retornada"""
+        def counted(*args, **kwargs):
+            has_dest = dest_argument is not None and (
+                len(args) > dest_argument or kwargs.get("dest_surface") is not None)
+            if not has_dest:
+                self._count += 1
+            return function(*args, **kwargs)
+        return counted
+
+    def begin_frame(self):
+        """Marca o início de um quadro"""
+        self._frame_start = self._count
+
+    def end_frame(self, check=False):
+        """
+        Fecha o quadro atual.
+
+        Args:
+            check: Se o quadro deveria ser livre de alocações (ex.: PLAYING);
+                o primeiro quadro verificado que alocar gera um aviso
+
+        Returns:
+            int: Superfícies criadas no quadro
+        """
+        self._last_frame = self._count - self._frame_start
+        if check:
+            self._checked_frames += 1
+            if self._last_frame > 0:
+                if self._allocating_frames == 0:
+                    print(f"Aviso: {self._last_frame} superfície(s) criada(s) num quadro que deveria ser livre de alocações")
+                self._allocating_frames += 1
+                self._max_per_frame = max(self._max_per_frame, self._last_frame)
+        return self._last_frame
+
+    @property
+    def last_frame(self):
+        """Superfícies criadas no último quadro fechado"""
+        return self._last_frame
+
+    def get_stats(self):
+        """Retorna contadores acumulados"""
+        return {
+            "total": self._count,
+            "last_frame": self._last_frame,
+            "checked_frames": self._checked_frames,
+            "allocating_frames": self._allocating_frames,
+            "max_per_frame": self._max_per_frame
+        }
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Cache LRU de superfícies de texto renderizadas.
+
+    A chave é (fonte, texto, cor): cada escala tem seus próprios objetos de
+    fonte, então a mesma chave nunca mistura tamanhos, e um texto só é
+    renderizado de novo quando o valor exibido muda. Trocar de escala não
+    limpa o cache: os textos das outras escalas (e, pelas chaves, as suas
+    fontes) ficam vivos até saírem pelo LRU ou até discard_fonts. As
+    superfícies retornadas são compartilhadas e não devem ser alteradas.
+    """
+
+    def __init__(self, capacity=256):
+        """
+        Args:
+            capacity: Número máximo de superfícies guardadas
+        """
+        self._capacity = capacity
+        self._surfaces = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, font, text, color):
+        """
+        Equivalente a font.render(text, True, color), com cache.
+
+        Returns:
+            pygame.Surface: Texto renderizado
+        """
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self._misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def discard_fonts(self, fonts):
+        """
+        Descarta os textos renderizados com as fontes dadas (ex.: fontes de
+        uma escala que saiu de uso), liberando as superfícies e as fontes.
+
+        Returns:
+            int: Número de superfícies descartadas
+        """
+        fonts = set(fonts)
+        keys = [key for key in self._surfaces if key[0] in fonts]
+        for key in keys:
+            del self._surfaces[key]
+        return len(keys)
+
+    def clear(self):
+        """Descarta todas as superfícies guardadas"""
+        self._surfaces.clear()
+
+    def get_stats(self):
+        """Retorna contadores do cache"""
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._surfaces),
+            "capacity": self._capacity,
+            "hit_rate": self._hits / total if total else 0.0
+        }